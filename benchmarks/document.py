@@ -0,0 +1,132 @@
+"""Compare joining the project keys onto the documents against the baseline's merge.
+
+The baseline merged every project column onto the documents and then
+converted every column of the merged frame to nullable types, just so a
+missing ProjectsID didn't become a float. Only the join (and typing) is
+timed, as the mapping of the documents that follows is the same either way.
+
+Run from the repository root with:
+
+    python -m benchmarks.document --documents 100000
+"""
+
+import os
+import tempfile
+
+import click
+import pandas as pd
+
+from benchmarks.generate import generate_dataset
+from benchmarks.stages import measure
+from gcf_data_mapper.enums.document import RequiredFamilyDocumentColumns
+from gcf_data_mapper.parsers.document import (
+    DOCUMENT_CHUNK_SIZE,
+    TYPED_DOCUMENT_COLUMNS,
+    build_project_index,
+    join_project_keys,
+)
+from gcf_data_mapper.parsers.helpers import ensure_normalised
+from gcf_data_mapper.read import GCF_PROJECT_COLUMNS, read
+
+# The number of projects to generate per document wanted, as the synthetic projects have
+# three documents on average (but anywhere between one and five).
+PROJECTS_PER_DOCUMENT = 0.5
+
+KEY_COLUMNS = ["FP number"] + [e.value for e in RequiredFamilyDocumentColumns]
+
+
+def merge_every_column(
+    projects_data: pd.DataFrame, gcf_docs: pd.DataFrame
+) -> pd.DataFrame:
+    """Join the projects onto the documents the way the baseline `document` did.
+
+    :param pd.DataFrame projects_data: The project data.
+    :param pd.DataFrame gcf_docs: The document data.
+    :return pd.DataFrame: The key columns of the joined documents.
+    """
+    combo = pd.merge(
+        left=gcf_docs,
+        right=projects_data,
+        left_on="FP number",
+        right_on=RequiredFamilyDocumentColumns.APPROVED_REF.value,
+        how="left",
+    ).convert_dtypes()
+    return combo[KEY_COLUMNS]
+
+
+def join_key_columns(
+    projects_data: pd.DataFrame, gcf_docs: pd.DataFrame
+) -> pd.DataFrame:
+    """Join the project keys onto the documents chunk by chunk, as `document` does.
+
+    :param pd.DataFrame projects_data: The project data.
+    :param pd.DataFrame gcf_docs: The document data.
+    :return pd.DataFrame: The key columns of the joined documents.
+    """
+    project_index = build_project_index(projects_data)
+    gcf_docs = gcf_docs.copy(deep=False)
+    gcf_docs[TYPED_DOCUMENT_COLUMNS] = gcf_docs[TYPED_DOCUMENT_COLUMNS].convert_dtypes()
+    chunks = [
+        ensure_normalised(
+            join_project_keys(
+                gcf_docs.iloc[start : start + DOCUMENT_CHUNK_SIZE], project_index
+            )
+        )[KEY_COLUMNS]
+        for start in range(0, gcf_docs.shape[0], DOCUMENT_CHUNK_SIZE)
+    ]
+    return pd.concat(chunks)
+
+
+@click.command()
+@click.option("--documents", default=100_000, show_default=True)
+@click.option("--runs", default=3, show_default=True)
+def main(documents: int, runs: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = generate_dataset(
+            int(documents * PROJECTS_PER_DOCUMENT) + 1, os.path.join(temp_dir, "data")
+        )
+        (project_info, doc_info), _ = measure(
+            lambda: read(
+                paths["gcf_projects_file"],
+                paths["mcf_projects_file"],
+                paths["mcf_docs_file"],
+                False,
+                GCF_PROJECT_COLUMNS,
+                True,
+            ),
+            memory=False,
+        )
+    doc_info = doc_info.head(documents)
+
+    results = {"every column": [], "key columns": []}
+    for _ in range(runs):
+        every_column, before = measure(
+            lambda: merge_every_column(project_info, doc_info), memory=True
+        )
+        key_columns, after = measure(
+            lambda: join_key_columns(project_info, doc_info), memory=True
+        )
+        results["every column"].append(before)
+        results["key columns"].append(after)
+
+    if not every_column.astype(str).equals(
+        key_columns.reset_index(drop=True).astype(str)
+    ):
+        raise click.ClickException("Joining the key columns changed the project keys")
+
+    click.echo(f"📊 {len(doc_info)} documents, best of {runs} runs")
+    best = {
+        name: {
+            "seconds": min(result["seconds"] for result in measured),
+            "peak_mb": min(result["peak_mb"] for result in measured),
+        }
+        for name, measured in results.items()
+    }
+    for name, result in best.items():
+        click.echo(
+            f"- {name:<13} {result['seconds']:>6.2f}s {result['peak_mb']:>8.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Compare the columnar event mapper against the original row-by-row loop.
+
+Run from the repository root with:
+
+    python -m benchmarks.event --projects 100000
+"""
+
+import random
+import time
+from typing import Any, Callable
+
+import click
+import pandas as pd
+
+from gcf_data_mapper.enums.event import Event, EventColumnNames, Events
+from gcf_data_mapper.enums.rejection import RejectionRules
+from gcf_data_mapper.parsers.event import event
+from gcf_data_mapper.parsers.helpers import strip_nested
+from gcf_data_mapper.rejections import reject
+
+
+def synthetic_event_projects(n_projects: int, seed: int = 0) -> pd.DataFrame:
+    """Create project data holding only the event columns.
+
+    :param int n_projects: The number of projects to create.
+    :param int seed: The seed for the random number generator.
+    :return pd.DataFrame: The synthetic project data.
+    """
+    rng = random.Random(seed)
+
+    def maybe_date(probability: float) -> Any:
+        if rng.random() > probability:
+            return None
+        return f"20{rng.randint(15, 30)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T00:00:00.000Z"
+
+    return pd.DataFrame(
+        {
+            EventColumnNames.APPROVED_REF.value: [
+                f"FP{i:03}" for i in range(n_projects)
+            ],
+            EventColumnNames.PROJECTS_ID.value: list(range(n_projects)),
+            EventColumnNames.APPROVED.value: [
+                maybe_date(0.95) for _ in range(n_projects)
+            ],
+            EventColumnNames.UNDER_IMPLEMENTATION.value: [
+                maybe_date(0.7) for _ in range(n_projects)
+            ],
+            EventColumnNames.COMPLETED.value: [
+                maybe_date(0.3) for _ in range(n_projects)
+            ],
+            EventColumnNames.UNDER_IMPLEMENTATION_SECONDARY.value: [
+                maybe_date(0.5) for _ in range(n_projects)
+            ],
+        }
+    )
+
+
+def append_event(
+    gcf_events: list,
+    event: Event,
+    row: pd.Series,
+    approved_ref: str,
+    projects_id: str,
+    n_value: int,
+) -> None:
+    """Append an event to the master list that is passed in.
+
+    :param list gcf_events: The list of GCF events.
+    :param Event event: The event to append.
+    :param pd.Series row: The row of data containing GCF event info.
+        Each row corresponds to a GCF 'family'.
+    :param str approved_ref: The FP number.
+    :param str projects_id: The GCF projects ID.
+    :param int n_value: The event number for the given GCF family.
+    """
+    gcf_events.append(
+        {
+            "import_id": f"GCF.event.{approved_ref}_{projects_id}.n{n_value:04}",
+            "family_import_id": f"GCF.family.{approved_ref}.{projects_id}",
+            "event_title": event.type,
+            "date": row[event.column_name],
+            "event_type_value": event.type,
+            "metadata": {
+                "event_type": [event.type],
+                "datetime_event_name": ["Project Approved"],
+            },
+        }
+    )
+
+
+def check_event_dates(row: pd.Series) -> dict[str, bool]:
+    """Check if the row contains valid event date values (not NA).
+
+    :param pd.Series row: The row of data to check.
+    :return dict[str, bool]: A dict indicating the presence of each
+        event date.
+    """
+    return {
+        Events.APPROVED.name: pd.notna(row.at[Events.APPROVED.column_name]),
+        Events.UNDER_IMPLEMENTATION.name: pd.notna(
+            row.at[Events.UNDER_IMPLEMENTATION.column_name]
+        ),
+        Events.COMPLETED.name: pd.notna(row.at[Events.COMPLETED.column_name]),
+        Events.UNDER_IMPLEMENTATION_SECONDARY.name: pd.isna(
+            row.at[Events.UNDER_IMPLEMENTATION.column_name]
+        )
+        and pd.notna(row.at[Events.UNDER_IMPLEMENTATION_SECONDARY.column_name]),
+    }
+
+
+def process_event(
+    row: pd.Series,
+    gcf_events: list,
+    event_counter: dict,
+    approved_ref: str,
+    projects_id: str,
+) -> None:
+    """Process a row to append events and update the event counter.
+
+    :param pd.Series row: The row of data to process (corresponds to a
+        GCF family).
+    :param list gcf_events: The master list of already processed GCF
+        events.
+    :param dict event_counter: The event counter dictionary.
+    :param str approved_ref: The FP number.
+    :param str projects_id: The GCF projects ID.
+    """
+    family_import_id = f"GCF.event.{approved_ref}.{projects_id}"
+    event_counter.setdefault(family_import_id, 0)
+
+    event_dates = check_event_dates(row)
+    if not any(event_dates.values()):
+        reject(
+            "events",
+            RejectionRules.NO_EVENT_DATES,
+            f"🛑 No event dates found for {approved_ref} {projects_id}.",
+            {"approved_ref": approved_ref, "projects_id": str(projects_id)},
+        )
+        return
+
+    for event_name, has_event in event_dates.items():
+        if has_event:
+            append_event(
+                gcf_events,
+                getattr(Events, event_name.upper()),
+                row,
+                approved_ref,
+                projects_id,
+                event_counter[family_import_id],
+            )
+            event_counter[family_import_id] += 1
+
+
+def row_by_row_event(projects_data: pd.DataFrame) -> list[dict[str, Any]]:
+    """Map the events the way `event` did before it was vectorised.
+
+    :param pd.DataFrame projects_data: The project data.
+    :return list[dict[str, Any]]: The mapped events.
+    """
+    gcf_events = []
+    event_counter = {}
+    for _, row in projects_data.iterrows():
+        row = row.apply(strip_nested)
+        process_event(
+            row,
+            gcf_events,
+            event_counter,
+            row.at[EventColumnNames.APPROVED_REF.value],
+            row.at[EventColumnNames.PROJECTS_ID.value],
+        )
+    return gcf_events
+
+
+def timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+@click.command()
+@click.option("--projects", default=100_000, show_default=True)
+def main(projects: int):
+    projects_data = synthetic_event_projects(projects)
+
+    legacy_events, legacy_seconds = timed(lambda: row_by_row_event(projects_data))
+    columnar_events, columnar_seconds = timed(lambda: event(projects_data, False))
+
+    if legacy_events != columnar_events:
+        raise click.ClickException("Columnar events differ from row-by-row events")
+
+    click.echo(f"📊 {projects} projects, {len(columnar_events)} events")
+    click.echo(f"- row by row: {legacy_seconds:.2f}s")
+    click.echo(f"- columnar:   {columnar_seconds:.2f}s")
+    click.echo(f"- speedup:    {legacy_seconds / columnar_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
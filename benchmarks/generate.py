@@ -0,0 +1,227 @@
+"""Generate a synthetic GCF/MCF dataset to benchmark the mapper against.
+
+Run from the repository root with:
+
+    python -m benchmarks.generate --projects 10000 --output_dir data/synthetic
+"""
+
+import csv
+import json
+import os
+import random
+from typing import Any
+
+import click
+
+from gcf_data_mapper.enums.document import IgnoreDocumentTypes
+from gcf_data_mapper.enums.family import GCFProjectBudgetSource
+
+# The project scales the benchmarks are usually run at.
+SCALES = [1_000, 10_000, 100_000, 1_000_000]
+
+GCF_PROJECTS_FILE = "gcf-projects.json"
+MCF_PROJECTS_FILE = "MCFprojects.csv"
+MCF_DOCS_FILE = "MCFdocuments-v2.csv"
+
+COUNTRIES = [
+    {"CountryName": "Bangladesh", "ISO3": "BGD", "Region": "Asia"},
+    {"CountryName": "Haiti", "ISO3": "HTI", "Region": "Latin America"},
+    {"CountryName": "Kenya", "ISO3": "KEN", "Region": "Africa"},
+    {"CountryName": "Fiji", "ISO3": "FJI", "Region": "Asia-Pacific"},
+    {"CountryName": "Peru", "ISO3": "PER", "Region": "Latin America"},
+    {"CountryName": "Mongolia", "ISO3": "MNG", "Region": "Asia"},
+    {"CountryName": "Senegal", "ISO3": "SEN", "Region": "Africa"},
+    {"CountryName": "Georgia", "ISO3": "GEO", "Region": "Eastern Europe"},
+]
+ENTITIES = [
+    "Green Innovations",
+    "United Nations Development Programme",
+    "World Bank",
+    "Asian Development Bank",
+    "Conservation International",
+]
+RESULT_AREAS = [
+    ("Coastal protection", "Adaptation"),
+    ("Energy generation and access", "Mitigation"),
+    ("Forests and land use", "Mitigation"),
+    ("Health, food and water security", "Adaptation"),
+    ("Most vulnerable people and communities", "Adaptation"),
+]
+THEMES = ["Adaptation", "Mitigation", "Cross-cutting"]
+SECTORS = ["Environment", "Energy", "Agriculture", "Water"]
+STATUSES = [None, "Approved", "Under implementation", "Completed"]
+DOCUMENT_TYPES = [
+    "Approved funding proposal",
+    "Funding proposal annex",
+    "Annual performance report",
+    "Environmental and social report(s)",
+    *[e.value for e in IgnoreDocumentTypes],
+]
+LANGUAGES = ["fr", "es", "ar"]
+MCF_PROJECT_FIELDS = ["FP number", "Board meeting"]
+MCF_DOC_FIELDS = [
+    "FP number",
+    "ID (Unique ID from our CMS for the document)",
+    "Type",
+    "Title",
+    "Main file (English)",
+    "Translated files",
+    "Translated titles",
+    "Document page permalink",
+]
+
+
+def maybe(rng: random.Random, probability: float, value: Any) -> Any:
+    return value if rng.random() < probability else None
+
+
+def synthetic_date(rng: random.Random, start_year: int, end_year: int) -> str:
+    return (
+        f"{rng.randint(start_year, end_year)}-{rng.randint(1, 12):02}"
+        f"-{rng.randint(1, 28):02}T00:00:00.000Z"
+    )
+
+
+def synthetic_project(rng: random.Random, projects_id: int) -> dict[str, Any]:
+    """Create a GCF project with realistic nested lists.
+
+    :param random.Random rng: The random number generator.
+    :param int projects_id: The ID of the project.
+    :return dict[str, Any]: The synthetic project.
+    """
+    approved_ref = f"FP{projects_id:03}"
+    budget = rng.randint(1, 500) * 100_000
+    areas = rng.sample(RESULT_AREAS, rng.randint(1, 3))
+    shares = [100 // len(areas)] * len(areas)
+    shares[0] += 100 - sum(shares)
+
+    return {
+        "ProjectsID": projects_id,
+        "ApprovedRef": approved_ref,
+        "ProjectName": f"Project {projects_id}",
+        "Theme": rng.choice(THEMES),
+        "Sector": rng.choice(SECTORS),
+        "ProjectURL": f"https://www.greenclimate.fund/project/{approved_ref.lower()}",
+        "Summary": f" The summary of project {projects_id}. ",
+        "Countries": rng.sample(COUNTRIES, rng.randint(1, 4)),
+        "Entities": [
+            {"Name": name} for name in rng.sample(ENTITIES, rng.randint(1, 2))
+        ],
+        "Funding": [
+            {"Source": GCFProjectBudgetSource.GCF.value, "BudgetUSDeq": budget},
+            *[
+                {
+                    "Source": GCFProjectBudgetSource.CO_FINANCING.value,
+                    "BudgetUSDeq": rng.randint(1, 200) * 50_000,
+                }
+                for _ in range(rng.randint(0, 3))
+            ],
+        ],
+        "ResultAreas": [
+            {"Area": area, "Type": area_type, "Value": f"{share}%"}
+            for (area, area_type), share in zip(areas, shares, strict=True)
+        ],
+        "ApprovalDate": maybe(rng, 0.98, synthetic_date(rng, 2015, 2020)),
+        "StartDate": maybe(rng, 0.7, synthetic_date(rng, 2016, 2022)),
+        "DateCompletion": maybe(rng, 0.3, synthetic_date(rng, 2020, 2030)),
+        "DateImplementationStart": maybe(rng, 0.5, synthetic_date(rng, 2016, 2022)),
+        "Status": rng.choice(STATUSES),
+        "BoardMeeting": f"B.{rng.randint(10, 40)}",
+    }
+
+
+def synthetic_documents(
+    rng: random.Random, approved_ref: str, first_id: int
+) -> list[dict[str, Any]]:
+    """Create the MCF documents of a project, some with translations.
+
+    :param random.Random rng: The random number generator.
+    :param str approved_ref: The ApprovedRef of the project.
+    :param int first_id: The ID of the first document.
+    :return list[dict[str, Any]]: The synthetic documents.
+    """
+    documents = []
+    for doc_id in range(first_id, first_id + rng.randint(1, 5)):
+        languages = rng.sample(LANGUAGES, rng.choice([0, 0, 0, 1, 2, 3]))
+        documents.append(
+            {
+                "FP number": approved_ref,
+                "ID (Unique ID from our CMS for the document)": doc_id,
+                "Type": rng.choice(DOCUMENT_TYPES),
+                "Title": f"{approved_ref} document {doc_id}",
+                "Main file (English)": f"https://www.greenclimate.fund/{doc_id}.pdf",
+                "Translated files": "|".join(
+                    f"https://www.greenclimate.fund/{doc_id}-{lang}.pdf"
+                    for lang in languages
+                )
+                or None,
+                "Translated titles": "|".join(
+                    f"{approved_ref} document {doc_id} ({lang})" for lang in languages
+                )
+                or None,
+                "Document page permalink": f"https://www.greenclimate.fund/d/{doc_id}",
+            }
+        )
+    return documents
+
+
+def generate_dataset(n_projects: int, output_dir: str, seed: int = 0) -> dict[str, str]:
+    """Write the three input files for a synthetic set of projects.
+
+    The same number of projects and seed always produce the same files.
+
+    :param int n_projects: The number of projects to create.
+    :param str output_dir: The directory to write the files to.
+    :param int seed: The seed for the random number generator.
+    :return dict[str, str]: The paths to the GCF projects, MCF projects
+        and MCF documents files, keyed by the matching CLI option.
+    """
+    rng = random.Random(seed)
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {
+        "gcf_projects_file": os.path.join(output_dir, GCF_PROJECTS_FILE),
+        "mcf_projects_file": os.path.join(output_dir, MCF_PROJECTS_FILE),
+        "mcf_docs_file": os.path.join(output_dir, MCF_DOCS_FILE),
+    }
+
+    with (
+        open(paths["gcf_projects_file"], "w", encoding="utf-8") as gcf_projects,
+        open(paths["mcf_projects_file"], "w", encoding="utf-8", newline="") as mcf,
+        open(paths["mcf_docs_file"], "w", encoding="utf-8", newline="") as docs,
+    ):
+        mcf_projects = csv.DictWriter(mcf, MCF_PROJECT_FIELDS)
+        mcf_docs = csv.DictWriter(docs, MCF_DOC_FIELDS)
+        mcf_projects.writeheader()
+        mcf_docs.writeheader()
+
+        n_documents = 0
+        gcf_projects.write("[")
+        for projects_id in range(n_projects):
+            project = synthetic_project(rng, projects_id)
+            gcf_projects.write(("," if projects_id else "") + json.dumps(project))
+
+            approved_ref = project["ApprovedRef"]
+            mcf_projects.writerow(
+                {"FP number": approved_ref, "Board meeting": project["BoardMeeting"]}
+            )
+            documents = synthetic_documents(rng, approved_ref, n_documents)
+            mcf_docs.writerows(documents)
+            n_documents += len(documents)
+        gcf_projects.write("]")
+
+    return paths
+
+
+@click.command()
+@click.option("--projects", default=SCALES[0], show_default=True)
+@click.option("--output_dir", default=os.path.join("data", "synthetic"))
+@click.option("--seed", default=0, show_default=True)
+def main(projects: int, output_dir: str, seed: int):
+    paths = generate_dataset(projects, output_dir, seed)
+    click.echo(f"✅ Generated {projects} projects:")
+    for path in paths.values():
+        click.echo(f"- {click.format_filename(path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Time each stage of the mapper, and its peak memory, on synthetic data.
+
+Run from the repository root with:
+
+    python -m benchmarks.stages --projects 1000 --projects 10000 --report bench.json
+
+and compare against the report of another commit with `--compare`.
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+from typing import Any, Callable, Optional
+
+import click
+import pandas as pd
+
+from benchmarks.generate import SCALES, generate_dataset
+from gcf_data_mapper.cli import dump_output
+from gcf_data_mapper.enums.write import Compressions, OutputFormats
+from gcf_data_mapper.parsers.document import document
+from gcf_data_mapper.parsers.event import event
+from gcf_data_mapper.parsers.family import family
+from gcf_data_mapper.read import GCF_PROJECT_COLUMNS, read
+
+
+def measure(
+    func: Callable[[], Any], memory: bool
+) -> tuple[Any, dict[str, Optional[float]]]:
+    """Time a stage, then run it again under tracemalloc for its peak memory.
+
+    Tracing allocations slows the stage down, so the timing comes from
+    an untraced run. Anything the stage prints is swallowed.
+
+    :param Callable[[], Any] func: The stage to run.
+    :param bool memory: Whether to measure the peak memory.
+    :return tuple[Any, dict[str, Optional[float]]]: The result of the
+        stage, and its wall time (seconds) and peak memory (MiB).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+
+        peak_mb = None
+        if memory:
+            tracemalloc.start()
+            func()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+
+    return result, {
+        "seconds": round(seconds, 4),
+        "peak_mb": peak_mb and round(peak_mb, 2),
+    }
+
+
+def installed(package: str) -> bool:
+    return importlib.util.find_spec(package) is not None
+
+
+def run_stages(paths: dict[str, str], memory: bool) -> dict[str, dict[str, Any]]:
+    """Run every stage of the mapper over a dataset.
+
+    :param dict[str, str] paths: The input files, as returned by
+        generate_dataset.
+    :param bool memory: Whether to measure the peak memory of each stage.
+    :return dict[str, dict[str, Any]]: The measurements of each stage.
+    """
+    results = {}
+    (project_info, doc_info), results["read"] = measure(
+        lambda: read(
+            paths["gcf_projects_file"],
+            paths["mcf_projects_file"],
+            paths["mcf_docs_file"],
+            False,
+            GCF_PROJECT_COLUMNS,
+            True,
+        ),
+        memory,
+    )
+    results["read"]["rows"] = len(project_info) + len(doc_info)
+
+    mapped_data = {}
+    for stage, entity, mapper in [
+        ("family", "families", lambda: family(project_info, False)),
+        ("document", "documents", lambda: document(project_info, doc_info, False)),
+        ("event", "events", lambda: event(project_info, False)),
+    ]:
+        mapped_data[entity], results[stage] = measure(mapper, memory)
+        results[stage]["rows"] = len(mapped_data[entity])
+
+    # Every output format, and the bulk import JSON compressed as it's written, is timed
+    # against today's bulk import JSON (dump_output), with the total size of the file(s)
+    # it writes.
+    outputs = [("dump_output", "output.json", OutputFormats.JSON)]
+    outputs += [
+        (f"dump_{output_format.value}", "output.json", output_format)
+        for output_format in OutputFormats
+        if output_format != OutputFormats.JSON
+        and (output_format != OutputFormats.PARQUET or installed("pyarrow"))
+    ]
+    outputs += [
+        (
+            f"dump_json{compression.value}",
+            f"output.json{compression.value}",
+            OutputFormats.JSON,
+        )
+        for compression in Compressions
+        if compression != Compressions.ZSTD or installed("zstandard")
+    ]
+    for stage, output_name, output_format in outputs:
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_file = os.path.join(output_dir, output_name)
+            _, results[stage] = measure(
+                partial(
+                    dump_output, mapped_data, output_file, False, output_format.value
+                ),
+                memory,
+            )
+            results[stage]["rows"] = sum(map(len, mapped_data.values()))
+            results[stage]["bytes"] = sum(
+                entry.stat().st_size for entry in os.scandir(output_dir)
+            )
+
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def echo_comparison(report: dict[str, Any], baseline: dict[str, Any]):
+    """Print the change in time and memory of each stage against a baseline.
+
+    :param dict[str, Any] report: The report of this run.
+    :param dict[str, Any] baseline: A report of another run.
+    """
+    click.echo(f"📊 Compared to {baseline.get('commit')}:")
+    for scale, stages in report["scales"].items():
+        for stage, result in stages.items():
+            before = baseline["scales"].get(scale, {}).get(stage)
+            if not before:
+                continue
+            changes = [
+                f"{metric} {before[metric]} → {result[metric]} "
+                f"({(result[metric] / before[metric] - 1) * 100:+.0f}%)"
+                for metric in ["seconds", "peak_mb"]
+                if result.get(metric) and before.get(metric)
+            ]
+            click.echo(f"- {scale:>8} {stage:<17} {', '.join(changes)}")
+
+
+@click.command()
+@click.option(
+    "--projects",
+    multiple=True,
+    type=int,
+    default=SCALES[:2],
+    show_default=True,
+    help="The number of projects to benchmark, can be given more than once.",
+)
+@click.option(
+    "--data_dir",
+    default=None,
+    help="Where to keep the synthetic data. Defaults to a temporary directory.",
+)
+@click.option("--memory/--no-memory", default=True, help="Measure peak memory.")
+@click.option("--report", default=None, help="Write the results to this JSON file.")
+@click.option(
+    "--compare",
+    default=None,
+    type=click.Path(exists=True),
+    help="A report from another commit to compare against.",
+)
+def main(
+    projects: tuple[int, ...],
+    data_dir: Optional[str],
+    memory: bool,
+    report: Optional[str],
+    compare: Optional[str],
+):
+    results: dict[str, Any] = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "scales": {},
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for n_projects in projects:
+            paths = generate_dataset(
+                n_projects, os.path.join(data_dir or temp_dir, str(n_projects))
+            )
+            stages = run_stages(paths, memory)
+            results["scales"][str(n_projects)] = stages
+
+            click.echo(f"📊 {n_projects} projects")
+            for stage, result in stages.items():
+                peak = f"{result['peak_mb']:>9.1f} MiB" if memory else ""
+                size = (
+                    f" {result['bytes'] / 2**20:>8.1f} MiB written"
+                    if "bytes" in result
+                    else ""
+                )
+                click.echo(
+                    f"- {stage:<17} {result['seconds']:>8.2f}s {peak} "
+                    f"{result['rows']:>9} rows{size}"
+                )
+
+    if report:
+        with open(report, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        click.echo(f"📝 Report written to {click.format_filename(report)}")
+
+    if compare:
+        with open(compare, encoding="utf-8") as f:
+            echo_comparison(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
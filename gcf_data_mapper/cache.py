@@ -0,0 +1,201 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+from contextlib import suppress
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from gcf_data_mapper.logs import echo
+
+# Bump this whenever a change to reading the input files changes the frames they're read
+# into, so that frames cached by an older version are never loaded.
+CACHE_VERSION = 1
+
+# The number of bytes of an input file to hash at a time.
+HASH_BLOCK_SIZE = 2**20
+
+
+def file_stat(file_path: str) -> dict[str, int]:
+    """Get the size and mtime of an input file, which are cheap to compare.
+
+    :param str file_path: The input filename.
+    :return dict[str, int]: The size and mtime (in nanoseconds) of the
+        file.
+    """
+    stat = os.stat(file_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def file_hash(file_path: str) -> str:
+    """Hash the content of an input file.
+
+    :param str file_path: The input filename.
+    :return str: The sha256 hex digest of the file.
+    """
+    content_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+def file_fingerprint(file_path: str) -> dict[str, Any]:
+    """Fingerprint an input file by its size, mtime and content.
+
+    :param str file_path: The input filename.
+    :return dict[str, Any]: The fingerprint of the file.
+    """
+    return {**file_stat(file_path), "sha256": file_hash(file_path)}
+
+
+def is_unchanged(file_path: str, fingerprint: dict[str, Any]) -> bool:
+    """Check whether an input file still has the given fingerprint.
+
+    The content is only hashed where the mtime of the file has changed
+    but not its size, e.g. where it was touched or copied without being
+    edited.
+
+    :param str file_path: The input filename.
+    :param dict[str, Any] fingerprint: The fingerprint of the file, as
+        returned by `file_fingerprint`.
+    :return bool: True if the file has the same content.
+    """
+    stat = file_stat(file_path)
+    if all(fingerprint.get(key) == value for key, value in stat.items()):
+        return True
+    if stat["size"] != fingerprint.get("size"):
+        return False
+    return file_hash(file_path) == fingerprint.get("sha256")
+
+
+def cache_files(
+    cache_dir: str, file_path: str, options: dict[str, Any]
+) -> tuple[str, str, str]:
+    """Get the cache filenames of a frame, and a pattern matching its old versions.
+
+    :param str cache_dir: The cache directory.
+    :param str file_path: The input filename.
+    :param dict[str, Any] options: The options the file is read with.
+    :return tuple[str, str, str]: The filename of the cached frame, the
+        filename of the fingerprint of the input file it was read from,
+        and a glob pattern for every file cached for the same input file.
+    """
+    path = os.path.abspath(file_path)
+    path_key = hashlib.sha256(path.encode()).hexdigest()[:16]
+    key = hashlib.sha256(
+        json.dumps(
+            {
+                "version": CACHE_VERSION,
+                "pandas": pd.__version__,
+                "path": path,
+                "options": options,
+            },
+            sort_keys=True,
+            default=str,
+        ).encode()
+    ).hexdigest()[:32]
+
+    name = os.path.basename(file_path)
+    return (
+        os.path.join(cache_dir, f"{name}.{path_key}.{key}.pkl"),
+        os.path.join(cache_dir, f"{name}.{path_key}.{key}.json"),
+        os.path.join(cache_dir, f"{glob.escape(name)}.{path_key}.*"),
+    )
+
+
+def read_fingerprint(fingerprint_file: str) -> Optional[dict[str, Any]]:
+    """Read the fingerprint of the input file a frame was cached from.
+
+    :param str fingerprint_file: The fingerprint filename.
+    :return Optional[dict[str, Any]]: The fingerprint, or None if there
+        isn't a readable one.
+    """
+    try:
+        with open(fingerprint_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_fingerprint(fingerprint_file: str, fingerprint: dict[str, Any]):
+    """Write the fingerprint of the input file a frame was cached from.
+
+    :param str fingerprint_file: The fingerprint filename.
+    :param dict[str, Any] fingerprint: The fingerprint, as returned by
+        `file_fingerprint`.
+    """
+    with open(f"{fingerprint_file}.tmp", "w", encoding="utf-8") as f:
+        json.dump(fingerprint, f)
+    os.replace(f"{fingerprint_file}.tmp", fingerprint_file)
+
+
+def read_cached(
+    cache_dir: str,
+    file_path: str,
+    read: Callable[[], pd.DataFrame],
+    options: dict[str, Any],
+    debug: bool = False,
+) -> pd.DataFrame:
+    """Load the frame an input file was read into from the cache, if it's there.
+
+    The cached frame is used while the input file has the size and
+    mtime it had when it was cached, or else the same content. Otherwise
+    the file is read and its frame cached, replacing any frame cached
+    for an older version of the file. The frames are pickled, so the
+    cache directory must only be writable by trusted users.
+
+    :param str cache_dir: The cache directory.
+    :param str file_path: The input filename.
+    :param Callable[[], pd.DataFrame] read: Reads the input file.
+    :param dict[str, Any] options: The options the file is read with,
+        which are part of the cache key.
+    :param bool debug: Whether debug mode is on.
+    :return pd.DataFrame: The frame the input file was read into.
+    """
+    if not os.path.isfile(file_path):
+        return read()
+
+    cache_file, fingerprint_file, cache_pattern = cache_files(
+        cache_dir, file_path, options
+    )
+    fingerprint = read_fingerprint(fingerprint_file)
+    if (
+        fingerprint is not None
+        and os.path.exists(cache_file)
+        and is_unchanged(file_path, fingerprint)
+    ):
+        try:
+            df = pd.read_pickle(cache_file)
+            if debug:
+                echo(f"📝 Loaded {file_path} from {cache_file}", level=logging.DEBUG)
+            # Record the new size and mtime of a file whose content is unchanged, so
+            # it isn't hashed again next time.
+            stat = file_stat(file_path)
+            if stat.items() - fingerprint.items():
+                with suppress(OSError):
+                    write_fingerprint(fingerprint_file, {**fingerprint, **stat})
+            return df
+        except Exception as e:
+            echo(
+                f"⚠️  Ignoring unreadable cache file {cache_file}: {e}",
+                level=logging.WARNING,
+            )
+
+    fingerprint = file_fingerprint(file_path)
+    df = read()
+    if df.empty:
+        return df
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for old_cache_file in glob.glob(cache_pattern):
+            os.remove(old_cache_file)
+        df.to_pickle(f"{cache_file}.tmp", compression=None)
+        os.replace(f"{cache_file}.tmp", cache_file)
+        write_fingerprint(fingerprint_file, fingerprint)
+    except OSError as e:
+        echo(f"⚠️  Failed to cache {file_path}: {e}", level=logging.WARNING)
+    return df
@@ -1,16 +1,58 @@
-import json
+import logging
 import os
 import sys
-from typing import Any, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, TypeVar
 
 import click
-import pandas as pd
 
-from gcf_data_mapper.parsers.collection import collection
-from gcf_data_mapper.parsers.document import document
-from gcf_data_mapper.parsers.event import event
-from gcf_data_mapper.parsers.family import family
-from gcf_data_mapper.read import read
+from gcf_data_mapper.clock import set_reference_time
+from gcf_data_mapper.enums.log import LogFormats, LogLevels
+from gcf_data_mapper.enums.read import CSVEngines
+from gcf_data_mapper.enums.write import OutputFormats
+from gcf_data_mapper.logs import LOG_LEVELS, echo, start_logging, stop_logging
+from gcf_data_mapper.metrics import (
+    echo_metrics,
+    get_metrics,
+    measure,
+    measure_iter,
+    record_stage,
+    reset_metrics,
+    write_metrics,
+)
+from gcf_data_mapper.rejections import (
+    echo_rejection_counts,
+    start_rejections,
+    stop_rejections,
+)
+from gcf_data_mapper.write import WRITERS
+
+# Pandas, and the modules that use it, are only imported once a mapping run starts, so
+# that --help and --version (and importing this module) stay fast.
+if TYPE_CHECKING:
+    import pandas as pd
+
+T = TypeVar("T")
+
+
+class MappingError(Exception):
+    """An error mapping the GCF data, raised as the entities are written."""
+
+
+def raising_mapping_errors(items: Iterable[T]) -> Iterator[T]:
+    """Iterate the items, raising any error producing them as a MappingError.
+
+    The entities that are only mapped as they're written can then fail
+    the run as a mapping error, rather than as an error writing them.
+
+    :param Iterable[T] items: The items, e.g. lazily mapped entities.
+    :raises MappingError: if producing an item raises.
+    :yield T: The items.
+    """
+    try:
+        yield from items
+    except Exception as e:
+        raise MappingError(e) from e
 
 
 @click.command()
@@ -34,10 +76,160 @@ from gcf_data_mapper.read import read
     default=os.path.join(os.getcwd(), "output.json"),
     type=click.Path(exists=False),
 )
+@click.option(
+    "--compression_level",
+    default=None,
+    type=int,
+    help=(
+        "The level to compress the output with when --output_file ends in .gz "
+        "(0-9, defaults to 6) or .zst (1-22, defaults to 3, needs the fast "
+        "extra installed)."
+    ),
+)
+@click.option(
+    "--output_format",
+    default=OutputFormats.JSON.value,
+    type=click.Choice([e.value for e in OutputFormats]),
+    help=(
+        "The format to write the mapped data in. The ndjson and parquet formats "
+        "write one file per entity type next to the output file (parquet needs "
+        "the fast extra installed)."
+    ),
+)
 @click.option("--debug/--no-debug", default=True)
+@click.option(
+    "--log_level",
+    default=None,
+    type=click.Choice([e.value for e in LogLevels]),
+    help="The lowest level of messages to print. Defaults to debug with --debug.",
+)
+@click.option(
+    "--log_format",
+    default=LogFormats.TEXT.value,
+    type=click.Choice([e.value for e in LogFormats]),
+    help="Print the messages as plain text, or as one JSON object per line.",
+)
+@click.option(
+    "--log_rate_limit",
+    default=None,
+    type=click.IntRange(min=0),
+    help=(
+        "The most messages to print about rows skipped for the same reason, the "
+        "rest are only counted."
+    ),
+)
+@click.option(
+    "--selective_json/--full_json",
+    default=True,
+    help="Only load the GCF project fields the mappers use.",
+)
+@click.option(
+    "--typed_csv/--untyped_csv",
+    default=True,
+    help="Only load the MCF columns the mappers use, with declared types.",
+)
+@click.option(
+    "--csv_engine",
+    default=CSVEngines.C.value,
+    type=click.Choice([e.value for e in CSVEngines]),
+    help=(
+        "The parser to read the MCF CSV files with (pyarrow needs the fast extra "
+        "installed)."
+    ),
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    help=(
+        "Load the parsed input files from the cache while they're unchanged. The "
+        "cached files are pickles, so only use a directory trusted users can write."
+    ),
+)
+@click.option(
+    "--cache_dir",
+    default=lambda: os.path.join(os.getcwd(), ".cache", "gcf_data_mapper"),
+    show_default=".cache/gcf_data_mapper",
+    type=click.Path(file_okay=False),
+    help="The directory to cache the parsed input files in.",
+)
+@click.option(
+    "--reconciliation_file",
+    default=None,
+    type=click.Path(exists=False),
+    help="Write the mismatched and duplicated references to this JSON file.",
+)
+@click.option(
+    "--rejections_file",
+    default=None,
+    type=click.Path(exists=False),
+    help=(
+        "Write the skipped rows, with the rule they broke and their offending "
+        "values, to this NDJSON (or .csv) file and only print their counts."
+    ),
+)
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="The number of processes to map the GCF data with.",
+)
+@click.option(
+    "--arrow_interchange/--no-arrow_interchange",
+    default=False,
+    help=(
+        "Share the input data with the worker processes as memory-mapped Arrow "
+        "files, rather than copying it into each of them (needs the fast extra "
+        "installed)."
+    ),
+)
+@click.option(
+    "--state_file",
+    default=None,
+    type=click.Path(exists=False),
+    help=(
+        "Only re-map the projects and documents that changed since the run that "
+        "wrote this file, reusing the rest, then update it."
+    ),
+)
+@click.option(
+    "--reference_time",
+    default=None,
+    type=click.DateTime(),
+    help=(
+        "The UTC time to calculate the project statuses against. Defaults to the "
+        "time the run starts."
+    ),
+)
+@click.option(
+    "--metrics_file",
+    default=None,
+    type=click.Path(exists=False),
+    help="Write the time, memory and row count of each stage to this JSON file.",
+)
 @click.version_option("0.1.0", "--version", "-v", help="Show the version and exit.")
 def entrypoint(
-    gcf_projects_file, mcf_projects_file, mcf_docs_file, output_file, debug: bool
+    gcf_projects_file,
+    mcf_projects_file,
+    mcf_docs_file,
+    output_file,
+    compression_level: Optional[int],
+    output_format: str,
+    debug: bool,
+    log_level: Optional[str],
+    log_format: str,
+    log_rate_limit: Optional[int],
+    selective_json: bool,
+    typed_csv: bool,
+    csv_engine: str,
+    cache: bool,
+    cache_dir: str,
+    reconciliation_file: Optional[str],
+    rejections_file: Optional[str],
+    workers: int,
+    arrow_interchange: bool,
+    state_file: Optional[str],
+    reference_time: Optional[datetime],
+    metrics_file: Optional[str],
 ):
     """Simple program that wrangles GCF data into bulk import format.
 
@@ -45,76 +237,213 @@ def entrypoint(
     :param str mcf_projects_file: The MCF projects filename.
     :param str mcf_docs_file: The MCF projects filename.
     :param str output_file: The output filename.
+    :param Optional[int] compression_level: The level to compress the
+        output with, if its filename has a compression suffix.
+    :param str output_format: The format to write the mapped data in.
     :param bool debug: Whether debug mode is on.
+    :param Optional[str] log_level: The lowest level of messages to
+        print, if not debug (with debug mode on) or info.
+    :param str log_format: The format to print the messages in.
+    :param Optional[int] log_rate_limit: The most messages to print about
+        rows skipped for the same reason, if limited.
+    :param bool selective_json: Whether to only load the GCF project
+        fields the mappers use.
+    :param bool typed_csv: Whether to only load the MCF columns the
+        mappers use, with declared types.
+    :param str csv_engine: The parser to read the MCF CSV files with.
+    :param bool cache: Whether to cache the parsed input files.
+    :param str cache_dir: The directory to cache the parsed input files
+        in.
+    :param Optional[str] reconciliation_file: The filename to write the
+        report of mismatched and duplicated references to, if any.
+    :param Optional[str] rejections_file: The filename to write the
+        skipped rows to, rather than echoing them, if any.
+    :param int workers: The number of processes to map the data with.
+    :param bool arrow_interchange: Whether to share the input data with
+        the worker processes as memory-mapped Arrow files.
+    :param Optional[str] state_file: The filename of the incremental
+        state to reuse and update, if any.
+    :param Optional[datetime] reference_time: The UTC time to calculate
+        the project statuses against, if not the time the run starts.
+    :param Optional[str] metrics_file: The filename to write the metrics
+        of each stage to, if any.
     """
-    click.echo("🚀 Starting the GCF data mapping process.")
+    reset_metrics()
+    if log_level is None:
+        log_level = (LogLevels.DEBUG if debug else LogLevels.INFO).value
+    start_logging(LOG_LEVELS[log_level], log_format, log_rate_limit)
+    click.get_current_context().call_on_close(stop_logging)
+    reference_time = set_reference_time(reference_time)
+    echo("🚀 Starting the GCF data mapping process.")
     if debug:
-        click.echo("📝 Input files:")
-        click.echo(f"- {click.format_filename(gcf_projects_file)}")
-        click.echo(f"- {click.format_filename(mcf_projects_file)}")
-        click.echo(f"- {click.format_filename(mcf_docs_file)}")
+        echo("📝 Input files:", level=logging.DEBUG)
+        echo(f"- {click.format_filename(gcf_projects_file)}", level=logging.DEBUG)
+        echo(f"- {click.format_filename(mcf_projects_file)}", level=logging.DEBUG)
+        echo(f"- {click.format_filename(mcf_docs_file)}", level=logging.DEBUG)
+        echo(
+            f"📝 Calculating project statuses as of {reference_time}",
+            level=logging.DEBUG,
+        )
+
+    if rejections_file is not None:
+        start_rejections(rejections_file)
 
     try:
+        from gcf_data_mapper.read import GCF_PROJECT_COLUMNS, read
+
         project_info, doc_info = read(
-            gcf_projects_file, mcf_projects_file, mcf_docs_file, debug
+            gcf_projects_file,
+            mcf_projects_file,
+            mcf_docs_file,
+            debug,
+            GCF_PROJECT_COLUMNS if selective_json else None,
+            typed_csv,
+            csv_engine,
+            cache_dir if cache else None,
+            reconciliation_file,
+        )
+        mapped_data = wrangle_to_json(
+            project_info, doc_info, debug, workers, state_file, arrow_interchange
         )
-        mapped_data = wrangle_to_json(project_info, doc_info, debug)
     except Exception as e:
-        click.echo(f"❌ Failed to map GCF data to expected JSON. Error: {e}.")
+        echo(
+            f"❌ Failed to map GCF data to expected JSON. Error: {e}.",
+            level=logging.ERROR,
+        )
         sys.exit(1)
 
-    click.echo("✅ Finished mapping GCF data.")
+    echo("✅ Finished mapping GCF data.")
 
-    click.echo()
-    click.echo("🚀 Dumping GCF data to output file")
-    dump_output(mapped_data, output_file, debug)
-    click.echo("✅ Finished dumping mapped GCF data.")
+    echo()
+    echo("🚀 Dumping GCF data to output file")
+    with record_stage("dump_output") as stage:
+        stage["rows"] = sum(
+            dump_output(
+                mapped_data, output_file, debug, output_format, compression_level
+            ).values()
+        )
+    echo("✅ Finished dumping mapped GCF data.")
+
+    if rejections_file is not None:
+        echo()
+        echo_rejection_counts(stop_rejections(), rejections_file)
+
+    echo()
+    echo_metrics(get_metrics())
+    if metrics_file is not None:
+        write_metrics(get_metrics(), metrics_file)
+        echo(
+            f"📝 Metrics file {click.format_filename(metrics_file)}",
+            level=logging.DEBUG,
+        )
 
 
 def wrangle_to_json(
-    project_info: pd.DataFrame, doc_info: pd.DataFrame, debug: bool
-) -> dict[str, list[Optional[dict[str, Any]]]]:
+    project_info: "pd.DataFrame",
+    doc_info: "pd.DataFrame",
+    debug: bool,
+    workers: int = 1,
+    state_file: Optional[str] = None,
+    arrow_interchange: bool = False,
+) -> dict[str, Iterable[Optional[dict[str, Any]]]]:
     """Put the mapped GCF data into a dictionary ready for dumping.
 
     The output of this function will get dumped as JSON to the output
-    file.
+    file. In a single process the documents are mapped lazily, as they
+    are dumped, so their stage overlaps the dump_output stage. With more
+    workers, the families, documents and events are mapped across a pool
+    of processes. With a state file, only the projects and documents that
+    changed since the previous run are mapped (in a single process).
 
     :param pd.DataFrame project_info: The GCF and MCF joined project
         info.
     :param pd.DataFrame doc_info: The MCF docs info.
     :param bool debug: Whether debug mode is on.
-    :return dict[str, list[Optional[dict[str, Any]]]]: The GCF data
+    :param int workers: The number of processes to map the data with.
+    :param Optional[str] state_file: The filename of the incremental
+        state to reuse and update, if any.
+    :param bool arrow_interchange: Whether to share the input data with
+        the worker processes as memory-mapped Arrow files, defaults to
+        False.
+    :return dict[str, Iterable[Optional[dict[str, Any]]]]: The GCF data
         mapped to the Document-Family-Collection-Event entity it
         corresponds to.
     """
+    from gcf_data_mapper.parsers.collection import collection
+
+    collections = measure("collection", collection, debug)
+    if state_file is not None:
+        from gcf_data_mapper.incremental import map_incrementally
+
+        with record_stage("map_incrementally") as stage:
+            mapped_data = map_incrementally(project_info, doc_info, debug, state_file)
+            stage["rows"] = sum(map(len, mapped_data.values()))
+        return {"collections": collections, **mapped_data}
+
+    if workers > 1:
+        from gcf_data_mapper.parallel import map_in_parallel
+
+        with record_stage("map_in_parallel") as stage:
+            mapped_data = map_in_parallel(
+                project_info, doc_info, debug, workers, arrow_interchange
+            )
+            stage["rows"] = sum(map(len, mapped_data.values()))
+        return {"collections": collections, **mapped_data}
+
+    from gcf_data_mapper.parsers.document import iter_documents
+    from gcf_data_mapper.parsers.event import event
+    from gcf_data_mapper.parsers.family import family
+
     return {
-        "collections": collection(debug),
-        "families": family(project_info, debug),
-        "documents": document(project_info, doc_info, debug),
-        "events": event(project_info, debug),
+        "collections": collections,
+        "families": measure("family", family, project_info, debug),
+        "documents": raising_mapping_errors(
+            measure_iter("document", iter_documents, project_info, doc_info, debug)
+        ),
+        "events": measure("event", event, project_info, debug),
     }
 
 
 def dump_output(
-    mapped_data: dict[str, list[Optional[dict[str, Any]]]],
+    mapped_data: dict[str, Iterable[Optional[dict[str, Any]]]],
     output_file: str,
     debug: bool,
-):
+    output_format: str = OutputFormats.JSON.value,
+    compression_level: Optional[int] = None,
+) -> dict[str, int]:
     """Dump the wrangled JSON to the output file.
 
-    :param dict[str, list[Optional[dict[str, Any]]]] mapped_data: The
+    The entities are streamed to the file array by array (or, for
+    parquet, entity type by entity type), so any of them may be iterators
+    that are only consumed as they are written. An output filename
+    ending in .gz or .zst is compressed as it's written. The output file
+    is only replaced once it's written in full.
+
+    :param dict[str, Iterable[Optional[dict[str, Any]]]] mapped_data: The
         mapped GCF data.
     :param str output_file: The output filename.
     :param bool debug: Whether debug mode is on.
+    :param str output_format: The format to write the mapped data in,
+        defaults to the bulk import JSON format.
+    :param Optional[int] compression_level: The level to compress the
+        output with, defaults to the default level of the compression.
+    :return dict[str, int]: The number of items written per entity type.
     """
     if debug:
-        click.echo(f"📝 Output file {click.format_filename(output_file)}")
+        echo(
+            f"📝 Output file {click.format_filename(output_file)}", level=logging.DEBUG
+        )
 
     try:
-        with open(output_file, "w+", encoding="utf-8") as f:
-            json.dump(mapped_data, f, ensure_ascii=False, indent=2)
+        return WRITERS[output_format](mapped_data, output_file, compression_level)
+    except MappingError as e:
+        echo(
+            f"❌ Failed to map GCF data to expected JSON. Error: {e}.",
+            level=logging.ERROR,
+        )
+        sys.exit(1)
     except Exception as e:
-        click.echo(f"❌ Failed to dump JSON to file. Error: {e}.")
+        echo(f"❌ Failed to dump JSON to file. Error: {e}.", level=logging.ERROR)
         sys.exit(1)
 
 
@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+# The time the statuses of the projects are calculated against, fixed for the whole run
+# so that every project (and every worker process) compares against the same moment.
+_reference_time: dict[str, datetime] = {}
+
+
+def as_utc(moment: datetime) -> datetime:
+    """Convert a datetime to UTC, taking a naive datetime to already be UTC.
+
+    :param datetime moment: The datetime to convert.
+    :return datetime: The datetime in UTC.
+    """
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def set_reference_time(reference_time: Optional[datetime] = None) -> datetime:
+    """Fix the time the project statuses are calculated against.
+
+    :param Optional[datetime] reference_time: The reference time, where
+        a naive datetime is taken to be UTC. Defaults to None, which
+        fixes the current time.
+    :return datetime: The reference time, in UTC.
+    """
+    _reference_time["time"] = as_utc(reference_time or datetime.now(timezone.utc))
+    return _reference_time["time"]
+
+
+def reset_reference_time():
+    """Go back to calculating the project statuses against the current time."""
+    _reference_time.clear()
+
+
+def get_reference_time() -> datetime:
+    """Get the time the project statuses are calculated against.
+
+    :return datetime: The fixed reference time in UTC, or the current
+        time if none is fixed.
+    """
+    return _reference_time.get("time") or datetime.now(timezone.utc)
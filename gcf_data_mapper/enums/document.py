@@ -32,3 +32,16 @@ class IgnoreDocumentTypes(Enum):
 class DocumentVariantNames(Enum):
     ORIGINAL = "Original Language"
     TRANSLATION = "Translation"
+
+
+class TranslatedUrlVerdicts(Enum):
+    """The verdict on the translated urls of a document.
+
+    Where the urls are invalid, the value describes the first problem
+    found with them.
+    """
+
+    VALID = "Valid"
+    EMPTY = "Empty URL found"
+    DUPLICATE = "Duplicate URLs found"
+    MALFORMED = "Malformed url found"
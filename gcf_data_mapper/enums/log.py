@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class LogFormats(Enum):
+    """The formats the log messages can be written in."""
+
+    TEXT = "text"
+    JSON = "json"
+
+
+class LogLevels(Enum):
+    """The levels of the log messages that can be written, from the most verbose."""
+
+    DEBUG = "debug"
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class CSVEngines(Enum):
+    C = "c"
+    PYARROW = "pyarrow"
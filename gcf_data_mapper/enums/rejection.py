@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class RejectionRules(Enum):
+    """The rules a row breaks when the mappers skip it."""
+
+    MISSING_PROJECT_ID = "missing_project_id"
+    EMPTY_COLUMN_VALUES = "empty_column_values"
+    INVALID_EVENT_DATES = "invalid_event_dates"
+    MISSING_EVENT_DATES = "missing_event_dates"
+    EMPTY_NESTED_LISTS = "empty_nested_lists"
+    MISSING_FAMILY_METADATA = "missing_family_metadata"
+    MISSING_FAMILY_COLUMNS = "missing_family_columns"
+    MISSING_DOCUMENT_COLUMNS = "missing_document_columns"
+    UNSUPPORTED_FILE_EXTENSION = "unsupported_file_extension"
+    INVALID_TRANSLATED_URLS = "invalid_translated_urls"
+    NO_EVENT_DATES = "no_event_dates"
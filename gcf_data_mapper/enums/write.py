@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class OutputFormats(Enum):
+    """The formats the mapped GCF data can be written in."""
+
+    JSON = "json"
+    COMPACT_JSON = "compact_json"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
+
+
+class Compressions(Enum):
+    """The compressions the output can be written with, by filename suffix."""
+
+    GZIP = ".gz"
+    ZSTD = ".zst"
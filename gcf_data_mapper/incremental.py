@@ -0,0 +1,313 @@
+import json
+import logging
+import os
+from operator import itemgetter
+from typing import Any, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+from gcf_data_mapper.enums.event import EventColumnNames
+from gcf_data_mapper.enums.family import FamilyColumnsNames
+from gcf_data_mapper.logs import echo
+from gcf_data_mapper.parallel import ENTITY_TYPES
+from gcf_data_mapper.parsers.document import map_labelled_documents
+from gcf_data_mapper.parsers.event import map_labelled_events
+from gcf_data_mapper.parsers.family import calculate_statuses, map_labelled_families
+from gcf_data_mapper.parsers.helpers import reference_keys
+from gcf_data_mapper.rejections import (
+    holding_rejections,
+    report_rejections,
+    sort_rejections,
+)
+
+# Bump this whenever a change to the mappers changes their output, so that the mapped
+# entities stored by an older version are never reused.
+STATE_VERSION = 2
+
+STATUS_COLUMN = "__status"
+
+# Reused for every value, as json.dumps builds a new encoder per call with these options.
+_value_encoder = json.JSONEncoder(sort_keys=True, default=str)
+
+
+def serialise_column(column: pd.Series) -> pd.Series:
+    """Serialise the nested (object) values of a column so they can be hashed.
+
+    :param pd.Series column: The column to serialise.
+    :return pd.Series: The column, with object values as JSON strings.
+    """
+    if column.dtype != object:
+        return column
+    return column.map(_value_encoder.encode)
+
+
+def hash_rows(data: pd.DataFrame) -> np.ndarray:
+    """Hash the content of each row.
+
+    :param pd.DataFrame data: The rows to hash.
+    :return np.ndarray: The 64 bit hash of each row.
+    """
+    return pd.util.hash_pandas_object(
+        data.apply(serialise_column), index=False
+    ).to_numpy()
+
+
+def hash_projects(project_info: pd.DataFrame) -> np.ndarray:
+    """Hash the content of each project, including its calculated status.
+
+    The status of a project without a Status value depends on the current
+    time, so a project counts as changed once its status moves on even if
+    its row didn't.
+
+    :param pd.DataFrame project_info: The GCF and MCF joined project
+        info.
+    :return np.ndarray: The 64 bit hash of each project.
+    """
+    event_columns = [
+        EventColumnNames.APPROVED.value,
+        EventColumnNames.UNDER_IMPLEMENTATION.value,
+        EventColumnNames.COMPLETED.value,
+    ]
+    if all(column in project_info for column in event_columns):
+        statuses, _ = calculate_statuses(project_info)
+        project_info = project_info.assign(**{STATUS_COLUMN: statuses})
+    return hash_rows(project_info)
+
+
+def source_rows(entity_type: str) -> str:
+    """Get the rows an entity type is mapped from, "projects" or "documents".
+
+    :param str entity_type: The entity type.
+    :return str: The name of the rows.
+    """
+    return "documents" if entity_type == "documents" else "projects"
+
+
+def frame_schema(data: pd.DataFrame) -> list[str]:
+    return [f"{column}:{dtype}" for column, dtype in data.dtypes.items()]
+
+
+def load_state(state_file: str) -> dict[str, Any]:
+    """Load the state of a previous incremental run.
+
+    :param str state_file: The state filename.
+    :return dict[str, Any]: The state, or an empty state if there is no
+        (readable) state file.
+    """
+    if not os.path.exists(state_file):
+        return {}
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        echo(
+            f"⚠️  Ignoring unreadable incremental state {state_file}: {e}",
+            level=logging.WARNING,
+        )
+        return {}
+
+
+def save_state(state: dict[str, Any], state_file: str):
+    """Save the state of this run, replacing the previous one in one step.
+
+    :param dict[str, Any] state: The state to save.
+    :param str state_file: The state filename.
+    """
+    temp_file = f"{state_file}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        # json.dumps encodes in C, where json.dump would encode in Python. The values of
+        # the rejections that aren't JSON types are stored as they're written, as text.
+        f.write(json.dumps(state, ensure_ascii=False, default=str))
+    os.replace(temp_file, state_file)
+
+
+def group_positions(keys: pd.Series) -> dict[str, np.ndarray]:
+    """Group the positions of the rows by their key.
+
+    :param pd.Series keys: The key of each row.
+    :return dict[str, np.ndarray]: The positions of the rows with each
+        key, in their original order.
+    """
+    if keys.empty:
+        return {}
+    return pd.Series(np.arange(len(keys))).groupby(keys.to_numpy(), sort=False).indices
+
+
+def map_changed_rows(
+    project_info: pd.DataFrame,
+    doc_info: pd.DataFrame,
+    project_positions: np.ndarray,
+    doc_positions: np.ndarray,
+    debug: bool,
+) -> dict[str, list[tuple[Hashable, dict[str, Any]]]]:
+    """Map the projects and documents at the given positions.
+
+    :param pd.DataFrame project_info: The GCF and MCF joined project
+        info.
+    :param pd.DataFrame doc_info: The MCF docs info.
+    :param np.ndarray project_positions: The positions of the projects to
+        map.
+    :param np.ndarray doc_positions: The positions of the documents to
+        map.
+    :param bool debug: Whether debug mode is on.
+    :return dict[str, list[tuple[Hashable, dict[str, Any]]]]: The mapped
+        entities of each type, paired with the position of the row they
+        were mapped from, and the rows skipped while mapping them
+        ("rejections"), held back rather than reported.
+    """
+    if len(project_positions) == 0 and len(doc_positions) == 0:
+        return {entity_type: [] for entity_type in [*ENTITY_TYPES, "rejections"]}
+
+    projects = project_info.iloc[project_positions].set_axis(project_positions)
+    docs = doc_info.iloc[doc_positions].set_axis(doc_positions)
+    with holding_rejections() as rejections:
+        return {
+            "families": map_labelled_families(projects, debug),
+            "documents": list(map_labelled_documents(projects, docs, debug)),
+            "events": map_labelled_events(projects, debug),
+            "rejections": rejections,
+        }
+
+
+def map_incrementally(
+    project_info: pd.DataFrame,
+    doc_info: pd.DataFrame,
+    debug: bool,
+    state_file: str,
+) -> dict[str, list[Optional[dict[str, Any]]]]:
+    """Map only the projects and documents that changed since the last run.
+
+    The rows are grouped by their reference, as every entity is mapped
+    from the rows of a single reference. The mapped entities (and skipped
+    rows) of a reference whose project and document rows all hash the
+    same as in the previous run are reused, the rest are mapped again,
+    and references that no longer appear are dropped. The output, and the
+    rejections reported, are identical to mapping everything.
+
+    :param pd.DataFrame project_info: The GCF and MCF joined project
+        info.
+    :param pd.DataFrame doc_info: The MCF docs info.
+    :param bool debug: Whether debug mode is on.
+    :param str state_file: The file holding the hashes, mapped entities
+        and rejections of the previous run, which is updated with this
+        run.
+    :return dict[str, list[Optional[dict[str, Any]]]]: The mapped
+        families, documents and events.
+    """
+    schema = {
+        "version": STATE_VERSION,
+        "projects": frame_schema(project_info),
+        "documents": frame_schema(doc_info),
+    }
+    previous_state = load_state(state_file)
+    if previous_state and previous_state.get("schema") != schema:
+        echo(
+            "⚠️  The incremental state is out of date, re-mapping everything.",
+            level=logging.WARNING,
+        )
+        previous_state = {}
+    previous_references = previous_state.get("references", {})
+
+    project_keys = reference_keys(project_info[FamilyColumnsNames.APPROVED_REF.value])
+    doc_keys = reference_keys(doc_info["FP number"])
+    project_hashes = hash_projects(project_info).tolist()
+    doc_hashes = hash_rows(doc_info).tolist()
+    project_groups = group_positions(project_keys)
+    doc_groups = group_positions(doc_keys)
+    no_rows = np.array([], dtype=np.intp)
+
+    # Reuse the entities and rejections of unchanged references, relabelled with the
+    # current position of the row (of that reference) each was mapped from.
+    references: dict[str, dict[str, Any]] = {}
+    reused: dict[str, list[tuple[Hashable, dict[str, Any]]]] = {
+        entity_type: [] for entity_type in ENTITY_TYPES
+    }
+    reused_rejections: list[dict[str, Any]] = []
+    changed_projects, changed_docs = [no_rows], [no_rows]
+    n_reused = 0
+    for key in {**project_groups, **doc_groups}:
+        positions = {
+            "projects": project_groups.get(key, no_rows),
+            "documents": doc_groups.get(key, no_rows),
+        }
+        hashes = {
+            "project_hashes": [project_hashes[p] for p in positions["projects"]],
+            "document_hashes": [doc_hashes[p] for p in positions["documents"]],
+        }
+
+        previous = previous_references.get(key)
+        if previous is not None and all(
+            previous[rows] == hashes[rows] for rows in hashes
+        ):
+            references[key] = previous
+            n_reused += 1
+            for entity_type in ENTITY_TYPES:
+                rows = positions[source_rows(entity_type)]
+                reused[entity_type].extend(
+                    (int(rows[row]), entity) for row, entity in previous[entity_type]
+                )
+            reused_rejections.extend(
+                {
+                    **rejection,
+                    "row": int(positions[source_rows(rejection["entity_type"])][row]),
+                }
+                for row, rejection in previous["rejections"]
+            )
+            continue
+
+        references[key] = {
+            **hashes,
+            **{entity_type: [] for entity_type in [*ENTITY_TYPES, "rejections"]},
+        }
+        changed_projects.append(positions["projects"])
+        changed_docs.append(positions["documents"])
+
+    n_dropped = len(previous_references.keys() - references.keys())
+    if debug or previous_state:
+        echo(
+            f"♻️  Reusing {n_reused} unchanged reference(s), re-mapping "
+            f"{len(references) - n_reused} and dropping {n_dropped}."
+        )
+
+    changed = map_changed_rows(
+        project_info,
+        doc_info,
+        np.sort(np.concatenate(changed_projects)),
+        np.sort(np.concatenate(changed_docs)),
+        debug,
+    )
+
+    # Store the new entities and rejections of each changed reference against the
+    # number of the row (within that reference) they were mapped from.
+    keys = {"projects": project_keys, "documents": doc_keys}
+    rows_within_reference = {
+        name: rows.groupby(rows.to_numpy(), sort=False).cumcount().to_numpy()
+        for name, rows in keys.items()
+    }
+    for entity_type in ENTITY_TYPES:
+        name = source_rows(entity_type)
+        for position, entity in changed[entity_type]:
+            references[keys[name].iat[position]][entity_type].append(
+                [int(rows_within_reference[name][position]), entity]
+            )
+    for rejection in changed["rejections"]:
+        name, position = source_rows(rejection["entity_type"]), rejection["row"]
+        references[keys[name].iat[position]]["rejections"].append(
+            [int(rows_within_reference[name][position]), {**rejection, "row": None}]
+        )
+
+    if n_reused < len(references) or n_dropped or not previous_state:
+        save_state({"schema": schema, "references": references}, state_file)
+
+    report_rejections(sort_rejections(reused_rejections + changed["rejections"]))
+
+    return {
+        entity_type: [
+            entity
+            for _, entity in sorted(
+                reused[entity_type] + changed[entity_type], key=itemgetter(0)
+            )
+        ]
+        for entity_type in ENTITY_TYPES
+    }
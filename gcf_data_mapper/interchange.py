@@ -0,0 +1,159 @@
+import json
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+# Pyarrow is an optional dependency, so it's only imported once a frame is converted.
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# The schema metadata key holding what the Arrow tables can't, i.e. the columns stored
+# as JSON text and the attrs of the frame.
+INTERCHANGE_METADATA_KEY = b"gcf_data_mapper"
+
+
+def as_json_text(values: list[Any], na_as_null: bool = False) -> list[str]:
+    """Encode each value as JSON text.
+
+    :param list[Any] values: The values to encode.
+    :param bool na_as_null: Whether to encode the missing values (e.g.
+        NaN) as null, as Arrow stores them. Defaults to False.
+    :return list[str]: The JSON text of each value.
+    """
+    return [
+        json.dumps(
+            (
+                None
+                if na_as_null and pd.api.types.is_scalar(value) and pd.isna(value)
+                else value
+            ),
+            ensure_ascii=False,
+            default=str,
+        )
+        for value in values
+    ]
+
+
+def frame_to_table(data: pd.DataFrame) -> "pa.Table":
+    """Convert a frame to an Arrow table, with its nested values as list/struct columns.
+
+    The lists of dicts (e.g. the Countries of the GCF projects) become
+    list<struct> columns. A column that can't be converted, or whose
+    values would come back changed (e.g. a field that is an integer in
+    some dicts and a float in others, which Arrow stores as floats), is
+    stored as JSON text instead, and decoded again by `table_to_frame`.
+    So is an object column of scalars that Arrow would type, e.g. IDs
+    with missing values, which would otherwise come back as floats.
+
+    :param pd.DataFrame data: The frame to convert.
+    :return pa.Table: The table, with the JSON columns and the attrs of
+        the frame in its schema metadata.
+    """
+    import pyarrow as pa
+
+    json_columns = []
+    try:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Only look for the columns that can't be converted once the frame can't be.
+        for column in data.columns:
+            try:
+                pa.Table.from_pandas(data[[column]], preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                json_columns.append(column)
+        table = pa.Table.from_pandas(
+            data.drop(columns=json_columns), preserve_index=False
+        )
+
+    for field in table.schema:
+        if pa.types.is_nested(field.type):
+            if as_json_text(data[field.name].tolist(), na_as_null=True) != as_json_text(
+                table.column(field.name).to_pylist()
+            ):
+                json_columns.append(field.name)
+        elif data[field.name].dtype == object and not pa.types.is_string(field.type):
+            json_columns.append(field.name)
+
+    if json_columns:
+        data = data.copy(deep=False)
+        for column in json_columns:
+            data[column] = as_json_text(data[column].tolist())
+        table = pa.Table.from_pandas(data, preserve_index=False)
+
+    metadata = {"json_columns": json_columns, "attrs": data.attrs}
+    return table.replace_schema_metadata(
+        {
+            **table.schema.metadata,
+            INTERCHANGE_METADATA_KEY: json.dumps(metadata, default=str).encode(),
+        }
+    )
+
+
+def table_to_frame(table: "pa.Table") -> pd.DataFrame:
+    """Convert an Arrow table (or a slice of one) back to the frame it came from.
+
+    The list and struct columns are converted to Python lists and dicts,
+    as the mappers expect, rather than to numpy arrays. Only the rows of
+    the table are converted, so a slice of a memory-mapped table only
+    ever materialises its own rows.
+
+    :param pa.Table table: The table, as returned by `frame_to_table`.
+    :return pd.DataFrame: The frame, with a RangeIndex.
+    """
+    import pyarrow as pa
+
+    metadata = json.loads(
+        (table.schema.metadata or {}).get(INTERCHANGE_METADATA_KEY, b"{}")
+    )
+    nested_columns = [
+        field.name for field in table.schema if pa.types.is_nested(field.type)
+    ]
+
+    data = table.drop_columns(nested_columns).to_pandas()
+    for field in table.schema:
+        if field.name in nested_columns:
+            data.insert(
+                table.schema.get_field_index(field.name),
+                field.name,
+                pd.Series(table.column(field.name).to_pylist(), dtype=object),
+            )
+    for column in metadata.get("json_columns", []):
+        data[column] = pd.Series(
+            [json.loads(value) for value in data[column].tolist()],
+            dtype=object,
+            index=data.index,
+        )
+
+    data.attrs.update(metadata.get("attrs", {}))
+    return data
+
+
+def write_interchange(data: pd.DataFrame, interchange_file: str):
+    """Write a frame to an (uncompressed) Arrow IPC file.
+
+    :param pd.DataFrame data: The frame to write.
+    :param str interchange_file: The IPC filename.
+    """
+    import pyarrow as pa
+
+    table = frame_to_table(data)
+    with pa.OSFile(interchange_file, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def read_interchange(interchange_file: str, memory_map: bool = True) -> "pa.Table":
+    """Read the table of an Arrow IPC file, without converting it to a frame.
+
+    :param str interchange_file: The IPC filename.
+    :param bool memory_map: Whether to memory map the file, so the table
+        shares its buffers with every other process reading the file
+        rather than copying them. Defaults to True.
+    :return pa.Table: The table, see `table_to_frame`.
+    """
+    import pyarrow as pa
+
+    source: Any = (
+        pa.memory_map(interchange_file) if memory_map else pa.OSFile(interchange_file)
+    )
+    return pa.ipc.open_file(source).read_all()
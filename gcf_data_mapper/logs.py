@@ -0,0 +1,244 @@
+import json
+import logging
+import queue
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterator, Optional
+
+import click
+
+from gcf_data_mapper.enums.log import LogFormats, LogLevels
+
+logger = logging.getLogger("gcf_data_mapper")
+
+LOG_LEVELS = {
+    LogLevels.DEBUG.value: logging.DEBUG,
+    LogLevels.INFO.value: logging.INFO,
+    LogLevels.WARNING.value: logging.WARNING,
+    LogLevels.ERROR.value: logging.ERROR,
+}
+
+# While logging is set up, its settings, handler and (when the messages are written in
+# the background) queue listener. While empty, every message is echoed as it happens.
+_logging: dict[str, Any] = {}
+
+
+class JSONFormatter(logging.Formatter):
+    """Format each message as a JSON object on a single line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(
+            {
+                "time": datetime.fromtimestamp(
+                    record.created, timezone.utc
+                ).isoformat(),
+                "level": record.levelname.lower(),
+                "message": record.getMessage(),
+                **getattr(record, "fields", {}),
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+
+
+class RateLimitFilter(logging.Filter):
+    """Let through at most a number of messages with the same rate key.
+
+    Messages without a rate key are always let through, and the number
+    of messages held back per key are counted, along with any held back
+    by the filters of the worker processes.
+    """
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+        self.counts: Counter = Counter()
+        self.held_back_elsewhere: Counter = Counter()
+        self.taken: Counter = Counter()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate_key = getattr(record, "rate_key", None)
+        if rate_key is None:
+            return True
+        self.counts[rate_key] += 1
+        return self.counts[rate_key] <= self.limit
+
+    def suppressed(self) -> Counter:
+        return (
+            Counter(
+                {
+                    rate_key: count - self.limit
+                    for rate_key, count in self.counts.items()
+                    if count > self.limit
+                }
+            )
+            + self.held_back_elsewhere
+        )
+
+    def take_suppressed(self) -> Counter:
+        suppressed = self.suppressed()
+        taken = suppressed - self.taken
+        self.taken = suppressed
+        return taken
+
+
+def start_logging(
+    level: int = logging.INFO,
+    log_format: str = LogFormats.TEXT.value,
+    rate_limit: Optional[int] = None,
+    background: bool = True,
+):
+    """Write the messages through the logger rather than echoing them.
+
+    In the background, the messages are put on a queue and written to
+    stdout by a separate thread, so writing them never blocks the caller.
+
+    :param int level: The lowest level of the messages to write.
+    :param str log_format: The format to write the messages in, as plain
+        text or as JSON objects (one per line).
+    :param Optional[int] rate_limit: The most messages with the same rate
+        key (e.g. the rows skipped for the same reason) to write, the
+        rest are only counted. Defaults to None, which writes them all.
+    :param bool background: Whether to write the messages in a separate
+        thread, defaults to True.
+    """
+    stop_logging()
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(
+        JSONFormatter()
+        if log_format == LogFormats.JSON.value
+        else logging.Formatter("%(message)s")
+    )
+    if background:
+        _logging["listener"] = QueueListener(queue.SimpleQueue(), handler)
+        _logging["listener"].start()
+        handler = QueueHandler(_logging["listener"].queue)
+    if rate_limit is not None:
+        _logging["rate_limit"] = RateLimitFilter(rate_limit)
+        handler.addFilter(_logging["rate_limit"])
+
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    _logging["handler"] = handler
+    _logging["settings"] = {
+        "level": level,
+        "log_format": log_format,
+        "rate_limit": rate_limit,
+    }
+
+
+def stop_logging():
+    """Write out the queued messages, then go back to echoing the messages."""
+    if not _logging:
+        return
+
+    rate_limit = _logging.get("rate_limit")
+    if rate_limit is not None:
+        for rate_key, count in sorted(rate_limit.suppressed().items()):
+            logger.warning(
+                f"🔇 Held back {count} more message(s) about {rate_key}",
+                extra={"fields": {"rate_key": rate_key, "suppressed": count}},
+            )
+
+    logger.removeHandler(_logging["handler"])
+    if "listener" in _logging:
+        _logging["listener"].stop()
+    _logging.clear()
+
+
+@contextmanager
+def pausing_logging() -> Iterator[None]:
+    """Stop the thread writing out the messages for the length of the block.
+
+    Worker processes must be forked while it's stopped, as a forked
+    process could otherwise inherit a lock (e.g. of stdout) held by the
+    thread at that moment, and wait on it forever. The messages logged
+    meanwhile are queued, and written out once the block ends.
+    """
+    listener = _logging.get("listener")
+    if listener is None:
+        yield
+        return
+
+    listener.stop()
+    try:
+        yield
+    finally:
+        listener.start()
+
+
+def forget_logging():
+    """Drop the logging a forked worker process inherits, without writing anything.
+
+    The queue and rate limit counts belong to the main process, so the
+    worker starts logging afresh (see `start_logging`).
+    """
+    if "handler" in _logging:
+        logger.removeHandler(_logging["handler"])
+    _logging.clear()
+
+
+def take_suppressed() -> Counter:
+    """Take the number of messages held back per rate key since they were last taken.
+
+    :return Counter: The number of messages held back, e.g. by a worker
+        process, for the main process to add to its own (see
+        `add_suppressed`).
+    """
+    if "rate_limit" not in _logging:
+        return Counter()
+    return _logging["rate_limit"].take_suppressed()
+
+
+def add_suppressed(suppressed: Counter):
+    """Count messages held back elsewhere, e.g. by a worker process, as held back.
+
+    :param Counter suppressed: The number of messages held back per rate
+        key, as returned by `take_suppressed`.
+    """
+    if "rate_limit" in _logging:
+        _logging["rate_limit"].held_back_elsewhere.update(suppressed)
+
+
+def logging_settings() -> Optional[dict[str, Any]]:
+    """Get the settings logging was started with, to start it the same elsewhere.
+
+    :return Optional[dict[str, Any]]: The keyword arguments of
+        `start_logging`, or None while the messages are echoed.
+    """
+    return _logging.get("settings")
+
+
+def echo(
+    message: Any = "",
+    level: int = logging.INFO,
+    rate_key: Optional[str] = None,
+    **fields: Any,
+):
+    """Log a message, or echo it straight away while logging isn't started.
+
+    :param Any message: The message.
+    :param int level: The level of the message, defaults to INFO.
+    :param Optional[str] rate_key: The key of the messages the rate limit
+        applies to together, if any.
+    :param Any fields: Any data to add to the message in JSON format.
+    """
+    if not _logging:
+        click.echo(message)
+        return
+
+    if not logger.isEnabledFor(level):
+        return
+    # The blank lines separating the stages are left out of the JSON messages.
+    if (
+        isinstance(message, str)
+        and not message
+        and _logging["settings"]["log_format"] == LogFormats.JSON.value
+    ):
+        return
+    logger.log(level, message, extra={"fields": fields, "rate_key": rate_key})
@@ -0,0 +1,156 @@
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from gcf_data_mapper.logs import echo
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module, so no peak RSS either.
+    resource = None
+
+T = TypeVar("T")
+
+# The stages recorded since the last reset, in the order they finished.
+_stages: list[dict[str, Any]] = []
+
+
+def reset_metrics():
+    """Forget the stages recorded so far."""
+    _stages.clear()
+
+
+def get_metrics() -> list[dict[str, Any]]:
+    """Get the stages recorded since the last reset.
+
+    :return list[dict[str, Any]]: The stage name, wall time and CPU time
+        (seconds), peak RSS (MiB) and row count of each stage.
+    """
+    return [dict(stage) for stage in _stages]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of the process so far.
+
+    :return Optional[float]: The peak RSS in MiB, or None where the
+        platform can't report it.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports the peak in kilobytes, macOS in bytes.
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+def count_rows(result: Any) -> Optional[int]:
+    """Count the rows of a stage result, if it has a length.
+
+    :param Any result: The result of a stage.
+    :return Optional[int]: The number of rows, or None.
+    """
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+@contextmanager
+def record_stage(name: str) -> Iterator[dict[str, Any]]:
+    """Record the wall time, CPU time and peak RSS of a block of code.
+
+    The stage is recorded when the block exits, and the block can set
+    the "rows" of the stage it yields.
+
+    :param str name: The name of the stage.
+    :yield dict[str, Any]: The metrics of the stage.
+    """
+    stage: dict[str, Any] = {"stage": name, "rows": None}
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield stage
+    finally:
+        stage["wall_seconds"] = round(time.perf_counter() - wall_start, 4)
+        stage["cpu_seconds"] = round(time.process_time() - cpu_start, 4)
+        stage["peak_rss_mb"] = peak_rss_mb()
+        _stages.append(stage)
+
+
+def measure(name: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call a function as a recorded stage, counting the rows it returns.
+
+    :param str name: The name of the stage.
+    :param Callable[..., T] func: The function to call.
+    :return T: The result of the function.
+    """
+    with record_stage(name) as stage:
+        result = func(*args, **kwargs)
+        stage["rows"] = count_rows(result)
+    return result
+
+
+def measure_iter(
+    name: str, func: Callable[..., Iterator[T]], *args: Any, **kwargs: Any
+) -> Iterator[T]:
+    """Lazily iterate the items a function returns as a recorded stage.
+
+    Only the time spent calling the function and producing each item
+    counts towards the stage, which is recorded once the items run out.
+
+    :param str name: The name of the stage.
+    :param Callable[..., Iterator[T]] func: The function returning the
+        items.
+    :yield T: The items the function returns.
+    """
+    stage: dict[str, Any] = {"stage": name, "rows": 0}
+    wall_seconds = cpu_seconds = 0.0
+    items = None
+    while True:
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            if items is None:
+                items = iter(func(*args, **kwargs))
+            item = next(items)
+        except StopIteration:
+            break
+        finally:
+            wall_seconds += time.perf_counter() - wall_start
+            cpu_seconds += time.process_time() - cpu_start
+        stage["rows"] += 1
+        yield item
+
+    stage["wall_seconds"] = round(wall_seconds, 4)
+    stage["cpu_seconds"] = round(cpu_seconds, 4)
+    stage["peak_rss_mb"] = peak_rss_mb()
+    _stages.append(stage)
+
+
+def echo_metrics(stages: list[dict[str, Any]]):
+    """Print a summary table of the recorded stages.
+
+    :param list[dict[str, Any]] stages: The recorded stages.
+    """
+    echo("📊 Stage metrics:")
+    echo(
+        f"  {'Stage':<22} {'Wall (s)':>9} {'CPU (s)':>9} {'Peak RSS (MiB)':>15} "
+        f"{'Rows':>9}"
+    )
+    for stage in stages:
+        peak = stage["peak_rss_mb"]
+        rows = stage["rows"]
+        echo(
+            f"  {stage['stage']:<22} {stage['wall_seconds']:>9.3f} "
+            f"{stage['cpu_seconds']:>9.3f} {'-' if peak is None else peak:>15} "
+            f"{'-' if rows is None else rows:>9}"
+        )
+
+
+def write_metrics(stages: list[dict[str, Any]], metrics_file: str):
+    """Write the recorded stages to a JSON file.
+
+    :param list[dict[str, Any]] stages: The recorded stages.
+    :param str metrics_file: The metrics filename.
+    """
+    with open(metrics_file, "w", encoding="utf-8") as f:
+        json.dump({"stages": stages}, f, indent=2)
@@ -0,0 +1,300 @@
+import heapq
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+from gcf_data_mapper.clock import get_reference_time, set_reference_time
+from gcf_data_mapper.enums.family import FamilyColumnsNames
+from gcf_data_mapper.interchange import (
+    read_interchange,
+    table_to_frame,
+    write_interchange,
+)
+from gcf_data_mapper.logs import (
+    add_suppressed,
+    echo,
+    forget_logging,
+    logging_settings,
+    pausing_logging,
+    start_logging,
+    take_suppressed,
+)
+from gcf_data_mapper.metrics import record_stage
+from gcf_data_mapper.parsers.document import map_labelled_documents
+from gcf_data_mapper.parsers.event import map_labelled_events
+from gcf_data_mapper.parsers.family import map_labelled_families
+from gcf_data_mapper.parsers.helpers import reference_keys
+from gcf_data_mapper.rejections import (
+    collecting_rejections,
+    flush_rejections,
+    record_rejections,
+    rejection_order,
+    sort_rejections,
+    start_rejections,
+    take_rejections,
+)
+
+ENTITY_TYPES = ["families", "documents", "events"]
+
+# The number of shards each worker gets on average, so that a slow shard doesn't leave
+# the other workers idle.
+SHARDS_PER_WORKER = 4
+
+# The input frames (and the positions of the rows in each shard) shared with every
+# worker process. These are set once per worker when the pool starts, so each task
+# only has to send the number of its shard. The frames may instead be memory-mapped
+# Arrow tables, with the rows of each shard starting at its offset.
+_shared_frames: dict[str, Any] = {}
+
+
+def share_frames(
+    project_info: Optional[pd.DataFrame],
+    doc_info: Optional[pd.DataFrame],
+    project_shards: list[np.ndarray],
+    doc_shards: list[np.ndarray],
+    reference_time: datetime,
+    collect_rejections: bool = False,
+    log_settings: Optional[dict[str, Any]] = None,
+    interchange_files: Optional[dict[str, str]] = None,
+) -> None:
+    """Make the input frames available to the mapping tasks of a worker.
+
+    :param Optional[pd.DataFrame] project_info: The GCF and MCF joined
+        project info, unless it's in the interchange files.
+    :param Optional[pd.DataFrame] doc_info: The MCF docs info, unless
+        it's in the interchange files.
+    :param list[np.ndarray] project_shards: The positions of the project
+        rows in each shard.
+    :param list[np.ndarray] doc_shards: The positions of the document
+        rows in each shard.
+    :param datetime reference_time: The time the project statuses are
+        calculated against, the same in every worker.
+    :param bool collect_rejections: Whether to collect the skipped rows,
+        to be written by the main process, rather than echo them.
+    :param Optional[dict[str, Any]] log_settings: The settings logging
+        was started with in the main process, if it was.
+    :param Optional[dict[str, str]] interchange_files: The Arrow IPC
+        files holding the "projects" and "documents" in shard order, as
+        written by `write_shard_interchange`, to memory map rather than
+        using the frames.
+    """
+    if log_settings is not None:
+        # A forked worker inherits the queue of the main process, but not the thread
+        # writing it out, so its messages are written straight away instead. The
+        # messages its rate limit holds back are counted by the main process.
+        forget_logging()
+        start_logging(**{**log_settings, "background": False})
+    set_reference_time(reference_time)
+    if collect_rejections:
+        start_rejections()
+    _shared_frames["projects"] = project_info
+    _shared_frames["documents"] = doc_info
+    _shared_frames["project_shards"] = project_shards
+    _shared_frames["doc_shards"] = doc_shards
+    for name, shards in [("projects", project_shards), ("documents", doc_shards)]:
+        if interchange_files is not None:
+            _shared_frames[name] = read_interchange(interchange_files[name])
+        _shared_frames[f"{name}_offsets"] = np.cumsum([0, *map(len, shards)])
+
+
+def write_shard_interchange(
+    project_info: pd.DataFrame,
+    doc_info: pd.DataFrame,
+    project_shards: list[np.ndarray],
+    doc_shards: list[np.ndarray],
+    interchange_dir: str,
+) -> dict[str, str]:
+    """Write the input frames to Arrow IPC files, for the workers to memory map.
+
+    The rows are written in shard order, so the rows of each shard are a
+    zero-copy slice of the table, and only they are converted back to a
+    frame by the worker mapping the shard.
+
+    :param pd.DataFrame project_info: The GCF and MCF joined project
+        info.
+    :param pd.DataFrame doc_info: The MCF docs info.
+    :param list[np.ndarray] project_shards: The positions of the project
+        rows in each shard.
+    :param list[np.ndarray] doc_shards: The positions of the document
+        rows in each shard.
+    :param str interchange_dir: The directory to write the files to.
+    :return dict[str, str]: The filename of the "projects" and
+        "documents" tables.
+    """
+    interchange_files = {}
+    for name, data, shards in [
+        ("projects", project_info, project_shards),
+        ("documents", doc_info, doc_shards),
+    ]:
+        interchange_files[name] = os.path.join(interchange_dir, f"{name}.arrow")
+        write_interchange(data.iloc[np.concatenate(shards)], interchange_files[name])
+    return interchange_files
+
+
+def shard_frame(name: str, shard: int, positions: np.ndarray) -> pd.DataFrame:
+    """Get the rows of a shard of one of the shared frames.
+
+    :param str name: The name of the frame, "projects" or "documents".
+    :param int shard: The number of the shard.
+    :param np.ndarray positions: The positions of the rows of the shard.
+    :return pd.DataFrame: The rows, labelled with their position in the
+        full frame.
+    """
+    data = _shared_frames[name]
+    if isinstance(data, pd.DataFrame):
+        rows = data.iloc[positions]
+    else:
+        start = _shared_frames[f"{name}_offsets"][shard]
+        rows = table_to_frame(data.slice(start, len(positions)))
+    return rows.set_axis(positions)
+
+
+def shard_by_reference(references: pd.Series, n_shards: int) -> list[np.ndarray]:
+    """Split the rows into shards by their ApprovedRef (or FP number).
+
+    Every row sharing a reference ends up in the same shard, so the event
+    counter of each family and the join of the documents onto their
+    projects only ever need the rows of a single shard.
+
+    :param pd.Series references: The reference of each row.
+    :param int n_shards: The number of shards to split the rows into.
+    :return list[np.ndarray]: The positions of the rows in each shard, in
+        their original order.
+    """
+    hashes = pd.util.hash_pandas_object(
+        reference_keys(references), index=False
+    ).to_numpy()
+    shards = (hashes % np.uint64(n_shards)).astype(np.intp)
+
+    positions = np.argsort(shards, kind="stable")
+    shard_sizes = np.bincount(shards, minlength=n_shards)
+    return np.split(positions, np.cumsum(shard_sizes)[:-1])
+
+
+def map_shard(shard: int) -> dict[str, list[tuple[Hashable, dict[str, Any]]]]:
+    """Map the projects and documents of a shard to families, documents and events.
+
+    :param int shard: The number of the shard to map.
+    :return dict[str, list[tuple[Hashable, dict[str, Any]]]]: The mapped
+        entities of each type, paired with the position of the row they
+        were mapped from, the rows skipped while collecting them
+        ("rejections", sorted, see `sort_rejections`) and the number of
+        messages held back by the rate limit ("suppressed").
+    """
+    # Label the rows with their position in the full frames so the results of all the
+    # shards can be merged back into their original order.
+    projects = shard_frame("projects", shard, _shared_frames["project_shards"][shard])
+    docs = shard_frame("documents", shard, _shared_frames["doc_shards"][shard])
+
+    return {
+        "families": map_labelled_families(projects, debug=False),
+        "documents": list(map_labelled_documents(projects, docs, debug=False)),
+        "events": map_labelled_events(projects, debug=False),
+        "rejections": sort_rejections(take_rejections()),
+        "suppressed": take_suppressed(),
+    }
+
+
+def map_in_parallel(
+    project_info: pd.DataFrame,
+    doc_info: pd.DataFrame,
+    debug: bool,
+    workers: int,
+    arrow_interchange: bool = False,
+) -> dict[str, list[Optional[dict[str, Any]]]]:
+    """Map the families, documents and events across a pool of processes.
+
+    The projects and documents are partitioned into shards by their
+    reference, and each shard is mapped by a worker. The results of all
+    the shards are then merged back into the original row order, so the
+    output is identical to mapping them in a single process.
+
+    :param pd.DataFrame project_info: The GCF and MCF joined project
+        info.
+    :param pd.DataFrame doc_info: The MCF docs info.
+    :param bool debug: Whether debug mode is on.
+    :param int workers: The number of worker processes to use.
+    :param bool arrow_interchange: Whether to share the frames with the
+        workers as memory-mapped Arrow IPC files (which needs pyarrow
+        installed), rather than with the pool initialiser. Defaults to
+        False.
+    :return dict[str, list[Optional[dict[str, Any]]]]: The mapped
+        families, documents and events.
+    """
+    n_shards = workers * SHARDS_PER_WORKER
+    project_shards = shard_by_reference(
+        project_info[FamilyColumnsNames.APPROVED_REF.value], n_shards
+    )
+    doc_shards = shard_by_reference(doc_info["FP number"], n_shards)
+
+    if debug:
+        echo(
+            f"📝 Mapping GCF data in {n_shards} shards across {workers} worker processes.",
+            level=logging.DEBUG,
+        )
+
+    with tempfile.TemporaryDirectory(prefix="gcf_data_mapper.") as interchange_dir:
+        frames: tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]] = (
+            project_info,
+            doc_info,
+        )
+        interchange_files = None
+        if arrow_interchange:
+            with record_stage("write_interchange"):
+                interchange_files = write_shard_interchange(
+                    project_info, doc_info, project_shards, doc_shards, interchange_dir
+                )
+            frames = (None, None)
+
+        # The pool forks with nothing buffered for the rejections file, and no thread
+        # writing out the messages.
+        flush_rejections()
+        with (
+            pausing_logging(),
+            ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=share_frames,
+                initargs=(
+                    *frames,
+                    project_shards,
+                    doc_shards,
+                    get_reference_time(),
+                    collecting_rejections(),
+                    logging_settings(),
+                    interchange_files,
+                ),
+            ) as executor,
+        ):
+            shard_results = list(executor.map(map_shard, range(n_shards)))
+
+    for result in shard_results:
+        add_suppressed(result["suppressed"])
+
+    # The rejections are labelled with the position of their row too, so they're
+    # merged back into the order a single process rejects them in.
+    if collecting_rejections():
+        record_rejections(
+            list(
+                heapq.merge(
+                    *(result["rejections"] for result in shard_results),
+                    key=rejection_order,
+                )
+            )
+        )
+
+    return {
+        entity_type: [
+            entity
+            for _, entity in heapq.merge(
+                *(result[entity_type] for result in shard_results), key=itemgetter(0)
+            )
+        ]
+        for entity_type in ENTITY_TYPES
+    }
@@ -1,6 +1,7 @@
+import logging
 from typing import Any, Optional
 
-import click
+from gcf_data_mapper.logs import echo
 
 
 def collection(debug: bool) -> list[Optional[dict[str, Any]]]:
@@ -15,6 +16,6 @@ def collection(debug: bool) -> list[Optional[dict[str, Any]]]:
         Sheet.
     """
     if debug:
-        click.echo("📝 No GCF collection data to wrangle.")
+        echo("📝 No GCF collection data to wrangle.", level=logging.DEBUG)
 
     return []
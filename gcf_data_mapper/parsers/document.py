@@ -1,8 +1,10 @@
+import logging
 import os
-from typing import Any, Optional, cast
+import re
+from typing import Any, Hashable, Iterator, Optional, cast
 from urllib.parse import urlparse
 
-import click
+import numpy as np
 import pandas as pd
 
 from gcf_data_mapper.enums.document import (
@@ -11,15 +13,41 @@ from gcf_data_mapper.enums.document import (
     RequiredDocumentColumns,
     RequiredFamilyDocumentColumns,
     TranslatedDocumentColumns,
+    TranslatedUrlVerdicts,
 )
+from gcf_data_mapper.enums.rejection import RejectionRules
+from gcf_data_mapper.logs import echo
 from gcf_data_mapper.parsers.helpers import (
-    check_required_column_value_not_na,
-    strip_nested,
+    ensure_normalised,
+    strip_column,
     verify_required_fields_present,
 )
+from gcf_data_mapper.parsers.validation import (
+    ValidationRule,
+    enum_columns,
+    failed_columns,
+    missing_values,
+    validate_frame,
+)
+from gcf_data_mapper.rejections import reject
 
 SUPPORTED_FILE_EXTENSIONS = [".pdf", ".html", ".docx", ".doc"]
 
+# Any character of a url path that is neither alphanumeric nor one of the reserved and
+# unreserved characters per RFC 3986 (\w is alphanumeric or _, as _ is unreserved).
+INVALID_PATH_CHARACTER = re.compile(r"[^\w:/?#\[\]@!$&'()*+,;=\-.~]")
+
+# The document columns the mapped documents are built from that may be missing (and so
+# be rendered by their type), which are typed once rather than every column of every
+# chunk. A missing translated files value is rendered as "<NA>", which is rejected.
+TYPED_DOCUMENT_COLUMNS = [
+    RequiredDocumentColumns.ID.value,
+    TranslatedDocumentColumns.TRANSLATED_FILES.value,
+]
+
+# The number of documents joined to their projects and mapped at a time.
+DOCUMENT_CHUNK_SIZE = 10**4
+
 
 def contains_duplicate_urls(urls: list[str]) -> bool:
     """Check a list of urls for any duplicate entries.
@@ -53,48 +81,109 @@ def contains_invalid_paths(urls: list[str]) -> bool:
     return bool: Returns true if malformed urls are present, or false
         if not
     """
-    for url in urls:
-        parsed_url = urlparse(url)
-        path = parsed_url.path
-        # Reserved and unreserved characters per RFC 3986
-        reserved_and_unreserved_characters = ":/?#[]@!$&'()*+,;=-_.~"
-        if any(
-            not (c.isalnum() or c in reserved_and_unreserved_characters) for c in path
-        ):
-            return True
+    return any(INVALID_PATH_CHARACTER.search(urlparse(url).path) for url in urls)
+
+
+def url_verdict(urls: list[str]) -> TranslatedUrlVerdicts:
+    """Give the verdict on a list of urls.
+
+    param: list[str] urls: A list of urls
+    return TranslatedUrlVerdicts: The first of the empty, duplicate and
+        malformed checks the urls fail, or VALID.
+    """
+    if contains_empty_urls(urls):
+        return TranslatedUrlVerdicts.EMPTY
+    if contains_duplicate_urls(urls):
+        return TranslatedUrlVerdicts.DUPLICATE
+    if contains_invalid_paths(urls):
+        return TranslatedUrlVerdicts.MALFORMED
+    return TranslatedUrlVerdicts.VALID
+
+
+def url_verdict_message(verdict: TranslatedUrlVerdicts, doc_id: str) -> str:
+    return f"🛑 {verdict.value} in list of translated urls. DocumentId : {doc_id}"
+
+
+def echo_url_verdict(verdict: TranslatedUrlVerdicts, doc_id: str) -> bool:
+    """Report the translated urls of a document if they're invalid.
+
+    param: TranslatedUrlVerdicts verdict: The verdict on the urls.
+    param: str doc_id: The document id of the urls.
+    return bool: True if the urls are valid, False otherwise.
+    """
+    if verdict is TranslatedUrlVerdicts.VALID:
+        return True
+    echo(url_verdict_message(verdict, doc_id), level=logging.WARNING)
     return False
 
 
 def validate_urls(urls: list[str], doc_id: str) -> bool:
     """Validate a list of URLs for empty, duplicate, & malformed entries.
 
-    TODO can we use Pydantic for this?
-
     param: list[str] urls : A list of urls
     param: str doc_id: The document id of the invalid source urls
-    raises ValueError: If the list contains duplicate, empty or,
-        malformed urls
-    return bool: None if one or more of the URls for the given document
+    return bool: False if one or more of the URls for the given document
         ID are invalid, otherwise True.
     """
-    if contains_empty_urls(urls):
-        click.echo(
-            f"🛑 Empty URL found in list of translated urls. DocumentId : {doc_id}"
-        )
-        return False
+    return echo_url_verdict(url_verdict(urls), doc_id)
 
-    if contains_duplicate_urls(urls):
-        click.echo(
-            f"🛑 Duplicate URLs found in list of translated urls. DocumentId : {doc_id}"
-        )
-        return False
 
-    if contains_invalid_paths(urls):
-        click.echo(
-            f"🛑 Malformed url found in list of translated urls. DocumentId : {doc_id}"
-        )
-        return False
-    return True
+def translated_url_verdicts(gcf_docs: pd.DataFrame) -> pd.Series:
+    """Give the verdict on the translated urls of every document at once.
+
+    The translated files of the documents are split into their urls in
+    one pass, and every url is checked against INVALID_PATH_CHARACTER in
+    another. Only the (rare) urls with an invalid character anywhere are
+    parsed to check whether it's in their path, as a url with no invalid
+    characters can't have an invalid path.
+
+    :param pd.DataFrame gcf_docs: The GCF document data in a df.
+    :return pd.Series: The same verdict `url_verdict` gives on the
+        translated urls of each document, or None for the documents
+        without translations.
+    """
+    verdicts = pd.Series(
+        np.full(gcf_docs.shape[0], None, dtype=object), index=gcf_docs.index
+    )
+    positions = np.flatnonzero(
+        gcf_docs[TranslatedDocumentColumns.TRANSLATED_TITLES.value].notna().to_numpy()
+    )
+    if len(positions) == 0:
+        return verdicts
+
+    translated_files = strip_column(
+        gcf_docs[TranslatedDocumentColumns.TRANSLATED_FILES.value].iloc[positions]
+    )
+    urls = (
+        pd.Series(translated_files.astype(str).to_numpy(dtype=object), index=positions)
+        .str.split("|")
+        .explode()
+    )
+
+    empty = urls.str.strip().eq("")
+    duplicate = pd.Series(
+        pd.DataFrame({"document": urls.index, "url": urls.str.lower().to_numpy()})
+        .duplicated(keep="first")
+        .to_numpy(),
+        index=urls.index,
+    )
+    malformed = urls.str.contains(INVALID_PATH_CHARACTER).to_numpy(dtype=bool)
+    malformed[malformed] = [
+        contains_invalid_paths([url]) for url in urls[malformed].tolist()
+    ]
+    malformed = pd.Series(malformed, index=urls.index)
+
+    checks = [
+        (TranslatedUrlVerdicts.EMPTY, empty),
+        (TranslatedUrlVerdicts.DUPLICATE, duplicate),
+        (TranslatedUrlVerdicts.MALFORMED, malformed),
+    ]
+    verdicts.iloc[positions] = np.select(
+        [failed.groupby(level=0).any().to_numpy() for _, failed in checks],
+        [verdict for verdict, _ in checks],
+        default=TranslatedUrlVerdicts.VALID,
+    )
+    return verdicts
 
 
 def has_translated_files(row: pd.Series) -> bool:
@@ -140,11 +229,15 @@ def map_document_metadata(
 
 def map_translated_files(
     translated_files_row: pd.Series,
+    verdict: Optional[TranslatedUrlVerdicts] = None,
 ) -> Optional[list[dict[str, Any]]]:
     """Map the GCF document with translated versions into JSON.
 
     :param pd.Series translated_files_row: A row from the DataFrame
         containing the 'Translated files' field.
+    :param Optional[TranslatedUrlVerdicts] verdict: The verdict on the
+        translated urls, as given by `translated_url_verdicts`. The urls
+        are validated here if it isn't given.
     :return Optional[list[dict]]: A list of gcf document objects, each
         with a different source url reflecting the translated version of
         the original document. Returns None if one or more of the URLs
@@ -157,7 +250,22 @@ def map_translated_files(
     ).split("|")
     doc_id = translated_files_row.at[RequiredDocumentColumns.ID.value]
 
-    if validate_urls(url_docs, doc_id) is False:
+    if verdict is None:
+        verdict = url_verdict(url_docs)
+    if verdict is not TranslatedUrlVerdicts.VALID:
+        reject(
+            "documents",
+            RejectionRules.INVALID_TRANSLATED_URLS,
+            url_verdict_message(verdict, doc_id),
+            {"document_id": doc_id},
+            {
+                "problem": verdict.value,
+                "translated_files": translated_files_row[
+                    TranslatedDocumentColumns.TRANSLATED_FILES.value
+                ],
+            },
+            row=translated_files_row.name,
+        )
         return None
 
     for url in url_docs:
@@ -171,66 +279,235 @@ def map_translated_files(
     return mapped_documents
 
 
-def process_row(row: pd.Series, debug: bool) -> Optional[list[dict[str, Any]]]:
-    """Process a single row of document data.
+def document_extension(source_url: str) -> str:
+    _, ext = os.path.splitext(source_url)
+    return ext
 
-    :param pd.Series row: The row of data to process (corresponds to a
-        GCF document entry).
-    :param bool debug: Whether debug mode is on.
-    :return list[Optional[dict[str, Any]]]: A list of GCF documents in
-        the 'destination' format described in the GCF Data Mapper Google
-        Sheet.
-    """
-    row = cast(pd.Series, row.apply(strip_nested))
 
-    doc_id = (
-        row.at[RequiredDocumentColumns.ID.value]
-        if RequiredDocumentColumns.ID.value in row.index
-        and pd.notna(row.at[RequiredDocumentColumns.ID.value])
-        else None
-    )
+def unsupported_file_extensions(source_urls: pd.DataFrame) -> pd.DataFrame:
+    """Check for source urls whose file extension isn't supported.
 
-    if not check_required_column_value_not_na(row, RequiredFamilyDocumentColumns):
-        click.echo(f"🛑 Skipping row with missing required family columns: {doc_id}")
-        return None
+    :param pd.DataFrame source_urls: The source urls to check.
+    :return pd.DataFrame: True for every url with an unsupported file
+        extension, leaving out the missing urls.
+    """
+    extensions = source_urls.map(
+        lambda url: document_extension(url).lower(), na_action="ignore"
+    )
+    return source_urls.notna() & ~extensions.isin(SUPPORTED_FILE_EXTENSIONS)
+
+
+# The rules a document must follow to be mapped, in the order they're checked.
+DOCUMENT_RULES = [
+    ValidationRule(
+        RejectionRules.MISSING_FAMILY_COLUMNS,
+        enum_columns(RequiredFamilyDocumentColumns),
+        missing_values,
+    ),
+    ValidationRule(
+        RejectionRules.MISSING_DOCUMENT_COLUMNS,
+        enum_columns(RequiredDocumentColumns),
+        missing_values,
+    ),
+    ValidationRule(
+        RejectionRules.UNSUPPORTED_FILE_EXTENSION,
+        [RequiredDocumentColumns.SOURCE_URL.value],
+        unsupported_file_extensions,
+    ),
+]
+
+# The kind of columns a document is missing, by the rule it breaks.
+MISSING_COLUMNS_KINDS = {
+    RejectionRules.MISSING_FAMILY_COLUMNS: "family",
+    RejectionRules.MISSING_DOCUMENT_COLUMNS: "document",
+}
+
+
+def reject_document(data: pd.DataFrame, validation: dict[str, Any], position: int):
+    """Report a document that breaks one of the DOCUMENT_RULES.
+
+    :param pd.DataFrame data: The documents.
+    :param dict[str, Any] validation: The documents validated against the
+        DOCUMENT_RULES, as returned by `validate_frame`.
+    :param int position: The position of the document.
+    """
+    rule = validation["broken_rules"][position]
+
+    def value(column: RequiredDocumentColumns) -> Any:
+        # The values are converted to Python scalars, as they are in the mapped rows.
+        cell = data[column.value].iat[position]
+        return cell.item() if isinstance(cell, np.generic) else cell
+
+    doc_id = value(RequiredDocumentColumns.ID)
+    if pd.isna(doc_id):
+        doc_id = None
+    ids = {"document_id": doc_id}
+
+    if rule in MISSING_COLUMNS_KINDS:
+        reject(
+            "documents",
+            rule,
+            f"🛑 Skipping row with missing required {MISSING_COLUMNS_KINDS[rule]} columns: {doc_id}",
+            ids,
+            {"empty_columns": failed_columns(validation, position)},
+            row=data.index[position],
+        )
+        return
+
+    source_url = value(RequiredDocumentColumns.SOURCE_URL)
+    reject(
+        "documents",
+        rule,
+        f"🛑 Skipping row as [{document_extension(source_url)}] is not a valid file ext. Project ID: {doc_id}",
+        ids,
+        {"source_url": source_url},
+        row=data.index[position],
+    )
 
-    if not check_required_column_value_not_na(row, RequiredDocumentColumns):
-        click.echo(f"🛑 Skipping row with missing required document columns: {doc_id}")
-        return None
 
-    source_url = row.at[RequiredDocumentColumns.SOURCE_URL.value]
-    _, ext = os.path.splitext(source_url)
-    if ext.lower() not in SUPPORTED_FILE_EXTENSIONS:
-        click.echo(
-            f"🛑 Skipping row as [{ext}] is not a valid file ext. Project ID: {doc_id}"
-        )
-        return None
+def map_document_row(
+    row: pd.Series, verdict: Optional[TranslatedUrlVerdicts] = None
+) -> list[dict[str, Any]]:
+    """Map a row of document data that follows the DOCUMENT_RULES.
 
+    :param pd.Series row: The row of data to map (corresponds to a GCF
+        document entry).
+    :param Optional[TranslatedUrlVerdicts] verdict: The verdict on the
+        translated urls of the row, if they've been validated already.
+    :return list[dict[str, Any]]: The original document and, where its
+        translated urls are valid, its translations.
+    """
     mapped_docs = [map_document_metadata(row, DocumentVariantNames.ORIGINAL.value)]
     if has_translated_files(row):
-        translated_docs = map_translated_files(row)
+        translated_docs = map_translated_files(row, verdict)
         if translated_docs is not None:
             mapped_docs.extend(translated_docs)
 
     return mapped_docs
 
 
-def document(
-    projects_data: pd.DataFrame, gcf_docs: pd.DataFrame, debug: bool
-) -> list[Optional[dict[str, Any]]]:
-    """Map the GCF document info to new structure.
+def build_project_index(projects_data: pd.DataFrame) -> pd.DataFrame:
+    """Build the index used to look up the project keys of a document.
+
+    Only the ApprovedRef and ProjectsID columns are needed to associate a
+    document with its family, so the (heavy) remaining project columns
+    are left out of the index entirely.
+
+    :param pd.DataFrame projects_data: The MCF and GCF project data,
+        joined on FP num.
+    :return pd.DataFrame: The ApprovedRef and ProjectsID columns, as
+        nullable string and Int64 columns so a missing ProjectsID doesn't
+        make the IDs floats, indexed by ApprovedRef.
+    """
+    project_keys = ensure_normalised(
+        projects_data[[e.value for e in RequiredFamilyDocumentColumns]]
+    ).convert_dtypes()
+    project_keys.index = pd.Index(
+        project_keys[RequiredFamilyDocumentColumns.APPROVED_REF.value].to_numpy()
+    )
+    return project_keys
+
+
+def join_project_keys(
+    gcf_docs: pd.DataFrame, project_index: pd.DataFrame
+) -> pd.DataFrame:
+    """Left join the project keys onto the given documents.
+
+    :param pd.DataFrame gcf_docs: The GCF document data in a df.
+    :param pd.DataFrame project_index: The project keys, as returned by
+        `build_project_index`.
+    :return pd.DataFrame: The documents with the ApprovedRef and
+        ProjectsID of their project, which are NA where a document has no
+        matching project.
+    """
+    if not project_index.index.is_unique:
+        # A reference shared by several projects gives one row per project.
+        return gcf_docs.join(project_index, on="FP number", how="left")
+
+    project_keys = project_index.reindex(gcf_docs["FP number"].to_numpy())
+    project_keys.index = gcf_docs.index
+    return pd.concat([gcf_docs, project_keys], axis=1)
+
+
+def map_document_chunks(
+    gcf_docs: pd.DataFrame,
+    project_index: pd.DataFrame,
+    debug: bool,
+    chunk_size: int = DOCUMENT_CHUNK_SIZE,
+) -> Iterator[tuple[Hashable, dict[str, Any]]]:
+    """Map the GCF documents chunk by chunk.
+
+    :param pd.DataFrame gcf_docs: The GCF document data in a df.
+    :param pd.DataFrame project_index: The project keys, as returned by
+        `build_project_index`.
+    :param bool debug: Whether debug mode is on, in which case each
+        chunk is logged as it's mapped.
+    :param int chunk_size: The number of documents to map at a time.
+    :return Iterator[tuple[Hashable, dict[str, Any]]]: The GCF documents
+        in the 'destination' format described in the GCF Data Mapper
+        Google Sheet, each paired with the index label of the document
+        row it was mapped from.
+    """
+    for start in range(0, gcf_docs.shape[0], chunk_size):
+        if debug:
+            end = min(start + chunk_size, gcf_docs.shape[0])
+            echo(
+                f"📊 Mapping GCF documents {start + 1} to {end}...",
+                level=logging.DEBUG,
+            )
+
+        # The key columns are typed once up front (see `build_project_index`), so the
+        # ProjectsID of the documents without a project doesn't make it a float.
+        # The documents are matched to their project by their FP number as read, and
+        # only stripped once they're joined.
+        chunk = ensure_normalised(
+            join_project_keys(gcf_docs.iloc[start : start + chunk_size], project_index)
+        )
+        validation = validate_frame(chunk, DOCUMENT_RULES)
+        valid_rows = zip(
+            chunk[validation["valid"]].iterrows(),
+            translated_url_verdicts(chunk[validation["valid"]]).tolist(),
+            strict=True,
+        )
+
+        # Only the valid rows are mapped, the others are rejected in between them so
+        # the rejections come in the order of the rows.
+        for position, broken_rule in enumerate(validation["broken_rules"].tolist()):
+            if broken_rule is not None:
+                reject_document(chunk, validation, position)
+                continue
+
+            (label, row), verdict = next(valid_rows)
+            for mapped_doc in map_document_row(row, verdict):
+                yield label, mapped_doc
+
+
+def map_labelled_documents(
+    projects_data: pd.DataFrame,
+    gcf_docs: pd.DataFrame,
+    debug: bool,
+    chunk_size: int = DOCUMENT_CHUNK_SIZE,
+) -> Iterator[tuple[Hashable, dict[str, Any]]]:
+    """Map the GCF document info to new structure, one document at a time.
+
+    The required columns are verified straight away, whereas the
+    documents themselves are only mapped as the iterator is consumed, so
+    peak memory scales with the chunk size rather than the number of
+    documents.
 
     :param pd.DataFrame projects_data: The MCF and GCF project data,
         joined on FP num.
     :param pd.DataFrame gcf_docs: The GCF document data in a df.
     :param bool debug: Whether debug mode is on.
-    :return list[Optional[dict[str, Any]]]: A list of GCF documents in
-        the 'destination' format described in the GCF Data Mapper Google
-        Sheet, or an empty list.
+    :param int chunk_size: The number of documents to map at a time.
+    :return Iterator[tuple[Hashable, dict[str, Any]]]: The GCF documents
+        in the 'destination' format described in the GCF Data Mapper
+        Google Sheet, each paired with the index label of the document
+        row it was mapped from.
     """
 
     if debug:
-        click.echo("📝 Wrangling GCF document data.")
+        echo("📝 Wrangling GCF document data.", level=logging.DEBUG)
 
     verify_required_fields_present(
         gcf_docs, {str(e.value) for e in RequiredDocumentColumns}
@@ -242,50 +519,77 @@ def document(
         projects_data, {str(e.value) for e in RequiredFamilyDocumentColumns}
     )
 
-    # Left join the document data with the GCF projects data so we can determine the
-    # project a document should be associated with. We then need to filter out certain
-    # GCF document types for now until Phase 2, TODO.After this, convert the values
-    # in the Projects ID column to be integers so we don't end up with 5 parts to our
-    # import IDs (as there is full stop in float values when they're converted to str).
-    combo = pd.merge(
-        left=gcf_docs,
-        right=projects_data,
-        left_on="FP number",
-        right_on=RequiredFamilyDocumentColumns.APPROVED_REF.value,
-        how="left",
-    ).convert_dtypes()
+    # Each document is associated with its project through an index of the project
+    # keys, rather than a left join of the whole project data. We then need to filter
+    # out certain GCF document types for now until Phase 2, TODO.
+    project_index = build_project_index(projects_data)
+    gcf_docs = gcf_docs.copy(deep=False)
+    gcf_docs[TYPED_DOCUMENT_COLUMNS] = gcf_docs[TYPED_DOCUMENT_COLUMNS].convert_dtypes()
 
     if debug:
-        click.echo(f"📊 {combo.shape[0]} GCF documents in file...")
+        echo(f"📊 {gcf_docs.shape[0]} GCF documents in file...", level=logging.DEBUG)
 
-    combo = combo[
-        ~combo[RequiredDocumentColumns.TYPE.value].isin(
+    gcf_docs = gcf_docs[
+        ~gcf_docs[RequiredDocumentColumns.TYPE.value].isin(
             [e.value for e in IgnoreDocumentTypes]
         )
     ]
 
     if debug:
-        click.echo(f"📊 Mapping {combo.shape[0]} GCF documents in phase 1...")
-
-    # Iterate through each document record to create a document object to append to our
-    # master list of documents. If the field in the 'TRANSLATED_TITLES' column is not NA
-    # we will map a separate object for each of the translated versions of the current
-    # document, using the translated url as the source url. We then create a document
-    # object for each translated document and add those translated doc objects to our
-    # list.
+        echo(
+            f"📊 Mapping {gcf_docs.shape[0]} GCF documents in phase 1...",
+            level=logging.DEBUG,
+        )
+
+    # Map each document record to a document object. If the field in the
+    # 'TRANSLATED_TITLES' column is not NA we will map a separate object for each of
+    # the translated versions of the current document, using the translated url as
+    # the source url.
     #
-    # The block of code inside the for loop will not raise errors where data validation
-    # fails, instead the row containing invalid document data will be skipped and debug
-    # provided about why the row wasn't able to be processed. This is to prevent dodgy
-    # rows from stopping the whole parser from running.
+    # Mapping will not raise errors where data validation fails, instead the row
+    # containing invalid document data will be skipped and debug provided about why
+    # the row wasn't able to be processed. This is to prevent dodgy rows from stopping
+    # the whole parser from running.
     #
-    # TODO: Might be nice to output dodgy rows to a separate output file that can be
-    # used to send back to the fund for them to amend.
-    mapped_docs = []
+    # The skipped rows can be written to a separate rejections file instead (see
+    # `gcf_data_mapper.rejections`), to send back to the fund for them to amend.
+    return map_document_chunks(gcf_docs, project_index, debug, chunk_size)
 
-    for _, row in combo.iterrows():
-        result = process_row(row, debug)
-        if result:
-            mapped_docs.extend(result)
 
-    return mapped_docs
+def iter_documents(
+    projects_data: pd.DataFrame,
+    gcf_docs: pd.DataFrame,
+    debug: bool,
+    chunk_size: int = DOCUMENT_CHUNK_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Map the GCF document info to new structure, one document at a time.
+
+    :param pd.DataFrame projects_data: The MCF and GCF project data,
+        joined on FP num.
+    :param pd.DataFrame gcf_docs: The GCF document data in a df.
+    :param bool debug: Whether debug mode is on.
+    :param int chunk_size: The number of documents to map at a time.
+    :return Iterator[dict[str, Any]]: The GCF documents in the
+        'destination' format described in the GCF Data Mapper Google
+        Sheet.
+    """
+    labelled_documents = map_labelled_documents(
+        projects_data, gcf_docs, debug, chunk_size
+    )
+    return (mapped_doc for _, mapped_doc in labelled_documents)
+
+
+def document(
+    projects_data: pd.DataFrame, gcf_docs: pd.DataFrame, debug: bool
+) -> list[Optional[dict[str, Any]]]:
+    """Map the GCF document info to new structure.
+
+    :param pd.DataFrame projects_data: The MCF and GCF project data,
+        joined on FP num.
+    :param pd.DataFrame gcf_docs: The GCF document data in a df.
+    :param bool debug: Whether debug mode is on.
+    :return list[Optional[dict[str, Any]]]: A list of GCF documents in
+        the 'destination' format described in the GCF Data Mapper Google
+        Sheet, or an empty list.
+    """
+    return list(iter_documents(projects_data, gcf_docs, debug))
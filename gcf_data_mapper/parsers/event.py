@@ -1,125 +1,169 @@
-from typing import Any, Optional, cast
+import logging
+from typing import Any, Hashable, Optional
 
-import click
+import numpy as np
 import pandas as pd
 
-from gcf_data_mapper.enums.event import Event, EventColumnNames, Events
-from gcf_data_mapper.parsers.helpers import strip_nested, verify_required_fields_present
-
-
-def append_event(
-    gcf_events: list,
-    event: Event,
-    row: pd.Series,
-    approved_ref: str,
-    projects_id: str,
-    n_value: int,
-) -> None:
-    """Append an event to the master list that is passed in.
-
-    Remember, because lists are mutable in Python, any changes to the
-    list inside a function will be reflected outside of it as a
-    reference to the object is passed instead of just the value.
-
-    :param list gcf_events: The list of GCF events.
-    :param Event event: The event to append.
-    :param pd.Series row: The row of data containing GCF event info.
-        Each row corresponds to a GCF 'family'.
-    :param str approved_ref: The FP number.
-    :param str projects_id: The GCF projects ID.
-    :param int n_value: The event number for the given GCF family.
+from gcf_data_mapper.enums.event import EventColumnNames, Events
+from gcf_data_mapper.enums.rejection import RejectionRules
+from gcf_data_mapper.logs import echo
+from gcf_data_mapper.parsers.helpers import (
+    ensure_normalised,
+    verify_required_fields_present,
+)
+from gcf_data_mapper.rejections import reject
+
+# The order in which the events of a single family are numbered.
+EVENT_ORDER = [
+    Events.APPROVED,
+    Events.UNDER_IMPLEMENTATION,
+    Events.COMPLETED,
+    Events.UNDER_IMPLEMENTATION_SECONDARY,
+]
+
+
+def check_event_date_columns(projects_data: pd.DataFrame) -> pd.DataFrame:
+    """Check which event dates are present (not NA) for every project.
+
+    The secondary under implementation date is only used where there is
+    no under implementation date.
+
+    :param pd.DataFrame projects_data: The project data to check.
+    :return pd.DataFrame: A boolean frame with a column per event, in
+        the order the events of a family are numbered.
     """
-    gcf_events.append(
+    under_implementation = projects_data[
+        Events.UNDER_IMPLEMENTATION.column_name
+    ].notna()
+    return pd.DataFrame(
         {
-            "import_id": f"GCF.event.{approved_ref}_{projects_id}.n{n_value:04}",
-            "family_import_id": f"GCF.family.{approved_ref}.{projects_id}",
-            "event_title": event.type,
-            "date": row[event.column_name],
-            "event_type_value": event.type,
-            "metadata": {
-                "event_type": [event.type],
-                "datetime_event_name": ["Project Approved"],
-            },
-        }
+            Events.APPROVED.name: projects_data[Events.APPROVED.column_name].notna(),
+            Events.UNDER_IMPLEMENTATION.name: under_implementation,
+            Events.COMPLETED.name: projects_data[Events.COMPLETED.column_name].notna(),
+            Events.UNDER_IMPLEMENTATION_SECONDARY.name: ~under_implementation
+            & projects_data[Events.UNDER_IMPLEMENTATION_SECONDARY.column_name].notna(),
+        },
+        index=projects_data.index,
     )
 
 
-def check_event_dates(row: pd.Series) -> dict[str, bool]:
-    """Check if the row contains valid event date values (not NA).
+def map_events(
+    projects_data: pd.DataFrame, event_dates: pd.DataFrame
+) -> list[tuple[Hashable, dict[str, Any]]]:
+    """Map the present event dates of every project to GCF events in bulk.
+
+    The events are ordered by project and then by `EVENT_ORDER`, and are
+    numbered with a running count per family.
 
-    :param pd.Series row: The row of data to check.
-    :return dict[str, bool]: A dict indicating the presence of each
-        event date.
+    :param pd.DataFrame projects_data: The MCF and GCF project data,
+        joined on FP num and normalised.
+    :param pd.DataFrame event_dates: The presence of each event date per
+        project, as returned by `check_event_date_columns`.
+    :return list[tuple[Hashable, dict[str, Any]]]: The GCF events, each
+        paired with the index label of the project row it was mapped
+        from.
     """
-    return {
-        Events.APPROVED.name: pd.notna(row.at[Events.APPROVED.column_name]),
-        Events.UNDER_IMPLEMENTATION.name: pd.notna(
-            row.at[Events.UNDER_IMPLEMENTATION.column_name]
-        ),
-        Events.COMPLETED.name: pd.notna(row.at[Events.COMPLETED.column_name]),
-        Events.UNDER_IMPLEMENTATION_SECONDARY.name: pd.isna(
-            row.at[Events.UNDER_IMPLEMENTATION.column_name]
+    approved_refs = projects_data[EventColumnNames.APPROVED_REF.value].astype(str)
+    projects_ids = projects_data[EventColumnNames.PROJECTS_ID.value].astype(str)
+    positions = np.arange(len(projects_data))
+
+    event_frames = []
+    for order, gcf_event in enumerate(EVENT_ORDER):
+        present = event_dates[gcf_event.name].to_numpy(dtype=bool)
+        dates = projects_data[gcf_event.column_name]
+        event_frames.append(
+            pd.DataFrame(
+                {
+                    "position": positions[present],
+                    "order": order,
+                    "date": dates.to_numpy(dtype=object)[present],
+                }
+            )
         )
-        and pd.notna(row.at[Events.UNDER_IMPLEMENTATION_SECONDARY.column_name]),
-    }
+    events = pd.concat(event_frames, ignore_index=True).sort_values(
+        ["position", "order"], kind="stable"
+    )
 
+    event_approved_refs = approved_refs.to_numpy()[events["position"]]
+    event_projects_ids = projects_ids.to_numpy()[events["position"]]
+    family_keys = pd.Series(event_approved_refs + "." + event_projects_ids)
+    n_values = family_keys.groupby(family_keys, sort=False).cumcount()
+
+    import_ids = (
+        "GCF.event."
+        + event_approved_refs
+        + "_"
+        + event_projects_ids
+        + ".n"
+        + n_values.astype(str).str.zfill(4).to_numpy()
+    )
+    family_import_ids = "GCF.family." + event_approved_refs + "." + event_projects_ids
+    event_types = [EVENT_ORDER[order].type for order in events["order"]]
+    labels = projects_data.index[events["position"]]
+
+    return [
+        (
+            label,
+            {
+                "import_id": import_id,
+                "family_import_id": family_import_id,
+                "event_title": event_type,
+                "date": date,
+                "event_type_value": event_type,
+                "metadata": {
+                    "event_type": [event_type],
+                    "datetime_event_name": ["Project Approved"],
+                },
+            },
+        )
+        for label, import_id, family_import_id, event_type, date in zip(
+            labels,
+            import_ids,
+            family_import_ids,
+            event_types,
+            events["date"].tolist(),
+            strict=True,
+        )
+    ]
 
-def initialise_event_counter(
-    event_counter: dict[str, int], family_import_id: str
-) -> None:
-    """Initialise the event counter for a family_import_id if not present.
 
-    Remember, because dictionaries are mutable in Python, any changes to
-    the dictionary inside a function will be reflected outside of it as
-    a reference to the object is passed instead of just the value.
+def map_labelled_events(
+    projects_data: pd.DataFrame, debug: bool
+) -> list[tuple[Hashable, dict[str, Any]]]:
+    """Map the GCF event info to new structure, keeping track of the rows.
 
-    :param dict[str, int] event_counter: The event counter dictionary
-        containing each family_import_id as a key and its corresponding
-        counter of events.
-    :param str family_import_id: The family import ID to initialise an
-        event counter for.
-    """
-    if family_import_id not in event_counter:
-        event_counter[family_import_id] = 0
-
-
-def process_event(
-    row: pd.Series,
-    gcf_events: list,
-    event_counter: dict,
-    approved_ref: str,
-    projects_id: str,
-) -> None:
-    """Process a row to append events and update the event counter.
-
-    :param pd.Series row: The row of data to process (corresponds to a
-        GCF family).
-    :param list gcf_events: The master list of already processed GCF
-        events.
-    :param dict event_counter: The event counter dictionary.
-    :param str approved_ref: The FP number.
-    :param str projects_id: The GCF projects ID.
+    :param pd.DataFrame projects_data: The MCF and GCF project data,
+        joined on FP num.
+    :param bool debug: Whether debug mode is on.
+    :return list[tuple[Hashable, dict[str, Any]]]: The GCF events in the
+        'destination' format, each paired with the index label of the
+        project row it was mapped from.
     """
-    family_import_id = f"GCF.event.{approved_ref}.{projects_id}"
-    initialise_event_counter(event_counter, family_import_id)
-
-    event_dates = check_event_dates(row)
-    if not any(event_dates.values()):
-        click.echo(f"🛑 No event dates found for {approved_ref} {projects_id}.")
-        return
-
-    for event_name, has_event in event_dates.items():
-        if has_event:
-            event = getattr(Events, event_name.upper())
-            append_event(
-                gcf_events,
-                event,
-                row,
-                approved_ref,
-                projects_id,
-                event_counter[family_import_id],
-            )
-            event_counter[family_import_id] += 1
+    if debug:
+        echo("📝 Wrangling GCF event data.", level=logging.DEBUG)
+
+    required_fields = set(str(e.value) for e in EventColumnNames)
+    verify_required_fields_present(projects_data, required_fields)
+
+    projects_data = ensure_normalised(projects_data)
+    event_dates = check_event_date_columns(projects_data)
+
+    no_event_dates = ~event_dates.any(axis=1)
+    for label, approved_ref, projects_id in zip(
+        projects_data.index[no_event_dates],
+        projects_data[EventColumnNames.APPROVED_REF.value][no_event_dates],
+        projects_data[EventColumnNames.PROJECTS_ID.value][no_event_dates],
+        strict=True,
+    ):
+        reject(
+            "events",
+            RejectionRules.NO_EVENT_DATES,
+            f"🛑 No event dates found for {approved_ref} {projects_id}.",
+            {"approved_ref": approved_ref, "projects_id": str(projects_id)},
+            row=label,
+        )
+
+    return map_events(projects_data, event_dates)
 
 
 def event(projects_data: pd.DataFrame, debug: bool) -> list[Optional[dict[str, Any]]]:
@@ -132,19 +176,6 @@ def event(projects_data: pd.DataFrame, debug: bool) -> list[Optional[dict[str, A
         the 'destination' format described in the GCF Data Mapper Google
         Sheet.
     """
-    if debug:
-        click.echo("📝 Wrangling GCF event data.")
-
-    required_fields = set(str(e.value) for e in EventColumnNames)
-    verify_required_fields_present(projects_data, required_fields)
-
-    gcf_events = []
-    event_counter = {}
-
-    for _, row in projects_data.iterrows():
-        row = cast(pd.Series, row.apply(strip_nested))
-        approved_ref = row.at[EventColumnNames.APPROVED_REF.value]
-        projects_id = row.at[EventColumnNames.PROJECTS_ID.value]
-        process_event(row, gcf_events, event_counter, approved_ref, projects_id)
-
-    return gcf_events
+    return [
+        mapped_event for _, mapped_event in map_labelled_events(projects_data, debug)
+    ]
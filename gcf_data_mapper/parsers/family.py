@@ -1,219 +1,398 @@
-from typing import Any, Iterable, Optional, cast
+import logging
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Hashable, Optional
 
-import click
+import numpy as np
 import pandas as pd
 
+from gcf_data_mapper.clock import get_reference_time
 from gcf_data_mapper.enums.event import EventColumnNames, Events
 from gcf_data_mapper.enums.family import (
     FamilyColumnsNames,
     FamilyNestedColumnNames,
     GCFProjectBudgetSource,
 )
+from gcf_data_mapper.enums.rejection import RejectionRules
+from gcf_data_mapper.logs import echo
 from gcf_data_mapper.parsers.helpers import (
-    arrays_contain_empty_values,
-    row_contains_columns_with_empty_values,
-    strip_nested,
+    empty_arrays_message,
+    ensure_normalised,
+    row_values,
+    strip_column,
     verify_required_fields_present,
 )
+from gcf_data_mapper.parsers.validation import (
+    ValidationRule,
+    blank_values,
+    enum_columns,
+    failed_columns,
+    missing_values,
+    validate_frame,
+)
+from gcf_data_mapper.rejections import reject
 
+INVALID_DATE_ENTRIES_MESSAGE = "🛑 Row contains invalid date entries"
+MISSING_EVENT_DATES_MESSAGE = (
+    "🛑 Row missing event date information to calculate status"
+)
 
-def contains_invalid_date_entries(list_of_dates: Iterable[pd.Timestamp]) -> bool:
-    """Check if any of the values in the list of dates are NaT (Not a Time).
-
-    :param Iterable[pd.Timestamp] list_of_dates: A list of pd.TimeStamps, may also include NoneTypes
-    :return bool: True if any of the values are not a valid timestamp. This helps distinguish between NaT and NaN/None Type values which are valid date entries.
-    """
-    return any(date is pd.NaT for date in list_of_dates)
-
-
-def calculate_status(row: pd.Series) -> Optional[str]:
-    """Calculate status of project based on the event types and dates
-        The status is calculated per the below:
-            Completed : (NOW is passed date-completion)
-            Under implementation : (NOW is passed start-date)
-            Approved : (NOW is passed approved-date)
-
-    :param pd.Series row: The row containing the event information
-    :return Optional[str]: The status of the project, if there are no valid values return None
+# The rule a project breaks when its status can't be calculated, by the message saying why.
+STATUS_REJECTION_RULES = {
+    INVALID_DATE_ENTRIES_MESSAGE: RejectionRules.INVALID_EVENT_DATES,
+    MISSING_EVENT_DATES_MESSAGE: RejectionRules.MISSING_EVENT_DATES,
+}
+
+# The rules a project must follow to be mapped to a family, in the order they're checked.
+# Whilst we expect the event columns to be present, some of the events in the data may
+# have empty values, so these are left out of the empty column values check and any empty
+# event values are handled when calculating the status.
+FAMILY_RULES = [
+    ValidationRule(
+        RejectionRules.MISSING_PROJECT_ID,
+        [FamilyColumnsNames.PROJECTS_ID.value],
+        blank_values,
+    ),
+    ValidationRule(
+        RejectionRules.EMPTY_COLUMN_VALUES,
+        sorted(enum_columns(FamilyColumnsNames)),
+        missing_values,
+    ),
+]
+
+# The events whose dates the status of a project is calculated from, in the order of the
+# project lifecycle.
+STATUS_EVENTS = [Events.APPROVED, Events.UNDER_IMPLEMENTATION, Events.COMPLETED]
+
+
+def calculate_statuses(
+    projects_data: pd.DataFrame, reference_time: Optional[pd.Timestamp] = None
+) -> tuple[pd.Series, pd.Series]:
+    """Calculate the status of every project in a single pass.
+
+    The status is calculated per the below:
+        Completed : (NOW is passed date-completion)
+        Under implementation : (NOW is passed start-date)
+        Approved : (NOW is passed approved-date)
+    where NOW is the reference time of the run. Each event date column
+    is parsed once for the whole frame, with the `Status` column taking
+    precedence wherever it is populated.
+
+    :param pd.DataFrame projects_data: The project data containing the
+        status and event date columns.
+    :param Optional[pd.Timestamp] reference_time: The time to compare the
+        event dates against. Defaults to None, which uses the reference
+        time of the run (see `gcf_data_mapper.clock`).
+    :return tuple[pd.Series, pd.Series]: The status of each project (None
+        where it cannot be calculated) and the message explaining why a
+        status could not be calculated (None where it could).
     """
+    now = pd.Timestamp(reference_time or get_reference_time())
+    if now.tzinfo is None:
+        now = now.tz_localize("UTC")
+    statuses = pd.Series(
+        [None] * len(projects_data), index=projects_data.index, dtype=object
+    )
+    invalid_dates = pd.Series(False, index=projects_data.index)
 
-    if FamilyColumnsNames.STATUS.value in row and pd.notna(
-        row.at[FamilyColumnsNames.STATUS.value]
-    ):
-        if row.at[FamilyColumnsNames.STATUS.value] == "Approved":
-            return Events.APPROVED.type
-        if row.at[FamilyColumnsNames.STATUS.value] == "Under implementation":
-            return Events.UNDER_IMPLEMENTATION.type
-        if row.at[FamilyColumnsNames.STATUS.value] == "Completed":
-            return Events.COMPLETED.type
-        return row.at[FamilyColumnsNames.STATUS.value]
-
-    completed_date = pd.to_datetime(row.at[Events.COMPLETED.column_name])
-    start_date = pd.to_datetime(row.at[Events.UNDER_IMPLEMENTATION.column_name])
-    approved_date = pd.to_datetime(row.at[Events.APPROVED.column_name])
+    # Ordered to reflect the project lifecycle, so later stages overwrite earlier ones.
+    for event in STATUS_EVENTS:
+        column = strip_column(projects_data[event.column_name])
+        dates = pd.to_datetime(column, errors="coerce", format="mixed", utc=True)
 
-    if contains_invalid_date_entries([completed_date, start_date, approved_date]):
-        click.echo("🛑 Row contains invalid date entries")
-        return None
+        # Per value, pd.to_datetime maps None to None but NaN and unparseable values to
+        # NaT, so only the latter count as invalid date entries.
+        is_none = np.equal(column.to_numpy(dtype=object), None)
+        invalid_dates |= dates.isna() & ~is_none
 
-    now = pd.Timestamp.now(tz="UTC")
+        statuses[dates.notna() & (dates <= now)] = event.type
 
-    # This block is arranged to reflect the project lifecycle in reverse order, from the final stage to the initial stage.
-    if pd.notna(completed_date) and now >= completed_date:
-        return Events.COMPLETED.type
-    if pd.notna(start_date) and now >= start_date:
-        return Events.UNDER_IMPLEMENTATION.type
-    if pd.notna(approved_date) and now >= approved_date:
-        return Events.APPROVED.type
+    statuses[invalid_dates] = None
+    messages = pd.Series(
+        [None] * len(projects_data), index=projects_data.index, dtype=object
+    )
+    messages[statuses.isna()] = MISSING_EVENT_DATES_MESSAGE
+    messages[invalid_dates] = INVALID_DATE_ENTRIES_MESSAGE
+
+    if FamilyColumnsNames.STATUS.value in projects_data:
+        status_column = strip_column(projects_data[FamilyColumnsNames.STATUS.value])
+        has_status = status_column.notna()
+        statuses[has_status] = status_column[has_status].replace(
+            {
+                "Approved": Events.APPROVED.type,
+                "Under implementation": Events.UNDER_IMPLEMENTATION.type,
+                "Completed": Events.COMPLETED.type,
+            }
+        )
+        messages[has_status] = None
 
-    click.echo("🛑 Row missing event date information to calculate status")
-    return None
+    return statuses, messages
 
 
-def get_budgets(funding_list: list[dict], source: str) -> Optional[list[str]]:
-    """Get the budget amount from the row based on the funding source.
+def explode_nested_column(column: pd.Series, keys: list[str]) -> pd.DataFrame:
+    """Explode a column of lists of dicts into long format.
 
-    :param list[dict] row: A list of all the funding information, represented in dictionaries
-    :param str source: The funding source to retrieve the budget from.
+    Only the keys every dict must have are read up front. The dicts
+    themselves are kept ("item"), so the keys only some of them have can
+    be read once the rows that need them are filtered.
 
-    :return Optional[list[str]: A list of budget amounts corresponding to the source,
-        or ["0"] if the source is not found.
+    :param pd.Series column: The list of dicts of each project.
+    :param list[str] keys: The keys to keep from each dict.
+    :return pd.DataFrame: One row per dict, ordered by project, holding
+        the position of its project ("project"), the dict ("item") and
+        its (object) value for each of the keys.
     """
+    lists = column.tolist()
+    lengths = np.fromiter(map(len, lists), dtype=np.intp, count=len(lists))
+    items = list(chain.from_iterable(lists))
 
-    budget_key = FamilyNestedColumnNames.BUDGET.value
-    source_key = FamilyNestedColumnNames.SOURCE.value
-
-    budgets = [
-        str(funding[budget_key])
-        for funding in funding_list
-        if funding[source_key] == source
-    ]
-
-    # Where we have projects which have been solely funded by the fund (GCF), or solely co-financed
-    # - so in instances where there will be no funding that match either the GCF or co-financing
-    # source value, we will map the `project_value_fund spend` or the `project_value_co_financing`
-    # as an array with 0 i.e ["0"]
-    return budgets if budgets else ["0"]
+    exploded: dict[str, np.ndarray] = {
+        "project": np.repeat(np.arange(len(lists)), lengths),
+        "item": np.fromiter(items, dtype=object, count=len(items)),
+    }
+    for key in keys:
+        exploded[key] = np.fromiter(
+            map(itemgetter(key), items), dtype=object, count=len(items)
+        )
+    return pd.DataFrame(exploded)
 
 
-def get_related_result_areas(result_areas: list[dict]) -> list[str]:
-    """Get the related result areas from the row.
+def group_by_project(
+    values: pd.Series, projects: pd.Series, n_projects: int
+) -> list[list[Any]]:
+    """Re-aggregate the values of an exploded column into a list per project.
 
-    :param list[dict] result_areas: A list of all the result areas information, represented in dictionaries.
-    :return list[str]: A list of result areas where the 'Value' is greater than or equal to 0%.
+    :param pd.Series values: The values, ordered by project.
+    :param pd.Series projects: The position of the project of each value.
+    :param int n_projects: The number of projects.
+    :return list[list[Any]]: The values of each project, in order.
+    """
+    counts = np.bincount(projects.to_numpy(), minlength=n_projects)
+    ends = np.cumsum(counts).tolist()
+    starts = [0, *ends][:-1]
+    items = values.tolist()
+    return [items[start:end] for start, end in zip(starts, ends, strict=True)]
+
+
+def has_empty_values(
+    values: pd.Series, projects: pd.Series, n_projects: int
+) -> np.ndarray:
+    """Check which projects have no values, or an empty one, in an exploded column.
+
+    :param pd.Series values: The values as strings, ordered by project.
+    :param pd.Series projects: The position of the project of each value.
+    :param int n_projects: The number of projects.
+    :return np.ndarray: True for each project whose list is empty, or
+        contains an empty value.
     """
+    counts = np.bincount(projects.to_numpy(), minlength=n_projects)
+    empty = np.bincount(projects[values.eq("")].to_numpy(), minlength=n_projects)
+    return (counts == 0) | (empty > 0)
 
-    area_key = FamilyNestedColumnNames.AREA.value
-    value_key = FamilyNestedColumnNames.VALUE.value
 
-    return [
-        str(result[area_key])
-        for result in result_areas
-        if result[value_key] and float(result[value_key].replace("%", "")) > 0
-    ]
+def map_nested_family_columns(gcf_projects_data: pd.DataFrame) -> pd.DataFrame:
+    """Map the metadata held in the nested lists of every family at once.
 
+    The Countries, Entities, Funding and ResultAreas of all the projects
+    are each exploded into a single long frame, which is filtered and
+    converted in bulk and then re-aggregated per project.
 
-def map_family_metadata(row: pd.Series) -> Optional[dict]:
-    """Map the metadata of a family based on the provided row.
-
-    :param pd.Series row: The row containing family information.
-    :return Optional[dict]: A dictionary containing mapped metadata for the family.
+    :param pd.DataFrame gcf_projects_data: The projects, each with a list
+        of dicts in every nested column.
+    :return pd.DataFrame: Per project, the mapped nested metadata
+        ("nested_metadata"), the ISO3 codes of its countries
+        ("geographies") and the names of its lists that contain empty
+        values ("empty_lists"), in which case it has no nested metadata.
     """
+    n_projects = len(gcf_projects_data)
+    countries = explode_nested_column(
+        gcf_projects_data[FamilyColumnsNames.COUNTRIES.value],
+        [FamilyNestedColumnNames.REGION.value],
+    )
+    entities = explode_nested_column(
+        gcf_projects_data[FamilyColumnsNames.ENTITIES.value],
+        [FamilyNestedColumnNames.NAME.value],
+    )
+    funding = explode_nested_column(
+        gcf_projects_data[FamilyColumnsNames.FUNDING.value],
+        [FamilyNestedColumnNames.SOURCE.value],
+    )
+    result_areas = explode_nested_column(
+        gcf_projects_data[FamilyColumnsNames.RESULT_AREAS.value],
+        [FamilyNestedColumnNames.TYPE.value, FamilyNestedColumnNames.VALUE.value],
+    )
 
-    status = calculate_status(row)
-
-    if status is None:
-        return None
-
-    countries = row.at[FamilyColumnsNames.COUNTRIES.value]
-    entities = row.at[FamilyColumnsNames.ENTITIES.value]
-    funding_sources = row.at[FamilyColumnsNames.FUNDING.value]
-    result_areas = row.at[FamilyColumnsNames.RESULT_AREAS.value]
+    def as_strings(frame: pd.DataFrame, key: FamilyNestedColumnNames) -> pd.Series:
+        return frame[key.value].map(str)
+
+    def item_strings(frame: pd.DataFrame, key: FamilyNestedColumnNames) -> pd.Series:
+        # The key is only read from the (filtered) rows of the frame, as the others
+        # don't need to have it.
+        return frame["item"].map(itemgetter(key.value)).map(str)
+
+    # Only the result areas with a percentage above 0 are related to the project.
+    values = result_areas[FamilyNestedColumnNames.VALUE.value]
+    has_value = values.map(bool).to_numpy(dtype=bool)
+    related = np.zeros(len(result_areas), dtype=bool)
+    related[has_value] = (
+        pd.to_numeric(values[has_value].str.replace("%", "", regex=False)) > 0
+    ).to_numpy()
+
+    budgets_by_source = {}
+    for source in GCFProjectBudgetSource:
+        from_source = funding[
+            funding[FamilyNestedColumnNames.SOURCE.value].eq(source.value)
+        ]
+        # Projects solely funded by the GCF, or solely co-financed, have ["0"] as the
+        # budgets of the other source.
+        budgets_by_source[source] = [
+            project_budgets or ["0"]
+            for project_budgets in group_by_project(
+                item_strings(from_source, FamilyNestedColumnNames.BUDGET),
+                from_source["project"],
+                n_projects,
+            )
+        ]
+
+    lists = {
+        "Implementing Agencies": (
+            as_strings(entities, FamilyNestedColumnNames.NAME),
+            entities["project"],
+        ),
+        "Regions": (
+            as_strings(countries, FamilyNestedColumnNames.REGION),
+            countries["project"],
+        ),
+        "Result Areas": (
+            item_strings(result_areas[related], FamilyNestedColumnNames.AREA),
+            result_areas["project"][related],
+        ),
+        "Result Types": (
+            as_strings(result_areas, FamilyNestedColumnNames.TYPE),
+            result_areas["project"],
+        ),
+    }
+    grouped = {
+        name: group_by_project(strings, projects, n_projects)
+        for name, (strings, projects) in lists.items()
+    }
+    empty = {
+        name: has_empty_values(strings, projects, n_projects)
+        for name, (strings, projects) in lists.items()
+    }
 
-    name_key = FamilyNestedColumnNames.NAME.value
-    region_key = FamilyNestedColumnNames.REGION.value
-    type_key = FamilyNestedColumnNames.TYPE.value
+    any_empty = np.logical_or.reduce(list(empty.values()))
+    empty_lists: list[list[str]] = [[] for _ in range(n_projects)]
+    for position in np.flatnonzero(any_empty):
+        empty_lists[position] = [name for name in lists if empty[name][position]]
+
+    nested_metadata = [
+        (
+            None
+            if project_empty
+            else {
+                "implementing_agency": list(set(agencies)),
+                "project_value_fund_spend": gcf_budgets,
+                "project_value_co_financing": co_financing_budgets,
+                "region": list(set(regions)),
+                "result_area": list(set(areas)),
+                "result_type": list(set(types)),
+            }
+        )
+        for project_empty, agencies, gcf_budgets, co_financing_budgets, regions, areas, types in zip(
+            any_empty,
+            grouped["Implementing Agencies"],
+            budgets_by_source[GCFProjectBudgetSource.GCF],
+            budgets_by_source[GCFProjectBudgetSource.CO_FINANCING],
+            grouped["Regions"],
+            grouped["Result Areas"],
+            grouped["Result Types"],
+            strict=True,
+        )
+    ]
 
-    co_financing_budgets = get_budgets(
-        funding_sources, GCFProjectBudgetSource.CO_FINANCING.value
+    # The ISO3 codes are only needed (and so only required to be there) for the
+    # projects that get mapped.
+    geographies = np.full(n_projects, None)
+    mapped = ~any_empty
+    iso3_codes = explode_nested_column(
+        gcf_projects_data[FamilyColumnsNames.COUNTRIES.value][mapped],
+        [FamilyNestedColumnNames.COUNTRY_ISO3.value],
     )
-    gcf_budgets = get_budgets(funding_sources, GCFProjectBudgetSource.GCF.value)
-
-    if gcf_budgets is None or co_financing_budgets is None:
-        return None
-
-    implementing_agencies = [str(entity[name_key]) for entity in entities]
-    regions = [str(country[region_key]) for country in countries]
-    areas = get_related_result_areas(result_areas)
-    types = [str(result[type_key]) for result in result_areas]
-
-    # As we are filtering the budget information by source for gcf and co financing, we
-    # know there will be instances where only one type of funding exists so checking
-    # for empty/false values would create false positives, hence the exclusion from this
-    # check
-    if arrays_contain_empty_values(
-        [
-            ("Implementing Agencies", implementing_agencies),
-            ("Regions", regions),
-            ("Result Areas", areas),
-            ("Result Types", types),
-        ],
-        row.at[FamilyColumnsNames.PROJECTS_ID.value],
-    ):
-        return None
-
-    metadata = {
-        "approved_ref": [str(row.at[FamilyColumnsNames.APPROVED_REF.value])],
-        "implementing_agency": list(set(implementing_agencies)),
-        "project_id": [str(row.at[FamilyColumnsNames.PROJECTS_ID.value])],
-        "project_url": [str(row.at[FamilyColumnsNames.PROJECT_URL.value])],
-        "project_value_fund_spend": gcf_budgets,
-        "project_value_co_financing": co_financing_budgets,
-        "region": list(set(regions)),
-        "result_area": list(set(areas)),
-        "result_type": list(set(types)),
-        "sector": [str(row.at[FamilyColumnsNames.SECTOR.value])],
+    geographies[mapped] = pd.Series(
+        group_by_project(
+            iso3_codes[FamilyNestedColumnNames.COUNTRY_ISO3.value],
+            iso3_codes["project"],
+            int(mapped.sum()),
+        ),
+        dtype=object,
+    ).to_numpy()
+
+    return pd.DataFrame(
+        {
+            "nested_metadata": pd.Series(nested_metadata, dtype=object),
+            "geographies": pd.Series(geographies, dtype=object),
+            "empty_lists": pd.Series(empty_lists, dtype=object),
+        }
+    ).set_axis(gcf_projects_data.index)
+
+
+def build_family_metadata(
+    nested_metadata: dict[str, list[str]],
+    approved_ref: str,
+    projects_id: str,
+    project_url: str,
+    sector: str,
+    theme: str,
+    status: str,
+) -> dict:
+    """Assemble the family metadata in the bulk import key order.
+
+    :param dict[str, list[str]] nested_metadata: The metadata mapped from
+        the nested lists of the family.
+    :param str approved_ref: The FP number.
+    :param str projects_id: The GCF projects ID.
+    :param str project_url: The URL of the project.
+    :param str sector: The sector of the project.
+    :param str theme: The theme of the project.
+    :param str status: The status of the project.
+    :return dict: A dictionary containing mapped metadata for the family.
+    """
+    return {
+        "approved_ref": [approved_ref],
+        "implementing_agency": nested_metadata["implementing_agency"],
+        "project_id": [projects_id],
+        "project_url": [project_url],
+        "project_value_fund_spend": nested_metadata["project_value_fund_spend"],
+        "project_value_co_financing": nested_metadata["project_value_co_financing"],
+        "region": nested_metadata["region"],
+        "result_area": nested_metadata["result_area"],
+        "result_type": nested_metadata["result_type"],
+        "sector": [sector],
         "status": [status],
-        "theme": [str(row.at[FamilyColumnsNames.THEME.value])],
+        "theme": [theme],
         "external_id": [],
     }
 
-    return metadata
-
 
-def map_family_data(
-    row: pd.Series,
-) -> Optional[dict]:
-    """Map the data of a family based on the provided row.
-
-    :param pd.Series row: The containing family and family metadata information.
-    :return Optional[dict]: A dictionary containing the mapped family data.
+def build_family_data(
+    family_metadata: dict,
+    import_id: str,
+    title: Any,
+    summary: Any,
+    geographies: list[Any],
+) -> dict:
+    """Assemble the family data in the bulk import key order.
+
+    :param dict family_metadata: The mapped family metadata.
+    :param str import_id: The import ID of the family.
+    :param Any title: The title of the family.
+    :param Any summary: The summary of the family.
+    :param list[Any] geographies: The ISO3 codes of the countries the
+        project covers.
+    :return dict: A dictionary containing the mapped family data.
     """
-
-    family_metadata = map_family_metadata(row)
-    projects_id = row.at[FamilyColumnsNames.PROJECTS_ID.value]
-
-    # When processing the family metadata if there are any empty/falsy values we return None
-    # and skip the row. Therefore we don't want to process the rest of the family data so we
-    # return None in this conditional.
-    if family_metadata is None:
-        click.echo(
-            f"🛑 Skipping row as family metadata has missing information, ProjectsID : {projects_id}"
-        )
-        return None
-
-    approved_ref = row.at[FamilyColumnsNames.APPROVED_REF.value]
-    summary = row.at[FamilyColumnsNames.SUMMARY.value]
-    title = row.at[FamilyColumnsNames.TITLE.value]
-
-    geographies = [
-        country[FamilyNestedColumnNames.COUNTRY_ISO3.value]
-        for country in row.at[FamilyColumnsNames.COUNTRIES.value]
-    ]
-
-    import_id = f"GCF.family.{approved_ref}.{projects_id}"
-
-    family_data = {
+    return {
         # For now we are hard coding the category as MCF
         "category": "MCF",
         "collections": [],
@@ -224,72 +403,173 @@ def map_family_data(
         "title": title,
     }
 
-    return family_data
 
+def prepare_family_columns(
+    gcf_projects_data: pd.DataFrame, validation: dict[str, Any]
+) -> pd.DataFrame:
+    """Compute the family fields with whole column operations.
 
-def process_row(
-    row: pd.Series,
-    projects_id: str,
-    required_columns: list[str],
-) -> Optional[dict]:
-    """Map the family data based on the provided row.
-
-    :param pd.Series row: The row containing family information.
-    :param str projects_id: The id of the current project that is being reformatted/processed
-    :param list required_columns: The list of required columns that we need to extract the
-        data from in the project
-    :return Optional[dict]: A dictionary containing mapped data for the family entity.
-        The function will return None, if the row contains missing data from expected columns/fields
+    :param pd.DataFrame gcf_projects_data: The MCF and GCF project data,
+        joined on FP num and normalised.
+    :param dict[str, Any] validation: The projects validated against the
+        FAMILY_RULES, as returned by `validate_frame`.
+    :return pd.DataFrame: One row per project holding the first rule it
+        breaks (if any), status, scalar fields and, for the projects that
+        pass the checks so far, the mapped nested metadata (see
+        `map_nested_family_columns`).
     """
 
-    if pd.isna(projects_id) or bool(projects_id) is False:
-        click.echo("🛑 Skipping row as it does not contain a project id")
-        return None
-
-    if row_contains_columns_with_empty_values(row, required_columns):
-        click.echo(
-            f"🛑 Skipping row as it contains empty column values: See Project ID {projects_id}"
-        )
-        return None
-
-    row = cast(pd.Series, row.apply(strip_nested))
-    return map_family_data(row)
+    def column(name: FamilyColumnsNames) -> pd.Series:
+        return gcf_projects_data[name.value]
+
+    projects_ids = column(FamilyColumnsNames.PROJECTS_ID).astype(str)
+    approved_refs = column(FamilyColumnsNames.APPROVED_REF).astype(str)
+    statuses, status_messages = calculate_statuses(gcf_projects_data)
+
+    # The nested lists are only mapped for the projects that would get that far, as
+    # the others may not hold lists at all.
+    nested_columns = ["nested_metadata", "geographies", "empty_lists"]
+    mappable = validation["valid"] & statuses.notna().to_numpy()
+    nested = {name: np.full(len(gcf_projects_data), None) for name in nested_columns}
+    if mappable.any():
+        mapped = map_nested_family_columns(gcf_projects_data[mappable])
+        for name in nested_columns:
+            nested[name][mappable] = mapped[name].to_numpy()
+
+    return pd.DataFrame(
+        {
+            "broken_rule": validation["broken_rules"],
+            "projects_id": projects_ids,
+            "approved_ref": approved_refs,
+            "import_id": "GCF.family." + approved_refs + "." + projects_ids,
+            "status": statuses,
+            "status_message": status_messages,
+            "project_url": column(FamilyColumnsNames.PROJECT_URL).astype(str),
+            "sector": column(FamilyColumnsNames.SECTOR).astype(str),
+            "theme": column(FamilyColumnsNames.THEME).astype(str),
+            "title": column(FamilyColumnsNames.TITLE),
+            "summary": column(FamilyColumnsNames.SUMMARY),
+            **nested,
+        },
+        index=gcf_projects_data.index,
+    )
 
 
-def family(
+def map_labelled_families(
     gcf_projects_data: pd.DataFrame, debug: bool
-) -> list[Optional[dict[str, Any]]]:
-    """Map the GCF family info to new structure.
+) -> list[tuple[Hashable, dict[str, Any]]]:
+    """Map the GCF family info to new structure, keeping track of the rows.
 
     :param pd.DataFrame projects_data: The MCF and GCF project data,
         joined on FP num.
     :param bool debug: Whether debug mode is on.
-    :return list[Optional[dict[str, Any]]]: A list of GCF families in
-        the 'destination' format described in the GCF Data Mapper Google
-        Sheet.
+    :return list[tuple[Hashable, dict[str, Any]]]: The GCF families in
+        the 'destination' format, each paired with the index label of the
+        project row it was mapped from.
     """
 
     if debug:
-        click.echo("📝 Wrangling GCF family data.")
+        echo("📝 Wrangling GCF family data.", level=logging.DEBUG)
 
     mapped_families = []
 
-    family_columns = set(str(e.value) for e in FamilyColumnsNames)
-    required_fields = family_columns.union(set(str(e.value) for e in EventColumnNames))
-
-    verify_required_fields_present(gcf_projects_data, required_fields)
-    # Whilst we expect the event columns to be present, some of the events in the data may have empty values.
-    # We therefore want to exclude these from the `row_contains_columns_with_empty_values` function,
-    # and handle any empty event values in the `calculate_status` function.
-    required_fields -= set(
-        str(e.value) for e in EventColumnNames if str(e.value) not in family_columns
+    verify_required_fields_present(
+        gcf_projects_data, set(enum_columns(FamilyColumnsNames, EventColumnNames))
     )
 
-    for _, row in gcf_projects_data.iterrows():
-        projects_id = str(row.at[FamilyColumnsNames.PROJECTS_ID.value]).strip()
+    # The validity checks, status, scalar fields and nested metadata are computed for
+    # all projects up front, so the loop below only has to assemble each family.
+    gcf_projects_data = ensure_normalised(gcf_projects_data)
+    validation = validate_frame(gcf_projects_data, FAMILY_RULES)
+    projects = prepare_family_columns(gcf_projects_data, validation)
+
+    event_columns = [event.column_name for event in STATUS_EVENTS]
+    for position, project in enumerate(projects.itertuples()):
+        ids = {"approved_ref": project.approved_ref, "projects_id": project.projects_id}
+        if project.broken_rule is RejectionRules.MISSING_PROJECT_ID:
+            reject(
+                "families",
+                RejectionRules.MISSING_PROJECT_ID,
+                "🛑 Skipping row as it does not contain a project id",
+                ids,
+                row=project.Index,
+            )
+            continue
+
+        if project.broken_rule is RejectionRules.EMPTY_COLUMN_VALUES:
+            reject(
+                "families",
+                RejectionRules.EMPTY_COLUMN_VALUES,
+                f"🛑 Skipping row as it contains empty column values: See Project ID {project.projects_id}",
+                ids,
+                {"empty_columns": failed_columns(validation, position)},
+                row=project.Index,
+            )
+            continue
+
+        missing_metadata_message = f"🛑 Skipping row as family metadata has missing information, ProjectsID : {project.projects_id}"
+        if project.status is None:
+            reject(
+                "families",
+                STATUS_REJECTION_RULES[project.status_message],
+                f"{project.status_message}\n{missing_metadata_message}",
+                ids,
+                row_values(gcf_projects_data, position, event_columns),
+                row=project.Index,
+            )
+            continue
+
+        if project.empty_lists:
+            reject(
+                "families",
+                RejectionRules.EMPTY_NESTED_LISTS,
+                f"{empty_arrays_message(project.empty_lists, project.projects_id)}\n"
+                f"{missing_metadata_message}",
+                ids,
+                {"empty_lists": sorted(project.empty_lists)},
+                row=project.Index,
+            )
+            continue
+
+        family_metadata = build_family_metadata(
+            project.nested_metadata,
+            project.approved_ref,
+            project.projects_id,
+            project.project_url,
+            project.sector,
+            project.theme,
+            project.status,
+        )
 
-        result = process_row(row, projects_id, list(required_fields))
-        if result:
-            mapped_families.append(result)
+        mapped_families.append(
+            (
+                project.Index,
+                build_family_data(
+                    family_metadata,
+                    project.import_id,
+                    project.title,
+                    project.summary,
+                    project.geographies,
+                ),
+            )
+        )
 
     return mapped_families
+
+
+def family(
+    gcf_projects_data: pd.DataFrame, debug: bool
+) -> list[Optional[dict[str, Any]]]:
+    """Map the GCF family info to new structure.
+
+    :param pd.DataFrame projects_data: The MCF and GCF project data,
+        joined on FP num.
+    :param bool debug: Whether debug mode is on.
+    :return list[Optional[dict[str, Any]]]: A list of GCF families in
+        the 'destination' format described in the GCF Data Mapper Google
+        Sheet.
+    """
+    return [
+        mapped_family
+        for _, mapped_family in map_labelled_families(gcf_projects_data, debug)
+    ]
@@ -1,8 +1,11 @@
 from typing import Any
 
-import click
+import numpy as np
 import pandas as pd
 
+# The DataFrame.attrs flag marking a frame whose strings have all been stripped.
+NORMALISED_ATTR = "normalised"
+
 
 def verify_required_fields_present(
     data: pd.DataFrame, required_fields: set[str]
@@ -28,51 +31,28 @@ def verify_required_fields_present(
     )
 
 
-def check_required_column_value_not_na(row: pd.Series, column_enum) -> bool:
-    """Check if the row contains valid document column values (not NA)."""
-    return all(pd.notna(row[column.value]) for column in column_enum)
-
+def empty_arrays_message(names: list[str], id: str) -> str:
+    """Describe the lists of a project that are, or contain, empty values.
 
-def row_contains_columns_with_empty_values(
-    row: pd.Series, required_columns: list[str]
-) -> bool:
-    """Check that all required values in the given row are not empty (isna).
-
-    :param pd.Series row: The row to check for isna values.
-    :param list[str] required_columns: A list of column names that will be used to verify
-        isna values.
-    :return bool: True if the row contains columns with empty values, false if if all
-        expected columns are populated
+    :param list[str] names: The names of the lists.
+    :param str id: The ID of the project.
+    :return str: The message reporting the lists.
     """
+    return f"🛑 The following lists contain empty values: {', '.join(sorted(names))}. Projects ID {id}"
 
-    # Ensure we are working with a pandas Series by re-selecting the required columns as a Series
-    row_subset = pd.Series(row[required_columns], index=required_columns)
 
-    if row_subset.isna().any():
-        return True
-    return False
+def row_values(data: pd.DataFrame, position: int, columns: list[str]) -> dict[str, Any]:
+    """Get the values of some columns of a row, with missing values as None.
 
-
-def arrays_contain_empty_values(list_values: list[tuple], id: str) -> bool:
-    """Checks the list in a tuple for empty (falsy) values; {}, [], None, ''
-
-    :param list[tuple] list_values: A list of tuples containing the name and array of values
-    :param str id: The ID of the project to include in message that we echo to the terminal.
-    :return bool: True if any list contains empty values, False otherwise.
+    :param pd.DataFrame data: The data holding the row.
+    :param int position: The position of the row.
+    :param list[str] columns: The columns to get the values of.
+    :return dict[str, Any]: The value of each column.
     """
-    arrays_with_empty_values = [
-        name
-        for name, array in list_values
-        if not array or any(not value for value in array)
-    ]
-
-    if arrays_with_empty_values:
-        click.echo(
-            f"🛑 The following lists contain empty values: {', '.join(sorted(arrays_with_empty_values))}. Projects ID {id}"
-        )
-        return True
-
-    return False
+    return {
+        column: None if pd.api.types.is_scalar(value) and pd.isna(value) else value
+        for column, value in data[columns].iloc[position].items()
+    }
 
 
 def strip_nested(value: Any) -> Any:
@@ -84,3 +64,83 @@ def strip_nested(value: Any) -> Any:
     elif isinstance(value, dict):
         return {key: strip_nested(val) for key, val in value.items()}
     return value
+
+
+def strip_column(column: pd.Series) -> pd.Series:
+    """Strip the string values in a column, leaving any other values as is.
+
+    :param pd.Series column: The column to strip.
+    :return pd.Series: The column with leading and trailing whitespace
+        removed from each of its string values.
+    """
+    try:
+        stripped = column.str.strip()
+    except AttributeError:
+        # The .str accessor is only available where the column holds strings.
+        return column
+    return column.where(stripped.isna(), stripped)
+
+
+def normalise_column(column: pd.Series) -> pd.Series:
+    """Strip the strings in a column, including those nested in lists and dicts.
+
+    The scalar strings are stripped in one vectorised pass, so only the
+    nested values are stripped one by one.
+
+    :param pd.Series column: The column to normalise.
+    :return pd.Series: The column with leading and trailing whitespace
+        removed from each of its strings, leaving any other values as is.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return normalise_column(column.astype(object)).astype(column.dtype.name)
+
+    stripped = strip_column(column)
+    if stripped.dtype != object:
+        return stripped
+
+    nested = np.flatnonzero(stripped.map(type).isin([list, dict]).to_numpy())
+    if len(nested) == 0:
+        return stripped
+
+    values = stripped.to_numpy(dtype=object, copy=True)
+    for position in nested:
+        values[position] = strip_nested(values[position])
+    return pd.Series(values, index=column.index, name=column.name)
+
+
+def normalise_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Strip every string in a frame once, so the mappers don't have to.
+
+    :param pd.DataFrame data: The frame to normalise.
+    :return pd.DataFrame: A copy of the frame with every string column
+        and every nested list and dict stripped, flagged as normalised in
+        its attrs.
+    """
+    normalised = data.copy(deep=False)
+    for position in range(data.shape[1]):
+        normalised.isetitem(position, normalise_column(data.iloc[:, position]))
+    normalised.attrs[NORMALISED_ATTR] = True
+    return normalised
+
+
+def ensure_normalised(data: pd.DataFrame) -> pd.DataFrame:
+    """Normalise a frame, unless it (or the frame it came from) already is.
+
+    :param pd.DataFrame data: The frame to normalise.
+    :return pd.DataFrame: The normalised frame.
+    """
+    if data.attrs.get(NORMALISED_ATTR, False):
+        return data
+    return normalise_frame(data)
+
+
+def reference_keys(references: pd.Series) -> pd.Series:
+    """Get the key each row is grouped by from its ApprovedRef (or FP number).
+
+    Rows whose references only differ in leading or trailing whitespace
+    share a key.
+
+    :param pd.Series references: The reference of each row.
+    :return pd.Series: The reference of each row, stripped, as a string.
+    """
+    return strip_column(references).astype(str)
@@ -0,0 +1,96 @@
+from collections import Counter, namedtuple
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from gcf_data_mapper.enums.rejection import RejectionRules
+
+# A rule the rows of a frame must follow: the check is given the columns of the rule and
+# returns True for every value that breaks it.
+ValidationRule = namedtuple("rule", ["rejection", "columns", "check"])
+
+
+def missing_values(values: pd.DataFrame) -> pd.DataFrame:
+    """Check for values that are missing (isna).
+
+    :param pd.DataFrame values: The values to check.
+    :return pd.DataFrame: True for every missing value.
+    """
+    return values.isna()
+
+
+def blank_values(values: pd.DataFrame) -> pd.DataFrame:
+    """Check for values that are empty once converted to strings.
+
+    :param pd.DataFrame values: The values to check.
+    :return pd.DataFrame: True for every empty value.
+    """
+    return values.astype(str).eq("")
+
+
+def enum_columns(*column_enums) -> list[str]:
+    """Get the column names of some column enums, without duplicates.
+
+    :return list[str]: The column names, in the order of the enums.
+    """
+    return list(
+        dict.fromkeys(str(column.value) for enum in column_enums for column in enum)
+    )
+
+
+def validate_frame(data: pd.DataFrame, rules: list[ValidationRule]) -> dict[str, Any]:
+    """Check every row of a frame against the rules, one whole column at a time.
+
+    The rules are checked in order, and a row is reported against the
+    first rule it breaks, as the mappers only give one reason per row.
+
+    :param pd.DataFrame data: The frame to validate.
+    :param list[ValidationRule] rules: The rules the rows must follow.
+    :return dict[str, Any]: Whether each row follows every rule
+        ("valid"), the rejection rule of the first rule each row breaks,
+        or None ("broken_rules"), the values breaking each rule
+        ("failures", by rejection rule, as the columns of the rule and an
+        array of which of their values break it) and the number of rows
+        first breaking each rule ("counts").
+    """
+    valid = np.ones(len(data), dtype=bool)
+    broken_rules = np.full(len(data), None, dtype=object)
+    failures = {}
+    counts: Counter = Counter()
+    for rule in rules:
+        failed = rule.check(data[rule.columns]).to_numpy(dtype=bool, na_value=False)
+        failures[rule.rejection] = (list(rule.columns), failed)
+        broken = failed.any(axis=1) & valid
+        broken_rules[broken] = rule.rejection
+        counts[rule.rejection] = int(broken.sum())
+        valid &= ~broken
+
+    return {
+        "valid": valid,
+        "broken_rules": broken_rules,
+        "failures": failures,
+        "counts": counts,
+    }
+
+
+def failed_columns(
+    validation: dict[str, Any], position: int, rule: Optional[RejectionRules] = None
+) -> list[str]:
+    """Get the columns of a row whose values break a rule.
+
+    :param dict[str, Any] validation: The validation, as returned by
+        `validate_frame`.
+    :param int position: The position of the row.
+    :param Optional[RejectionRules] rule: The rule, defaults to None
+        which picks the first rule the row breaks.
+    :return list[str]: The columns breaking the rule, in rule order.
+    """
+    if rule is None:
+        rule = validation["broken_rules"][position]
+    if rule is None:
+        return []
+    columns, failed = validation["failures"][rule]
+    return [
+        column for column, fails in zip(columns, failed[position], strict=True) if fails
+    ]
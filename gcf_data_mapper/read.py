@@ -1,21 +1,121 @@
 import json
+import logging
 import os
 from enum import Enum
-from typing import Optional, Union
+from typing import IO, Any, Iterator, Optional, Sequence, Union
 
-import click
+import numpy as np
 import pandas as pd
 
+from gcf_data_mapper.cache import read_cached
+from gcf_data_mapper.enums.document import (
+    RequiredDocumentColumns,
+    TranslatedDocumentColumns,
+)
+from gcf_data_mapper.enums.event import EventColumnNames
+from gcf_data_mapper.enums.family import FamilyColumnsNames
+from gcf_data_mapper.enums.read import CSVEngines
+from gcf_data_mapper.logs import echo
+from gcf_data_mapper.metrics import measure, record_stage
+from gcf_data_mapper.parsers.helpers import normalise_frame
+from gcf_data_mapper.reconcile import (
+    build_reference_index,
+    echo_reconciliation,
+    merge_projects,
+    reconciliation_report,
+    write_reconciliation,
+)
+
+# The top level fields of the GCF projects JSON that the mappers use.
+GCF_PROJECT_COLUMNS = sorted(
+    {str(e.value) for e in FamilyColumnsNames}.union(
+        str(e.value) for e in EventColumnNames
+    )
+)
+
+# The columns (and their types) of the MCF CSV files that the mappers use. IDs are
+# read as strings so they're never rendered as floats, and the document type (which
+# only has a handful of values) as a category.
+MCF_PROJECT_COLUMNS = ["FP number", *GCF_PROJECT_COLUMNS]
+MCF_PROJECT_DTYPES = {"FP number": "string"}
+MCF_DOCUMENT_COLUMNS = [
+    "FP number",
+    *[str(e.value) for e in RequiredDocumentColumns],
+    *[str(e.value) for e in TranslatedDocumentColumns],
+]
+MCF_DOCUMENT_DTYPES = {
+    "FP number": "string",
+    RequiredDocumentColumns.ID.value: "string",
+    RequiredDocumentColumns.TYPE.value: "category",
+}
+
+
+# The number of characters to read from a JSON file at a time when streaming it.
+JSON_READ_SIZE = 2**16
+
+# The values the C engine reads as missing that pyarrow doesn't by default.
+PYARROW_EXTRA_NULL_VALUES = ["<NA>", "None"]
+
 
 class AllowedFileExtensions(Enum):
     JSON = "json"
     CSV = "csv"
 
 
+def read_csv_pyarrow(file_path: str, read_options: dict[str, Any]) -> pd.DataFrame:
+    """Load the data from a CSV file with pyarrow, in one pass.
+
+    The columns declared as strings (or categories) are read as strings
+    by pyarrow itself, rather than inferred and then converted, so e.g.
+    an ID column with blanks is never read as floats (and rendered as
+    "2.0"). Blank and NA values are missing, as with the C engine.
+
+    :param str file_path: The filepath passed by the user to the tool.
+    :param dict[str, Any] read_options: The pandas read options, i.e.
+        the header, usecols and dtype.
+    :return pd.DataFrame: A Pandas DataFrame containing the CSV data.
+    """
+    import pyarrow as pa
+    from pyarrow import csv
+
+    header = read_options.get("header")
+    dtypes = read_options.get("dtype", {})
+    convert_options = csv.ConvertOptions(
+        include_columns=read_options.get("usecols"),
+        column_types={
+            column: pa.string()
+            for column, dtype in dtypes.items()
+            if dtype in ["string", "category"]
+        },
+        null_values=csv.ConvertOptions().null_values + PYARROW_EXTRA_NULL_VALUES,
+        strings_can_be_null=True,
+    )
+    table = csv.read_csv(
+        file_path,
+        read_options=csv.ReadOptions(
+            autogenerate_column_names=header is None,
+            skip_rows=header or 0,
+            encoding=read_options.get("encoding", "utf8"),
+        ),
+        convert_options=convert_options,
+    )
+    # As pandas' pyarrow engine, columns with only missing values are floats.
+    table = table.cast(
+        pa.schema(
+            field.with_type(pa.float64()) if pa.types.is_null(field.type) else field
+            for field in table.schema
+        )
+    )
+    return table.to_pandas().astype(dtypes)
+
+
 def read_csv_pd(
     file_path: str,
     header_rows: Optional[Union[int, list[int]]] = 0,
     chunk_size: int = 10**4,
+    columns: Optional[Sequence[str]] = None,
+    dtypes: Optional[dict[str, str]] = None,
+    engine: Optional[str] = None,
 ) -> pd.DataFrame:
     """Load the data from the specified CSV file into a Pandas DF.
 
@@ -28,6 +128,15 @@ def read_csv_pd(
         contain headers.
     :param Optional[int] chunk_size: The number of lines to read into
         memory in each batch iteratively. Defaults to 10**4.
+    :param Optional[Sequence[str]] columns: The columns to keep, where
+        present in the file. Defaults to None, which keeps every column.
+    :param Optional[dict[str, str]] dtypes: The types to read columns
+        as, where present in the file. Defaults to None, which infers
+        the type of every column.
+    :param Optional[str] engine: The CSV parser engine, one of
+        CSVEngines. The pyarrow engine reads the whole file at once
+        (requires pyarrow to be installed), see `read_csv_pyarrow`.
+        Defaults to None, which uses the C engine in chunks.
 
     :return pd.DataFrame: A Pandas DataFrame containing the CSV data if
         the file is successfully found and parsed by the Pandas CSV
@@ -38,28 +147,54 @@ def read_csv_pd(
     # This helps prevent out of memory errors where there is insufficient memory to
     # handling reading in the file contents e.g., when handling super large datasets.
     try:
+        read_options: dict[str, Any] = {"header": header_rows, "encoding": "utf-8"}
+
+        # Only parse the columns we need, with their types declared up front, rather
+        # than inferring the type of every column from its (object) values.
+        if columns is not None or dtypes is not None:
+            file_columns = pd.read_csv(file_path, nrows=0, **read_options).columns
+            usecols = [c for c in file_columns if columns is None or c in columns]
+            read_options["usecols"] = usecols
+            read_options["dtype"] = {
+                column: dtype
+                for column, dtype in (dtypes or {}).items()
+                if column in usecols
+            }
+
+        if engine == CSVEngines.PYARROW.value:
+            return read_csv_pyarrow(file_path, read_options)
+
         # By using 'chunksize' we create a list of chunks (each chunk being a DataFrame
         # containing 'chunk_size' lines of the original file).
-        all_chunks = pd.read_csv(
-            file_path, chunksize=chunk_size, header=header_rows, encoding="utf-8"
-        )
+        all_chunks = pd.read_csv(file_path, chunksize=chunk_size, **read_options)
 
         # We can then concatenate each of the chunks into a single dataframe, thus
         # reducing complexity.
         dataset = pd.concat(all_chunks)
-        return dataset
+
+        # Categorical chunks with different categories are concatenated as objects.
+        categoricals = {
+            column: dtype
+            for column, dtype in read_options.get("dtype", {}).items()
+            if dtype == "category"
+        }
+        return dataset.astype(categoricals) if categoricals else dataset
 
     except Exception as e:
-        click.echo(f"❌ Error reading file {file_path}: {e}")
+        echo(f"❌ Error reading file {file_path}: {e}", level=logging.ERROR)
 
     return pd.DataFrame([])
 
 
-def read_json_pd(file_path: str) -> pd.DataFrame:
+def read_json_pd(
+    file_path: str, columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
     """Load the data from the specified JSON file into a Pandas DF.
 
     :param str file_path: The filepath passed by the user to the
         tool.
+    :param Optional[Sequence[str]] columns: The top level fields to keep.
+        Defaults to None, which loads and normalises every field.
 
     :return pd.DataFrame: A Pandas DataFrame containing the CSV data if
         the file is successfully found and parsed by the Pandas CSV
@@ -67,14 +202,119 @@ def read_json_pd(file_path: str) -> pd.DataFrame:
     """
     df = pd.DataFrame([])
     try:
+        if columns is not None:
+            return read_json_columns_pd(file_path, columns)
+
         with open(file_path, "r") as file:
             df = pd.json_normalize(json.load(file))
     except Exception as e:
-        click.echo(f"❌ Error reading file {file_path}: {e}")
+        echo(f"❌ Error reading file {file_path}: {e}", level=logging.ERROR)
     return df
 
 
-def read_into_pandas(file_path: str, debug: bool = False) -> pd.DataFrame:
+def iter_json_array(file: IO[str], read_size: int = JSON_READ_SIZE) -> Iterator[Any]:
+    """Parse the items of a top level JSON array one at a time.
+
+    Only the item currently being parsed (plus at most one read of
+    lookahead) is held in memory, rather than the whole document.
+
+    :param IO[str] file: The JSON file, positioned at the start of the
+        array.
+    :param int read_size: The number of characters to read at a time.
+    :raises json.JSONDecodeError: if the file is not a valid JSON array.
+    :return Iterator[Any]: The items of the array, in order.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, at_eof = "", 0, False
+
+    def next_token() -> str:
+        """Skip any whitespace, reading more of the file where needed."""
+        nonlocal buffer, position, at_eof
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer) or at_eof:
+                return buffer[position : position + 1]
+            buffer, position = file.read(read_size), 0
+            at_eof = buffer == ""
+
+    if next_token() != "[":
+        raise json.JSONDecodeError("Expecting '['", buffer, position)
+    position += 1
+    if next_token() == "]":
+        return
+
+    while True:
+        # Decode the next item, reading more of the file while it is incomplete. An
+        # item running up to the end of what we have read (e.g. a number) may be too.
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+                if end < len(buffer) or at_eof:
+                    break
+            except json.JSONDecodeError:
+                if at_eof:
+                    raise
+            more = file.read(max(read_size, len(buffer) - position))
+            at_eof = more == ""
+            buffer, position = buffer[position:] + more, 0
+
+        yield item
+        position = end
+
+        token = next_token()
+        if token == "]":
+            return
+        if token != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+        position += 1
+        next_token()
+
+
+def read_json_columns_pd(file_path: str, columns: Sequence[str]) -> pd.DataFrame:
+    """Load only the given top level fields of a JSON array into a Pandas DF.
+
+    The records are streamed from the file and only the requested fields
+    are kept, with the values of each field collected into a column. Any
+    nested values (e.g. lists of dicts) are kept as they are.
+
+    :param str file_path: The filepath passed by the user to the tool.
+    :param Sequence[str] columns: The top level fields to keep.
+    :return pd.DataFrame: A Pandas DataFrame containing the fields that
+        are present in at least one record, with NaN for the records that
+        don't have them (as with json_normalize). If the file is not a
+        JSON array, it is read in full and the fields selected from that.
+    """
+    values: dict[str, list[Any]] = {column: [] for column in columns}
+    present = set()
+
+    with open(file_path, "r") as file:
+        if file.read(JSON_READ_SIZE).lstrip()[:1] != "[":
+            file.seek(0)
+            df = pd.json_normalize(json.load(file))
+            return df[[column for column in columns if column in df.columns]]
+        file.seek(0)
+
+        for record in iter_json_array(file):
+            for column in columns:
+                if column in record:
+                    values[column].append(record[column])
+                    present.add(column)
+                else:
+                    values[column].append(np.nan)
+
+    return pd.DataFrame(
+        {column: values[column] for column in columns if column in present}
+    )
+
+
+def read_into_pandas(
+    file_path: str,
+    debug: bool = False,
+    columns: Optional[Sequence[str]] = None,
+    dtypes: Optional[dict[str, str]] = None,
+    csv_engine: Optional[str] = None,
+) -> pd.DataFrame:
     """Read a CSV or JSON file into a Pandas dataframe.
 
     Simple program that validates a file path for existence, type and
@@ -83,6 +323,13 @@ def read_into_pandas(file_path: str, debug: bool = False) -> pd.DataFrame:
 
     :param file_path str: A file path to the csv/json file
     :param bool debug: Whether debug mode is on.
+    :param Optional[Sequence[str]] columns: The columns (or top level
+        fields of a JSON file) to keep. Defaults to None, which keeps
+        every column.
+    :param Optional[dict[str, str]] dtypes: The types to read CSV columns
+        as. Defaults to None, which infers the type of every column.
+    :param Optional[str] csv_engine: The CSV parser engine, one of
+        CSVEngines. Defaults to None, which uses the C engine.
     :raises ValueError: if a non csv or json file type is provided
     :raises FileNotFoundError: if the file does not exist
     :raises ValueError: if the file is empty
@@ -103,37 +350,68 @@ def read_into_pandas(file_path: str, debug: bool = False) -> pd.DataFrame:
         return df
 
     if file_extension == AllowedFileExtensions.CSV.value:
-        df = read_csv_pd(file_path)
+        df = read_csv_pd(file_path, columns=columns, dtypes=dtypes, engine=csv_engine)
 
     elif file_extension == AllowedFileExtensions.JSON.value:
-        df = read_json_pd(file_path)
+        df = read_json_pd(file_path, columns)
 
     return df
 
 
-def has_reference_mismatches(gcf_df: pd.DataFrame, mcf_df: pd.DataFrame) -> bool:
-    gcf_refs = set(gcf_df["ApprovedRef"].astype(str).str.strip())
-    mcf_refs = set(mcf_df["FP number"].astype(str).str.strip())
-
-    only_in_gcf = gcf_refs - mcf_refs  # GCF has it, MCF doesn't
-    only_in_mcf = mcf_refs - gcf_refs  # MCF has it, GCF doesn't
-
-    if only_in_mcf:
-        click.echo(f"⚠️  {len(only_in_mcf)} reference(s) in MCF but MISSING in GCF:")
-        for ref in sorted(only_in_mcf):
-            click.echo(f"  → {ref}")
+def read_input(
+    file_path: str,
+    debug: bool = False,
+    columns: Optional[Sequence[str]] = None,
+    dtypes: Optional[dict[str, str]] = None,
+    csv_engine: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> pd.DataFrame:
+    """Read an input file into a Pandas dataframe, through the cache if given.
 
-    if only_in_gcf:
-        click.echo(f"ℹ️  {len(only_in_gcf)} reference(s) in GCF but MISSING in MCF:")
-        for ref in sorted(only_in_gcf):
-            click.echo(f"  → {ref}")
+    :param file_path str: A file path to the csv/json file
+    :param bool debug: Whether debug mode is on.
+    :param Optional[Sequence[str]] columns: The columns (or top level
+        fields of a JSON file) to keep. Defaults to None, which keeps
+        every column.
+    :param Optional[dict[str, str]] dtypes: The types to read CSV columns
+        as. Defaults to None, which infers the type of every column.
+    :param Optional[str] csv_engine: The CSV parser engine, one of
+        CSVEngines. Defaults to None, which uses the C engine.
+    :param Optional[str] cache_dir: The directory to cache the parsed
+        frame in. Defaults to None, which doesn't cache it.
+    :return pd.DataFrame: The frame the file was read into.
+    """
+    options = {"columns": columns, "dtypes": dtypes, "csv_engine": csv_engine}
+    if cache_dir is None:
+        return read_into_pandas(file_path, debug, **options)
+    return read_cached(
+        cache_dir,
+        file_path,
+        lambda: read_into_pandas(file_path, debug, **options),
+        options,
+        debug,
+    )
 
-    if only_in_mcf or only_in_gcf:
-        return True
 
-    click.echo("✅ All references match between GCF and MCF.")
+def has_reference_mismatches(
+    gcf_df: pd.DataFrame,
+    mcf_df: pd.DataFrame,
+    report: Optional[dict[str, Any]] = None,
+    debug: bool = False,
+) -> bool:
+    """Check whether any reference only appears in the GCF or MCF projects.
 
-    return False
+    :param pd.DataFrame gcf_df: The GCF projects.
+    :param pd.DataFrame mcf_df: The MCF projects.
+    :param Optional[dict[str, Any]] report: The reconciliation report of
+        their references, which is built if not given.
+    :param bool debug: Whether debug mode is on.
+    :return bool: True if there are mismatched references.
+    """
+    if report is None:
+        index = build_reference_index(gcf_df["ApprovedRef"], mcf_df["FP number"])
+        report = reconciliation_report(index)
+    return echo_reconciliation(report, debug)
 
 
 def read(
@@ -141,6 +419,11 @@ def read(
     mcf_projects_file: str,
     mcf_docs_file: str,
     debug: bool = False,
+    gcf_project_columns: Optional[Sequence[str]] = None,
+    typed_csv: bool = False,
+    csv_engine: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    reconciliation_file: Optional[str] = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Put the mapped GCF data into a dictionary ready for dumping.
 
@@ -151,39 +434,100 @@ def read(
     :param str mcf_projects_file: The MCF projects filename.
     :param str mcf_docs_file: The MCF projects filename.
     :param bool debug: Whether debug mode is on.
+    :param Optional[Sequence[str]] gcf_project_columns: The top level
+        fields to keep from the GCF projects file, e.g.
+        GCF_PROJECT_COLUMNS. Defaults to None, which keeps every field.
+    :param bool typed_csv: Whether to only read the MCF columns the
+        mappers use, with declared types. Defaults to False.
+    :param Optional[str] csv_engine: The CSV parser engine, one of
+        CSVEngines. Defaults to None, which uses the C engine.
+    :param Optional[str] cache_dir: The directory to cache the parsed
+        input frames in. Defaults to None, which doesn't cache them.
+    :param Optional[str] reconciliation_file: The filename to write the
+        report of mismatched and duplicated references to, if any.
     :return dict[str, list[Optional[dict[str, Any]]]]: The GCF data
         mapped to the Document-Family-Collection-Event entity it
         corresponds to.
     """
-    gcf_projects: pd.DataFrame = read_into_pandas(gcf_projects_file, debug)
-    mcf_projects: pd.DataFrame = read_into_pandas(mcf_projects_file, debug)
-    mcf_docs: pd.DataFrame = read_into_pandas(mcf_docs_file, debug)
+    gcf_projects: pd.DataFrame = measure(
+        "read_gcf_projects",
+        read_input,
+        gcf_projects_file,
+        debug,
+        gcf_project_columns,
+        cache_dir=cache_dir,
+    )
+    mcf_projects: pd.DataFrame = measure(
+        "read_mcf_projects",
+        read_input,
+        mcf_projects_file,
+        debug,
+        MCF_PROJECT_COLUMNS if typed_csv else None,
+        MCF_PROJECT_DTYPES if typed_csv else None,
+        csv_engine,
+        cache_dir,
+    )
+    mcf_docs: pd.DataFrame = measure(
+        "read_mcf_docs",
+        read_input,
+        mcf_docs_file,
+        debug,
+        MCF_DOCUMENT_COLUMNS if typed_csv else None,
+        MCF_DOCUMENT_DTYPES if typed_csv else None,
+        csv_engine,
+        cache_dir,
+    )
 
     if any(
         data is None or data.empty for data in [gcf_projects, mcf_projects, mcf_docs]
     ):
         raise ValueError("One or more of the expected dataframes are empty")
 
-    if has_reference_mismatches(gcf_projects, mcf_projects):
+    # Number the references of every frame once, for the checks and the merge.
+    index, report = None, None
+    if "ApprovedRef" in gcf_projects and "FP number" in mcf_projects:
+        with record_stage("index_references"):
+            index = build_reference_index(
+                gcf_projects["ApprovedRef"],
+                mcf_projects["FP number"],
+                mcf_docs.get("FP number"),
+            )
+            report = reconciliation_report(index)
+        if reconciliation_file is not None:
+            write_reconciliation(report, reconciliation_file)
+
+    if measure(
+        "check_references",
+        has_reference_mismatches,
+        gcf_projects,
+        mcf_projects,
+        report,
+        debug,
+    ):
         raise ValueError("Reference mismatches detected between GCF and MCF data")
 
     # Join the MCF and GCF project data by the 'FP number' a.k.a ApprovedRef.
     if gcf_projects.shape[0] != mcf_projects.shape[0]:
-        click.echo(
-            f"❌ GCF project data {gcf_projects.shape[0]}, MCF project data {mcf_projects.shape[0]}"
+        echo(
+            f"❌ GCF project data {gcf_projects.shape[0]}, MCF project data {mcf_projects.shape[0]}",
+            level=logging.ERROR,
         )
         raise ValueError("Record number mismatch")
 
     if debug:
-        click.echo("📝 Merging GCF and MCF project data")
+        echo("📝 Merging GCF and MCF project data", level=logging.DEBUG)
     mcf_projects.rename(columns={"FP number": "ApprovedRef"}, inplace=True)
-    project_info = pd.merge(
-        left=gcf_projects,
-        right=mcf_projects,
+    project_info = measure(
+        "merge_projects", merge_projects, gcf_projects, mcf_projects, index
     )
 
+    # Strip every string of the projects once here, rather than in each of the mappers.
+    # The documents are only stripped once they're matched to their project and
+    # filtered by their type (see `map_document_chunks`).
+    project_info = measure("normalise_projects", normalise_frame, project_info)
+
     if debug:
-        click.echo(project_info)
-        click.echo(mcf_docs)
+        echo(project_info, level=logging.DEBUG)
+        echo(mcf_docs, level=logging.DEBUG)
 
     return project_info, mcf_docs
@@ -0,0 +1,219 @@
+import json
+import logging
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from gcf_data_mapper.logs import echo
+from gcf_data_mapper.parsers.helpers import reference_keys
+
+# The most references of each kind of mismatch to print, the rest are only counted.
+MISMATCH_ECHO_LIMIT = 10
+
+
+def build_reference_index(
+    gcf_refs: pd.Series, mcf_refs: pd.Series, doc_refs: Optional[pd.Series] = None
+) -> dict[str, Any]:
+    """Index the references of the GCF projects, MCF projects and MCF documents.
+
+    Every reference is stripped and numbered in a single pass, so that
+    the rows of all the frames can be compared by the number of their
+    reference rather than by string.
+
+    :param pd.Series gcf_refs: The ApprovedRef of each GCF project.
+    :param pd.Series mcf_refs: The FP number of each MCF project.
+    :param Optional[pd.Series] doc_refs: The FP number of each MCF
+        document, if any.
+    :return dict[str, Any]: The distinct references ("references") and,
+        per frame, the number of the reference of each row ("gcf", "mcf"
+        and "documents") and the number of rows with each reference (the
+        same keys suffixed with "_counts").
+    """
+    frames = {"gcf": gcf_refs, "mcf": mcf_refs, "documents": doc_refs}
+    frames = {name: refs for name, refs in frames.items() if refs is not None}
+    codes, references = pd.factorize(
+        pd.concat([reference_keys(refs) for refs in frames.values()], ignore_index=True)
+    )
+
+    index: dict[str, Any] = {"references": np.asarray(references, dtype=object)}
+    start = 0
+    for name, refs in frames.items():
+        index[name] = codes[start : start + len(refs)]
+        index[f"{name}_counts"] = np.bincount(index[name], minlength=len(references))
+        start += len(refs)
+    return index
+
+
+def cardinality(left_counts: np.ndarray, right_counts: np.ndarray) -> str:
+    matched = (left_counts > 0) & (right_counts > 0)
+    many_left = bool((left_counts[matched] > 1).any())
+    many_right = bool((right_counts[matched] > 1).any())
+    return f"{'many' if many_left else 'one'}-to-{'many' if many_right else 'one'}"
+
+
+def reconciliation_report(index: dict[str, Any]) -> dict[str, Any]:
+    """Report the mismatches, duplicates and cardinality of the references.
+
+    :param dict[str, Any] index: The reference index, as returned by
+        `build_reference_index`.
+    :return dict[str, Any]: The report, which can be dumped as JSON.
+    """
+    references = index["references"]
+    gcf_counts, mcf_counts = index["gcf_counts"], index["mcf_counts"]
+
+    def sorted_refs(mask: np.ndarray) -> list[str]:
+        return sorted(references[mask].tolist())
+
+    report = {
+        "gcf_projects": len(index["gcf"]),
+        "mcf_projects": len(index["mcf"]),
+        "only_in_gcf": sorted_refs((gcf_counts > 0) & (mcf_counts == 0)),
+        "only_in_mcf": sorted_refs((mcf_counts > 0) & (gcf_counts == 0)),
+        "duplicated_in_gcf": sorted_refs(gcf_counts > 1),
+        "duplicated_in_mcf": sorted_refs(mcf_counts > 1),
+        "cardinality": cardinality(gcf_counts, mcf_counts),
+    }
+    if "documents" in index:
+        report["documents"] = len(index["documents"])
+        report["documents_without_project"] = sorted_refs(
+            (index["documents_counts"] > 0) & (gcf_counts == 0)
+        )
+    return report
+
+
+def echo_refs(
+    message: str,
+    refs: list[str],
+    limit: int = MISMATCH_ECHO_LIMIT,
+    level: int = logging.INFO,
+):
+    echo(message, level)
+    for ref in refs[:limit]:
+        echo(f"  → {ref}", level)
+    if len(refs) > limit:
+        echo(f"  → … and {len(refs) - limit} more", level)
+
+
+def echo_reconciliation(report: dict[str, Any], debug: bool = False) -> bool:
+    """Print the reference mismatches (and, in debug mode, the duplicates).
+
+    At most MISMATCH_ECHO_LIMIT references are printed per mismatch, the
+    full lists are in the report.
+
+    :param dict[str, Any] report: The report, as returned by
+        `reconciliation_report`.
+    :param bool debug: Whether debug mode is on.
+    :return bool: True if any reference only appears in GCF or MCF.
+    """
+    only_in_mcf, only_in_gcf = report["only_in_mcf"], report["only_in_gcf"]
+    if only_in_mcf:
+        echo_refs(
+            f"⚠️  {len(only_in_mcf)} reference(s) in MCF but MISSING in GCF:",
+            only_in_mcf,
+            level=logging.WARNING,
+        )
+
+    if only_in_gcf:
+        echo_refs(
+            f"ℹ️  {len(only_in_gcf)} reference(s) in GCF but MISSING in MCF:",
+            only_in_gcf,
+        )
+
+    if debug:
+        for source in ["gcf", "mcf"]:
+            duplicated = report[f"duplicated_in_{source}"]
+            if duplicated:
+                echo_refs(
+                    f"📝 {len(duplicated)} reference(s) duplicated in "
+                    f"{source.upper()}:",
+                    duplicated,
+                    level=logging.DEBUG,
+                )
+        echo(f"📝 GCF to MCF projects are {report['cardinality']}", level=logging.DEBUG)
+
+    if only_in_mcf or only_in_gcf:
+        return True
+
+    echo("✅ All references match between GCF and MCF.")
+
+    return False
+
+
+def write_reconciliation(report: dict[str, Any], reconciliation_file: str):
+    """Write the reconciliation report to a JSON file.
+
+    :param dict[str, Any] report: The report, as returned by
+        `reconciliation_report`.
+    :param str reconciliation_file: The report filename.
+    """
+    with open(reconciliation_file, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def is_plain_reference_column(
+    refs: pd.Series, codes: np.ndarray, references: np.ndarray
+) -> bool:
+    """Check every reference is a string that needed no stripping.
+
+    The references can then be matched by their index numbers exactly as
+    pd.merge would match their values.
+
+    :param pd.Series refs: The references.
+    :param np.ndarray codes: The number of each reference in the index.
+    :param np.ndarray references: The distinct references of the index.
+    :return bool: True if the references are plain strings.
+    """
+    if not pd.api.types.is_string_dtype(refs) or refs.isna().any():
+        return False
+    return bool((refs.to_numpy(dtype=object) == references[codes]).all())
+
+
+def merge_projects(
+    gcf_projects: pd.DataFrame,
+    mcf_projects: pd.DataFrame,
+    index: Optional[dict[str, Any]] = None,
+) -> pd.DataFrame:
+    """Join the MCF projects onto the GCF projects by their ApprovedRef.
+
+    Where every reference appears exactly once on each side, the MCF row
+    of each GCF project is looked up by its reference number in the
+    index. Otherwise (or without an index) this falls back to pd.merge
+    on the shared columns, which gives the same result.
+
+    :param pd.DataFrame gcf_projects: The GCF projects.
+    :param pd.DataFrame mcf_projects: The MCF projects, with their FP
+        number renamed to ApprovedRef.
+    :param Optional[dict[str, Any]] index: The reference index, as
+        returned by `build_reference_index`.
+    :return pd.DataFrame: The GCF projects joined with their MCF project.
+    """
+    if index is None:
+        return pd.merge(left=gcf_projects, right=mcf_projects)
+
+    key = "ApprovedRef"
+    gcf_counts, mcf_counts = index["gcf_counts"], index["mcf_counts"]
+    shared_columns = set(gcf_projects.columns) & set(mcf_projects.columns) - {key}
+    if (
+        shared_columns
+        or not np.array_equal(gcf_counts, mcf_counts)
+        or (gcf_counts > 1).any()
+        or not is_plain_reference_column(
+            gcf_projects[key], index["gcf"], index["references"]
+        )
+        or not is_plain_reference_column(
+            mcf_projects[key], index["mcf"], index["references"]
+        )
+    ):
+        return pd.merge(left=gcf_projects, right=mcf_projects)
+
+    mcf_positions = np.empty(len(index["references"]), dtype=np.intp)
+    mcf_positions[index["mcf"]] = np.arange(len(index["mcf"]))
+    mcf_columns = mcf_projects.drop(columns=key).iloc[mcf_positions[index["gcf"]]]
+    return pd.concat(
+        [
+            gcf_projects.reset_index(drop=True),
+            mcf_columns.reset_index(drop=True),
+        ],
+        axis=1,
+    )
@@ -0,0 +1,243 @@
+import csv
+import json
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Hashable, Iterator, Optional
+
+import click
+
+from gcf_data_mapper.enums.rejection import RejectionRules
+from gcf_data_mapper.logs import echo
+
+# The columns of a rejections file, where the ids and values are JSON objects in CSV. The
+# records also hold the label of the row they were rejected from and their message,
+# which aren't written.
+REJECTION_FIELDS = ["entity_type", "rule", "ids", "values"]
+
+# The order a single process rejects the rows of each entity type in, as the documents
+# are only mapped once the output is written.
+REJECTION_ORDER = ["families", "events", "documents"]
+
+# The number of bytes of rejections buffered before they're written to the file, so a
+# run skipping many rows doesn't pay for a write per row.
+REJECTIONS_BUFFER_SIZE = 2**20
+
+# While collecting, the number of rejections per entity type and rule, and either the
+# file they're written to or the list they're kept in. While not collecting, the message
+# of each rejection is echoed as it happens. Either way, the rejections may be held back
+# in a list instead (see `holding_rejections`).
+_collector: dict[str, Any] = {}
+
+# Reused for every record, as json.dumps builds a new encoder per call with these options.
+_record_encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+def start_rejections(rejections_file: Optional[str] = None):
+    """Start collecting the rows the mappers skip, rather than echoing them.
+
+    :param Optional[str] rejections_file: The file to write the
+        rejections to, as CSV if it ends in .csv and as newline-delimited
+        JSON otherwise. Defaults to None, which keeps the rejections in
+        memory until they're taken (see `take_rejections`).
+    """
+    stop_rejections()
+    _collector["counts"] = Counter()
+    _collector["records"] = []
+    if rejections_file is None:
+        return
+
+    _collector["file"] = open(
+        rejections_file,
+        "w",
+        encoding="utf-8",
+        newline="",
+        buffering=REJECTIONS_BUFFER_SIZE,
+    )
+    if rejections_file.lower().endswith(".csv"):
+        _collector["csv"] = csv.DictWriter(_collector["file"], REJECTION_FIELDS)
+        _collector["csv"].writeheader()
+
+
+def stop_rejections() -> Counter:
+    """Stop collecting the rows the mappers skip, closing the rejections file.
+
+    :return Counter: The number of rejections per entity type and rule.
+    """
+    counts = _collector.get("counts", Counter())
+    if "file" in _collector:
+        _collector["file"].close()
+    _collector.clear()
+    return counts
+
+
+def flush_rejections():
+    """Write out the rejections buffered for the rejections file, if any.
+
+    A forked worker process inherits the buffer, and would write it out
+    again once it closes its copy of the file.
+    """
+    if "file" in _collector:
+        _collector["file"].flush()
+
+
+def collecting_rejections() -> bool:
+    return "counts" in _collector
+
+
+def record_rejections(records: list[dict[str, Any]]):
+    """Count the rejections and write them to the rejections file (or keep them).
+
+    :param list[dict[str, Any]] records: The rejections, each holding
+        the REJECTION_FIELDS.
+    """
+    for record in records:
+        _collector["counts"][(record["entity_type"], record["rule"])] += 1
+
+    if "csv" in _collector:
+        _collector["csv"].writerows(
+            {
+                "entity_type": record["entity_type"],
+                "rule": record["rule"],
+                "ids": _record_encoder.encode(record["ids"]),
+                "values": _record_encoder.encode(record["values"]),
+            }
+            for record in records
+        )
+    elif "file" in _collector:
+        _collector["file"].writelines(
+            _record_encoder.encode({field: record[field] for field in REJECTION_FIELDS})
+            + "\n"
+            for record in records
+        )
+    else:
+        _collector["records"].extend(records)
+
+
+def report_rejections(records: list[dict[str, Any]]):
+    """Record the rejections while collecting, otherwise echo their messages.
+
+    :param list[dict[str, Any]] records: The rejections, as recorded by
+        `reject`.
+    """
+    if collecting_rejections():
+        record_rejections(records)
+        return
+
+    for record in records:
+        echo(
+            record["message"],
+            level=logging.WARNING,
+            rate_key=f"{record['entity_type']} {record['rule']}",
+            entity_type=record["entity_type"],
+            rule=record["rule"],
+            ids=record["ids"],
+            values=record["values"],
+        )
+
+
+def rejection_order(record: dict[str, Any]) -> tuple[int, Any]:
+    """Get the key to sort a rejection by, its entity type (in REJECTION_ORDER) then row.
+
+    :param dict[str, Any] record: The rejection, labelled with the
+        position of the row it was rejected from.
+    :return tuple[int, Any]: The sort key.
+    """
+    return REJECTION_ORDER.index(record["entity_type"]), record["row"]
+
+
+def sort_rejections(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Sort the rejections into the order a single process rejects the rows in.
+
+    :param list[dict[str, Any]] records: The rejections, each labelled
+        with the position of the row it was rejected from.
+    :return list[dict[str, Any]]: The rejections, in a stable order (see
+        `rejection_order`).
+    """
+    return sorted(records, key=rejection_order)
+
+
+@contextmanager
+def holding_rejections() -> Iterator[list[dict[str, Any]]]:
+    """Hold back the rejections made within the block, rather than reporting them.
+
+    They are neither counted, written nor echoed, and can be reported
+    later with `report_rejections`, e.g. once they're sorted.
+
+    :return Iterator[list[dict[str, Any]]]: The list the rejections are
+        held in.
+    """
+    held: list[dict[str, Any]] = []
+    _collector["held"] = held
+    try:
+        yield held
+    finally:
+        _collector.pop("held", None)
+
+
+def take_rejections() -> list[dict[str, Any]]:
+    """Take the rejections kept in memory since they were last taken.
+
+    :return list[dict[str, Any]]: The rejections.
+    """
+    if not collecting_rejections():
+        return []
+    records = _collector["records"]
+    _collector["records"] = []
+    return records
+
+
+def reject(
+    entity_type: str,
+    rule: RejectionRules,
+    message: str,
+    ids: dict[str, Any],
+    values: Optional[dict[str, Any]] = None,
+    row: Optional[Hashable] = None,
+):
+    """Report a row the mappers skip (or part of a row they drop).
+
+    While collecting, the rejection is recorded with the ids of the row
+    and the values that broke the rule. Otherwise its message is echoed.
+
+    :param str entity_type: The entity type the row was mapped to.
+    :param RejectionRules rule: The rule the row broke.
+    :param str message: The message to echo when not collecting.
+    :param dict[str, Any] ids: The ids identifying the row.
+    :param Optional[dict[str, Any]] values: The offending values of the
+        row, if any.
+    :param Optional[Hashable] row: The index label of the row, so the
+        rejections of rows mapped apart can be put back in order.
+    """
+    record = {
+        "entity_type": entity_type,
+        "rule": rule.value,
+        "ids": ids,
+        "values": values or {},
+        "row": row,
+        "message": message,
+    }
+    if "held" in _collector:
+        _collector["held"].append(record)
+        return
+    report_rejections([record])
+
+
+def echo_rejection_counts(counts: Counter, rejections_file: str):
+    """Print the number of rejections per entity type and rule.
+
+    :param Counter counts: The number of rejections per entity type and
+        rule, as returned by `stop_rejections`.
+    :param str rejections_file: The rejections filename.
+    """
+    if not counts:
+        echo("✅ No rows were rejected.")
+        return
+
+    echo(
+        f"🛑 Rejected {sum(counts.values())} row(s), see "
+        f"{click.format_filename(rejections_file)}:",
+        level=logging.WARNING,
+    )
+    for (entity_type, rule), count in sorted(counts.items()):
+        echo(f"  → {entity_type} {rule}: {count}", level=logging.WARNING)
@@ -0,0 +1,352 @@
+import gzip
+import io
+import json
+import os
+from contextlib import contextmanager, suppress
+from typing import IO, Any, Callable, Iterable, Iterator, Mapping, Optional
+
+from gcf_data_mapper.enums.write import Compressions, OutputFormats
+
+# Match the layout json.dump produces with these settings, so the streamed output is
+# identical to dumping the whole mapped data at once.
+INDENT = 2
+JSON_SETTINGS = {"ensure_ascii": False, "indent": INDENT}
+
+# Without indentation or the spaces after the separators.
+COMPACT_JSON_SETTINGS = {"ensure_ascii": False, "separators": (",", ":")}
+
+# The level each compression is written with unless another is given, trading some size
+# for speed over the maximum levels.
+DEFAULT_COMPRESSION_LEVELS = {Compressions.GZIP: 6, Compressions.ZSTD: 3}
+
+# The Parquet codec to compress each column with for each output file compression.
+PARQUET_CODECS = {Compressions.GZIP: "gzip", Compressions.ZSTD: "zstd"}
+
+# The prefix of the file each output file is written to before it replaces it, which
+# keeps the suffixes of the output file (e.g. the compression).
+PARTIAL_FILE_PREFIX = ".partial."
+
+
+def write_json_array(
+    items: Iterable[Optional[dict[str, Any]]], file: IO[str], depth: int
+) -> int:
+    """Write the items to the file as a JSON array, one item at a time.
+
+    :param Iterable[Optional[dict[str, Any]]] items: The items to write.
+    :param IO[str] file: The file to write to.
+    :param int depth: The nesting depth of the array in the document.
+    :return int: The number of items written.
+    """
+    item_indent = " " * (INDENT * (depth + 1))
+    count = 0
+
+    for item in items:
+        file.write(",\n" if count else "[\n")
+        serialised = json.dumps(item, **JSON_SETTINGS)
+        file.write(item_indent + serialised.replace("\n", "\n" + item_indent))
+        count += 1
+
+    file.write(f"\n{' ' * (INDENT * depth)}]" if count else "[]")
+    return count
+
+
+def write_json(
+    mapped_data: Mapping[str, Iterable[Optional[dict[str, Any]]]], file: IO[str]
+) -> dict[str, int]:
+    """Stream the mapped data to the file in the bulk import JSON format.
+
+    Each entity list is written array by array and the file is flushed
+    after each one, so the entities can be produced by iterators and
+    never have to be held in memory all at once.
+
+    :param Mapping[str, Iterable[Optional[dict[str, Any]]]] mapped_data:
+        The mapped GCF data, keyed by entity type.
+    :param IO[str] file: The file to write to.
+    :return dict[str, int]: The number of items written per entity type.
+    """
+    counts = {}
+    indent = " " * INDENT
+
+    file.write("{")
+    for position, (entity_type, items) in enumerate(mapped_data.items()):
+        file.write(",\n" if position else "\n")
+        file.write(f"{indent}{json.dumps(entity_type, **JSON_SETTINGS)}: ")
+        counts[entity_type] = write_json_array(items, file, depth=1)
+        file.flush()
+    file.write("\n}" if counts else "}")
+    file.flush()
+
+    return counts
+
+
+def write_compact_json(
+    mapped_data: Mapping[str, Iterable[Optional[dict[str, Any]]]], file: IO[str]
+) -> dict[str, int]:
+    """Stream the mapped data to the file as JSON without any whitespace.
+
+    :param Mapping[str, Iterable[Optional[dict[str, Any]]]] mapped_data:
+        The mapped GCF data, keyed by entity type.
+    :param IO[str] file: The file to write to.
+    :return dict[str, int]: The number of items written per entity type.
+    """
+    counts = {}
+
+    file.write("{")
+    for position, (entity_type, items) in enumerate(mapped_data.items()):
+        file.write("," if position else "")
+        file.write(f"{json.dumps(entity_type, **COMPACT_JSON_SETTINGS)}:[")
+        count = 0
+        for item in items:
+            file.write(
+                ("," if count else "") + json.dumps(item, **COMPACT_JSON_SETTINGS)
+            )
+            count += 1
+        file.write("]")
+        counts[entity_type] = count
+        file.flush()
+    file.write("}")
+    file.flush()
+
+    return counts
+
+
+def output_compression(output_file: str) -> tuple[str, Optional[Compressions]]:
+    """Split the compression suffix, if any, off the output filename.
+
+    :param str output_file: The output filename, e.g. output.json.gz.
+    :return tuple[str, Optional[Compressions]]: The filename without the
+        compression suffix, e.g. output.json, and the compression.
+    """
+    for compression in Compressions:
+        if output_file.lower().endswith(compression.value):
+            return output_file[: -len(compression.value)], compression
+    return output_file, None
+
+
+def open_output(output_file: str, compression_level: Optional[int] = None) -> IO[str]:
+    """Open an output file for writing text, compressed as its suffix says.
+
+    Whatever is written to the file is fed to the compressor as it goes,
+    so the uncompressed output is never held in memory. Gzip files are
+    written without a timestamp, so the same output compresses to the
+    same bytes. Zstandard files need the zstandard package installed.
+
+    :param str output_file: The output filename, compressed with gzip if
+        it ends in .gz and with Zstandard if it ends in .zst.
+    :param Optional[int] compression_level: The level to compress with,
+        defaults to DEFAULT_COMPRESSION_LEVELS. Ignored for uncompressed
+        files.
+    :return IO[str]: The file, to be closed by the caller.
+    """
+    _, compression = output_compression(output_file)
+    if compression is None:
+        return open(output_file, "w+", encoding="utf-8")
+
+    if compression_level is None:
+        compression_level = DEFAULT_COMPRESSION_LEVELS[compression]
+
+    if compression == Compressions.GZIP:
+        return io.TextIOWrapper(
+            gzip.GzipFile(output_file, "wb", compression_level, mtime=0),
+            encoding="utf-8",
+        )
+
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "Writing Zstandard compressed output needs zstandard installed "
+            "(the fast extra)"
+        ) from e
+    return zstandard.open(
+        output_file,
+        "wt",
+        cctx=zstandard.ZstdCompressor(level=compression_level),
+        encoding="utf-8",
+    )
+
+
+def entity_file(output_file: str, entity_type: str, extension: str) -> str:
+    """Get the filename the entities of one type are written to.
+
+    :param str output_file: The output filename, e.g. output.json or
+        output.json.gz.
+    :param str entity_type: The entity type, e.g. families.
+    :param str extension: The extension of the format, e.g. .ndjson.
+    :return str: The filename, e.g. output.families.ndjson, keeping any
+        compression suffix, e.g. output.families.ndjson.gz.
+    """
+    base, compression = output_compression(output_file)
+    root, _ = os.path.splitext(base)
+    return f"{root}.{entity_type}{extension}{compression.value if compression else ''}"
+
+
+def partial_file(output_file: str) -> str:
+    """Get the filename an output file is written to until it's complete.
+
+    :param str output_file: The output filename, e.g. data/output.json.
+    :return str: The filename, in the same directory so it can replace
+        the output file in one step, e.g. data/.partial.output.json.
+    """
+    directory, name = os.path.split(output_file)
+    return os.path.join(directory, f"{PARTIAL_FILE_PREFIX}{name}")
+
+
+@contextmanager
+def replacing(output_files: list[str]) -> Iterator[list[str]]:
+    """Write output files in full before replacing them, so none is left half-written.
+
+    The files are written to partial files (see `partial_file`), which
+    replace the output files once the block succeeds. Should it fail,
+    they are removed, leaving any previous output files as they were.
+
+    :param list[str] output_files: The output filenames.
+    :return Iterator[list[str]]: The partial filenames to write to.
+    """
+    partial_files = [partial_file(output_file) for output_file in output_files]
+    try:
+        yield partial_files
+    except BaseException:
+        for partial in partial_files:
+            with suppress(FileNotFoundError):
+                os.remove(partial)
+        raise
+
+    for partial, output_file in zip(partial_files, output_files, strict=True):
+        os.replace(partial, output_file)
+
+
+def dump_json(
+    mapped_data: Mapping[str, Iterable[Optional[dict[str, Any]]]],
+    output_file: str,
+    compression_level: Optional[int] = None,
+) -> dict[str, int]:
+    """Stream the mapped data to the output file in the bulk import JSON format.
+
+    :param Mapping[str, Iterable[Optional[dict[str, Any]]]] mapped_data:
+        The mapped GCF data, keyed by entity type.
+    :param str output_file: The output filename, compressed as its
+        suffix says (see `open_output`). It's only replaced once the data
+        is written in full (see `replacing`).
+    :param Optional[int] compression_level: The level to compress with.
+    :return dict[str, int]: The number of items written per entity type.
+    """
+    with replacing([output_file]) as [partial]:
+        with open_output(partial, compression_level) as f:
+            return write_json(mapped_data, f)
+
+
+def dump_compact_json(
+    mapped_data: Mapping[str, Iterable[Optional[dict[str, Any]]]],
+    output_file: str,
+    compression_level: Optional[int] = None,
+) -> dict[str, int]:
+    """Stream the mapped data to the output file as JSON without any whitespace.
+
+    :param Mapping[str, Iterable[Optional[dict[str, Any]]]] mapped_data:
+        The mapped GCF data, keyed by entity type.
+    :param str output_file: The output filename, compressed as its
+        suffix says (see `open_output`). It's only replaced once the data
+        is written in full (see `replacing`).
+    :param Optional[int] compression_level: The level to compress with.
+    :return dict[str, int]: The number of items written per entity type.
+    """
+    with replacing([output_file]) as [partial]:
+        with open_output(partial, compression_level) as f:
+            return write_compact_json(mapped_data, f)
+
+
+def dump_ndjson(
+    mapped_data: Mapping[str, Iterable[Optional[dict[str, Any]]]],
+    output_file: str,
+    compression_level: Optional[int] = None,
+) -> dict[str, int]:
+    """Stream the entities of each type to their own newline-delimited JSON file.
+
+    Each line of a file holds one entity, so the files can be read back
+    line by line.
+
+    :param Mapping[str, Iterable[Optional[dict[str, Any]]]] mapped_data:
+        The mapped GCF data, keyed by entity type.
+    :param str output_file: The output filename, which the filename of
+        each entity type is derived from (see `entity_file`). The files
+        are compressed as its suffix says (see `open_output`), and only
+        replaced once every one is written in full (see `replacing`).
+    :param Optional[int] compression_level: The level to compress with.
+    :return dict[str, int]: The number of items written per entity type.
+    """
+    counts = {}
+    entity_files = [
+        entity_file(output_file, entity_type, ".ndjson") for entity_type in mapped_data
+    ]
+    with replacing(entity_files) as partial_files:
+        for (entity_type, items), partial in zip(
+            mapped_data.items(), partial_files, strict=True
+        ):
+            count = 0
+            with open_output(partial, compression_level) as f:
+                for item in items:
+                    f.write(json.dumps(item, **COMPACT_JSON_SETTINGS) + "\n")
+                    count += 1
+            counts[entity_type] = count
+    return counts
+
+
+def dump_parquet(
+    mapped_data: Mapping[str, Iterable[Optional[dict[str, Any]]]],
+    output_file: str,
+    compression_level: Optional[int] = None,
+) -> dict[str, int]:
+    """Write the entities of each type to their own Parquet file.
+
+    The nested metadata of the entities is kept as (nested) struct and
+    list columns. As the column types are inferred from all the entities
+    of a type, each type is collected in memory before it's written.
+    Requires pyarrow to be installed.
+
+    :param Mapping[str, Iterable[Optional[dict[str, Any]]]] mapped_data:
+        The mapped GCF data, keyed by entity type.
+    :param str output_file: The output filename, which the filename of
+        each entity type is derived from (see `entity_file`). A .gz or
+        .zst suffix compresses the columns with the gzip or zstd codec,
+        rather than the whole files. The files are only replaced once
+        every one is written in full (see `replacing`).
+    :param Optional[int] compression_level: The level to compress the
+        columns with, if a codec is chosen.
+    :return dict[str, int]: The number of items written per entity type.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    base, compression = output_compression(output_file)
+    codec = {"compression": PARQUET_CODECS[compression]} if compression else {}
+    if compression and compression_level is not None:
+        codec["compression_level"] = compression_level
+
+    counts = {}
+    entity_files = [
+        entity_file(base, entity_type, ".parquet") for entity_type in mapped_data
+    ]
+    with replacing(entity_files) as partial_files:
+        for (entity_type, items), partial in zip(
+            mapped_data.items(), partial_files, strict=True
+        ):
+            table = pa.Table.from_pylist(list(items))
+            pq.write_table(table, partial, **codec)
+            counts[entity_type] = table.num_rows
+    return counts
+
+
+# The function dumping the mapped data to the output file(s) in each format.
+WRITERS: dict[
+    str,
+    Callable[
+        [Mapping[str, Iterable[Optional[dict[str, Any]]]], str, Optional[int]],
+        dict[str, int],
+    ],
+] = {
+    OutputFormats.JSON.value: dump_json,
+    OutputFormats.COMPACT_JSON.value: dump_compact_json,
+    OutputFormats.NDJSON.value: dump_ndjson,
+    OutputFormats.PARQUET.value: dump_parquet,
+}
@@ -1,7 +1,8 @@
+import click
 import pytest
 from click.testing import CliRunner
 
-from gcf_data_mapper.cli import entrypoint
+from gcf_data_mapper.cli import dump_output, entrypoint, raising_mapping_errors
 
 
 @pytest.mark.skip()
@@ -21,3 +22,32 @@ def test_entrypoint_success():
         item in result.output.strip()
         for item in ["Finished mapping GCF data", "Finished dumping mapped GCF data"]
     )
+
+
+def test_dump_output_reports_mapping_errors_apart_from_write_errors(tmp_path, capsys):
+    def documents():
+        yield {"import_id": "GCF.document.FP001_1.1"}
+        raise KeyError("ProjectsID")
+
+    output_file = tmp_path / "output.json"
+    with pytest.raises(SystemExit):
+        dump_output(
+            {"documents": raising_mapping_errors(documents())},
+            str(output_file),
+            debug=False,
+        )
+
+    output = capsys.readouterr().out
+    assert "Failed to map GCF data to expected JSON" in output
+    assert "Failed to dump JSON" not in output
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_is_opt_in_and_defaults_to_the_working_directory(tmp_path, monkeypatch):
+    options = {option.name: option for option in entrypoint.params}
+    monkeypatch.chdir(tmp_path)
+    with click.Context(entrypoint) as ctx:
+        assert options["cache"].get_default(ctx) is False
+        assert options["cache_dir"].get_default(ctx) == str(
+            tmp_path / ".cache" / "gcf_data_mapper"
+        )
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, check=True, text=True
+    )
+
+
+def test_cli_import_does_not_import_heavy_modules():
+    # Importing pandas alone takes around half a second, so the CLI only imports it
+    # (and numpy) once it starts mapping.
+    result = run_python(
+        "-c",
+        "import sys, gcf_data_mapper.cli; "
+        "print(*sorted({'numpy', 'pandas'} & sys.modules.keys()))",
+    )
+    assert result.stdout.strip() == ""
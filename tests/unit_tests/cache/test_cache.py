@@ -0,0 +1,107 @@
+import os
+
+import pandas as pd
+import pytest
+
+from gcf_data_mapper import cache
+from gcf_data_mapper.cache import read_cached
+from gcf_data_mapper.read import read_input
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    file_path = tmp_path / "projects.csv"
+    file_path.write_text("FP number,Title\nFP001,title1\nFP002,title2\n")
+    return str(file_path)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def counting_reader(file_path, calls):
+    def read():
+        calls.append(file_path)
+        return pd.read_csv(file_path)
+
+    return read
+
+
+def test_unchanged_file_is_loaded_from_the_cache(input_file, cache_dir):
+    calls = []
+    first = read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+    second = read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+
+    assert calls == [input_file]
+    pd.testing.assert_frame_equal(first, second)
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_changed_file_replaces_its_cached_frame(input_file, cache_dir):
+    calls = []
+    read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+    with open(input_file, "a") as f:
+        f.write("FP003,title3\n")
+
+    df = read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+    assert calls == [input_file, input_file]
+    assert df["FP number"].tolist() == ["FP001", "FP002", "FP003"]
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_unchanged_file_is_not_hashed(input_file, cache_dir, monkeypatch):
+    calls = []
+    read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+
+    def file_hash(file_path):
+        raise AssertionError(f"{file_path} was hashed")
+
+    monkeypatch.setattr(cache, "file_hash", file_hash)
+    read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+    assert calls == [input_file]
+
+
+def test_touched_file_is_hashed_once(input_file, cache_dir, monkeypatch):
+    calls = []
+    read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+    stat = os.stat(input_file)
+    os.utime(input_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    hashed = []
+    file_hash = cache.file_hash
+    monkeypatch.setattr(
+        cache,
+        "file_hash",
+        lambda file_path: hashed.append(file_path) or file_hash(file_path),
+    )
+    read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+    read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+    assert calls == [input_file]
+    assert hashed == [input_file]
+
+
+def test_read_options_are_part_of_the_key(input_file, cache_dir):
+    typed = read_input(input_file, columns=["FP number"], cache_dir=cache_dir)
+    untyped = read_input(input_file, cache_dir=cache_dir)
+
+    assert list(typed.columns) == ["FP number"]
+    assert list(untyped.columns) == ["FP number", "Title"]
+
+
+def test_unreadable_cache_file_is_ignored(input_file, cache_dir, capsys):
+    calls = []
+    read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+    [cache_file] = [name for name in os.listdir(cache_dir) if name.endswith(".pkl")]
+    with open(os.path.join(cache_dir, cache_file), "w") as f:
+        f.write("not a pickle")
+
+    df = read_cached(cache_dir, input_file, counting_reader(input_file, calls), {})
+    assert len(calls) == 2
+    assert len(df) == 2
+    assert "Ignoring unreadable cache file" in capsys.readouterr().out
+
+
+def test_empty_frames_are_not_cached(input_file, cache_dir):
+    read_cached(cache_dir, input_file, pd.DataFrame, {})
+    assert not os.path.exists(cache_dir)
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.clock import (
+    get_reference_time,
+    reset_reference_time,
+    set_reference_time,
+)
+from gcf_data_mapper.parsers.family import calculate_statuses
+
+
+@pytest.fixture(autouse=True)
+def no_reference_time():
+    reset_reference_time()
+    yield
+    reset_reference_time()
+
+
+def test_reference_time_defaults_to_now():
+    before = datetime.now(timezone.utc)
+    assert before <= get_reference_time() <= datetime.now(timezone.utc)
+
+
+def test_set_reference_time_fixes_the_current_time():
+    reference_time = set_reference_time()
+    assert get_reference_time() == reference_time
+    assert get_reference_time() == reference_time
+
+
+@pytest.mark.parametrize(
+    ("reference_time", "expected"),
+    [
+        (datetime(2020, 1, 1, 12), datetime(2020, 1, 1, 12, tzinfo=timezone.utc)),
+        (
+            datetime(2020, 1, 1, 12, tzinfo=timezone(timedelta(hours=2))),
+            datetime(2020, 1, 1, 10, tzinfo=timezone.utc),
+        ),
+    ],
+)
+def test_set_reference_time_converts_to_utc(reference_time, expected):
+    assert set_reference_time(reference_time) == expected
+    assert get_reference_time() == expected
+
+
+def test_statuses_are_calculated_against_the_reference_time():
+    projects = pd.DataFrame(
+        {
+            "Status": [None],
+            "ApprovalDate": ["2016-06-30T00:00:00.000Z"],
+            "StartDate": ["2017-06-30T00:00:00.000Z"],
+            "DateCompletion": ["2018-06-30T00:00:00.000Z"],
+        },
+        dtype=object,
+    )
+
+    set_reference_time(datetime(2017, 1, 1))
+    statuses, _ = calculate_statuses(projects)
+    assert statuses.tolist() == ["Project Approved"]
+
+    statuses, _ = calculate_statuses(
+        projects, pd.Timestamp("2018-01-01T00:00:00", tz="UTC")
+    )
+    assert statuses.tolist() == ["Under Implementation"]
+
+    reset_reference_time()
+    statuses, _ = calculate_statuses(projects)
+    assert statuses.tolist() == ["Project Completed"]
@@ -0,0 +1,5 @@
+from tests.unit_tests.parallel.conftest import (  # noqa: F401
+    mock_doc_info,
+    mock_project,
+    mock_project_info,
+)
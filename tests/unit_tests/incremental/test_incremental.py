@@ -0,0 +1,107 @@
+import json
+
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.cli import wrangle_to_json
+from gcf_data_mapper.incremental import map_incrementally
+from gcf_data_mapper.rejections import start_rejections, stop_rejections
+from tests.unit_tests.parallel.conftest import mock_project
+
+
+def map_everything(project_info, doc_info):
+    mapped_data = wrangle_to_json(project_info, doc_info, debug=False)
+    return {
+        entity_type: list(mapped_data[entity_type])
+        for entity_type in ["families", "documents", "events"]
+    }
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return str(tmp_path / "state.json")
+
+
+def test_first_run_maps_everything(mock_project_info, mock_doc_info, state_file):
+    result = map_incrementally(mock_project_info, mock_doc_info, False, state_file)
+    assert result == map_everything(mock_project_info, mock_doc_info)
+    assert len(json.load(open(state_file))["references"]) == 7
+
+
+def test_unchanged_rows_are_reused(
+    mock_project_info, mock_doc_info, state_file, capsys
+):
+    map_incrementally(mock_project_info, mock_doc_info, False, state_file)
+    capsys.readouterr()
+
+    result = map_incrementally(mock_project_info, mock_doc_info, False, state_file)
+    assert result == map_everything(mock_project_info, mock_doc_info)
+    assert "Reusing 7 unchanged reference(s), re-mapping 0 and dropping 0" in (
+        capsys.readouterr().out
+    )
+
+
+def test_changed_new_and_deleted_rows(
+    mock_project_info, mock_doc_info, state_file, capsys
+):
+    map_incrementally(mock_project_info, mock_doc_info, False, state_file)
+    capsys.readouterr()
+
+    # Rename FP003, drop FP005, add FP007 and a document of FP002, and shuffle the rows.
+    # Reordering the rows of FP001 changes the numbering of its events, so it's
+    # re-mapped too.
+    project_info = mock_project_info.copy()
+    project_info.loc[2, "ProjectName"] = "Renamed"
+    project_info = pd.concat(
+        [
+            project_info[project_info["ApprovedRef"] != "FP005"],
+            pd.DataFrame([mock_project("FP007", 9)]),
+        ]
+    ).sample(frac=1, random_state=0)
+    doc_info = pd.concat(
+        [mock_doc_info, mock_doc_info.iloc[[2]].assign(Title="New document")]
+    ).sample(frac=1, random_state=1)
+
+    result = map_incrementally(project_info, doc_info, False, state_file)
+    assert result == map_everything(project_info, doc_info)
+    assert "Reusing 3 unchanged reference(s), re-mapping 4 and dropping 1" in (
+        capsys.readouterr().out
+    )
+
+
+def test_out_of_date_state_is_ignored(
+    mock_project_info, mock_doc_info, state_file, capsys
+):
+    map_incrementally(mock_project_info, mock_doc_info, False, state_file)
+    project_info = mock_project_info.assign(Extra="column")
+    capsys.readouterr()
+
+    result = map_incrementally(project_info, mock_doc_info, False, state_file)
+    assert result == map_everything(project_info, mock_doc_info)
+    assert "out of date" in capsys.readouterr().out
+
+
+def rejections_of(map_data, rejections_file) -> str:
+    start_rejections(str(rejections_file))
+    try:
+        map_data()
+    finally:
+        stop_rejections()
+    return rejections_file.read_text(encoding="utf-8")
+
+
+def test_reused_references_report_their_rejections(
+    mock_project_info, mock_doc_info, state_file, tmp_path
+):
+    def run():
+        return map_incrementally(mock_project_info, mock_doc_info, False, state_file)
+
+    first_run = rejections_of(run, tmp_path / "first.ndjson")
+    second_run = rejections_of(run, tmp_path / "second.ndjson")
+
+    assert first_run
+    assert second_run == first_run
+    assert first_run == rejections_of(
+        lambda: map_everything(mock_project_info, mock_doc_info),
+        tmp_path / "everything.ndjson",
+    )
@@ -0,0 +1,95 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.interchange import (
+    frame_to_table,
+    read_interchange,
+    table_to_frame,
+    write_interchange,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture()
+def nested_frame():
+    data = pd.DataFrame(
+        {
+            "ApprovedRef": pd.Series(["FP001", "FP002", "FP003"], dtype="string"),
+            "ProjectsID": [1, 2, 3],
+            "Type": pd.Series(["A", "B", "A"], dtype="category"),
+            "Summary": ["Summary", np.nan, "Summary"],
+            "Countries": [
+                [{"ISO3": "BGD", "Region": "Asia"}],
+                [
+                    {"ISO3": "KEN", "Region": "Africa"},
+                    {"ISO3": "TZA", "Region": "Africa"},
+                ],
+                [],
+            ],
+            # The budgets are integers in some dicts and floats in others.
+            "Funding": [
+                [{"Source": "GCF", "BudgetUSDeq": 100}],
+                [{"Source": "GCF", "BudgetUSDeq": 0.5}],
+                [{"Source": "GCF", "BudgetUSDeq": 7}],
+            ],
+            # The values are strings in some dicts and numbers in others.
+            "ResultAreas": [[{"Value": "100%"}], [{"Value": 50}], [{"Value": "0%"}]],
+        }
+    )
+    data.attrs["normalised"] = True
+    return data
+
+
+def test_nested_lists_are_stored_as_list_struct_columns(nested_frame):
+    table = frame_to_table(nested_frame)
+
+    assert pa.types.is_list(table.schema.field("Countries").type)
+    assert pa.types.is_struct(table.schema.field("Countries").type.value_type)
+    assert pa.types.is_string(table.schema.field("Funding").type)
+    assert pa.types.is_string(table.schema.field("ResultAreas").type)
+
+
+def test_frames_come_back_unchanged(nested_frame):
+    data = table_to_frame(frame_to_table(nested_frame))
+
+    assert data.dtypes.to_dict() == nested_frame.dtypes.to_dict()
+    assert data.attrs == {"normalised": True}
+    # The missing values of object columns come back as None rather than NaN.
+    assert data["Summary"].isna().tolist() == [False, True, False]
+    assert json.dumps(data.drop(columns="Summary").to_dict("records")) == json.dumps(
+        nested_frame.drop(columns="Summary").to_dict("records")
+    )
+    assert isinstance(data.at[0, "Countries"], list)
+
+
+def test_memory_mapped_slices_only_convert_their_rows(nested_frame, tmp_path):
+    interchange_file = str(tmp_path / "projects.arrow")
+    write_interchange(nested_frame, interchange_file)
+
+    table = read_interchange(interchange_file)
+    data = table_to_frame(table.slice(1, 2))
+
+    assert data["ApprovedRef"].tolist() == ["FP002", "FP003"]
+    assert data["Countries"].tolist() == nested_frame["Countries"].tolist()[1:]
+    assert data["ResultAreas"].tolist() == [[{"Value": 50}], [{"Value": "0%"}]]
+
+
+def test_slices_keep_the_ids_of_object_columns(tmp_path):
+    data = pd.DataFrame(
+        {
+            "ApprovedRef": ["FP001", "FP002", "FP018"],
+            "ProjectsID": pd.Series([1, None, 18], dtype=object),
+        }
+    )
+    interchange_file = str(tmp_path / "projects.arrow")
+    write_interchange(data, interchange_file)
+
+    sliced = table_to_frame(read_interchange(interchange_file).slice(1, 2))
+
+    assert sliced["ProjectsID"].dtype == object
+    assert sliced["ProjectsID"].tolist() == [None, 18]
+    assert [type(value) for value in sliced["ProjectsID"]] == [type(None), int]
@@ -0,0 +1,117 @@
+import json
+import logging
+from collections import Counter
+
+import pytest
+
+from gcf_data_mapper.logs import (
+    add_suppressed,
+    echo,
+    logging_settings,
+    pausing_logging,
+    start_logging,
+    stop_logging,
+    take_suppressed,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_logging():
+    stop_logging()
+    yield
+    stop_logging()
+
+
+def test_echo_prints_the_message_when_logging_is_not_started(capsys):
+    echo("📝 Debugging", level=logging.DEBUG)
+
+    assert capsys.readouterr().out == "📝 Debugging\n"
+    assert logging_settings() is None
+
+
+@pytest.mark.parametrize("background", [True, False])
+def test_text_messages_look_the_same_as_echoed_ones(capsys, background):
+    start_logging(background=background)
+    echo("🚀 Starting")
+    echo()
+    stop_logging()
+
+    assert capsys.readouterr().out == "🚀 Starting\n\n"
+
+
+def test_messages_below_the_level_are_left_out(capsys):
+    start_logging(logging.WARNING)
+    echo("📝 Debugging", level=logging.DEBUG)
+    echo("✅ Done")
+    echo("⚠️  Warning", level=logging.WARNING)
+    echo("❌ Error", level=logging.ERROR)
+    stop_logging()
+
+    assert capsys.readouterr().out == "⚠️  Warning\n❌ Error\n"
+
+
+def test_json_messages_hold_the_level_and_fields(capsys):
+    start_logging(log_format="json")
+    echo("🛑 Skipping", level=logging.WARNING, ids={"ProjectsID": 1})
+    echo()
+    stop_logging()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1
+    message = json.loads(lines[0])
+    assert message["level"] == "warning"
+    assert message["message"] == "🛑 Skipping"
+    assert message["ids"] == {"ProjectsID": 1}
+    assert "time" in message
+
+
+def test_rate_limit_holds_back_repeated_messages(capsys):
+    start_logging(rate_limit=2)
+    for position in range(5):
+        echo(f"🛑 Skipping {position}", rate_key="families empty_column_values")
+    echo("✅ Done")
+    stop_logging()
+
+    assert capsys.readouterr().out.splitlines() == [
+        "🛑 Skipping 0",
+        "🛑 Skipping 1",
+        "✅ Done",
+        "🔇 Held back 3 more message(s) about families empty_column_values",
+    ]
+
+
+def test_logging_settings_start_logging_the_same_elsewhere():
+    start_logging(logging.DEBUG, "json", 3)
+
+    assert logging_settings() == {
+        "level": logging.DEBUG,
+        "log_format": "json",
+        "rate_limit": 3,
+    }
+
+
+def test_messages_logged_while_paused_are_written_afterwards(capsys):
+    start_logging()
+    echo("🚀 Before")
+    with pausing_logging():
+        assert capsys.readouterr().out == "🚀 Before\n"
+        echo("📝 While paused")
+    echo("✅ After")
+    stop_logging()
+
+    assert capsys.readouterr().out == "📝 While paused\n✅ After\n"
+
+
+def test_messages_held_back_elsewhere_are_counted(capsys):
+    start_logging(rate_limit=1)
+    for position in range(3):
+        echo(f"🛑 Skipping {position}", rate_key="events no_event_dates")
+    assert take_suppressed() == {"events no_event_dates": 2}
+    assert take_suppressed() == {}
+
+    add_suppressed(Counter({"events no_event_dates": 4}))
+    stop_logging()
+
+    assert capsys.readouterr().out.splitlines()[-1] == (
+        "🔇 Held back 6 more message(s) about events no_event_dates"
+    )
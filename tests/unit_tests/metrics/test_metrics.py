@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from gcf_data_mapper.metrics import (
+    echo_metrics,
+    get_metrics,
+    measure,
+    measure_iter,
+    record_stage,
+    reset_metrics,
+    write_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_metrics():
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def test_record_stage_records_times_and_rows():
+    with record_stage("stage") as stage:
+        sum(range(10**5))
+        stage["rows"] = 3
+
+    [recorded] = get_metrics()
+    assert recorded["stage"] == "stage"
+    assert recorded["rows"] == 3
+    assert recorded["wall_seconds"] >= 0
+    assert recorded["cpu_seconds"] >= 0
+    assert recorded["peak_rss_mb"] is None or recorded["peak_rss_mb"] > 0
+
+
+def test_record_stage_records_failed_stages():
+    with pytest.raises(ValueError):
+        with record_stage("failed"):
+            raise ValueError
+
+    assert [stage["stage"] for stage in get_metrics()] == ["failed"]
+
+
+@pytest.mark.parametrize("result, rows", [([1, 2, 3], 3), (True, None)])
+def test_measure_counts_rows(result, rows):
+    assert measure("stage", lambda value: value, result) is result
+    assert get_metrics()[0]["rows"] == rows
+
+
+def test_measure_iter_is_recorded_when_exhausted():
+    calls = []
+
+    def items(n):
+        calls.append(n)
+        return range(n)
+
+    iterator = measure_iter("lazy", items, 4)
+    assert calls == []
+    assert next(iterator) == 0
+    assert get_metrics() == []
+
+    assert list(iterator) == [1, 2, 3]
+    [recorded] = get_metrics()
+    assert recorded["stage"] == "lazy"
+    assert recorded["rows"] == 4
+
+
+def test_echo_and_write_metrics(tmp_path, capsys):
+    measure("stage", list, range(2))
+    metrics_file = tmp_path / "metrics.json"
+
+    echo_metrics(get_metrics())
+    write_metrics(get_metrics(), str(metrics_file))
+
+    assert "stage" in capsys.readouterr().out
+    assert json.loads(metrics_file.read_text()) == {"stages": get_metrics()}
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+
+def mock_project(approved_ref: str, projects_id: int) -> dict:
+    return {
+        "ProjectsID": projects_id,
+        "ApprovedRef": approved_ref,
+        "ProjectName": f"Project {projects_id}",
+        "Theme": "Adaptation",
+        "Sector": "Environment",
+        "ProjectURL": f"https://www.climateaction.fund/project/{approved_ref}",
+        "Summary": " The Summary of the Project ",
+        "Countries": [{"CountryName": "Bangladesh", "ISO3": "BGD", "Region": "Asia"}],
+        "Entities": [{"Name": "Green Innovations"}],
+        "Funding": [{"Source": "GCF", "BudgetUSDeq": 9200000 + projects_id}],
+        "ResultAreas": [
+            {"Area": "Coastal protection", "Type": "Adaptation", "Value": "100%"}
+        ],
+        "ApprovalDate": "2016-06-30T00:00:00.000Z",
+        "StartDate": None if projects_id % 2 else "2017-06-28T00:00:00.000Z",
+        "DateCompletion": None if projects_id % 3 else "2020-06-28T00:00:00.000Z",
+        "DateImplementationStart": "2017-01-01T00:00:00.000Z",
+        "Status": None if projects_id % 5 else "Completed",
+    }
+
+
+@pytest.fixture()
+def mock_project_info():
+    refs = ["FP001", "FP002", "FP003", "FP001", "FP004", "FP005", "FP002", "FP006"]
+    projects = [mock_project(ref, projects_id) for projects_id, ref in enumerate(refs)]
+    # A repeated project, whose events carry on the numbering of the first one.
+    projects.append(mock_project("FP001", 0))
+    yield pd.DataFrame(projects)
+
+
+@pytest.fixture()
+def mock_doc_info():
+    refs = ["FP001", "FP003", "FP002", "FP999", "FP006", "FP004", "FP001"]
+    yield pd.DataFrame(
+        {
+            "FP number": refs,
+            "ID (Unique ID from our CMS for the document)": list(range(len(refs))),
+            "Type": ["Funding proposal"] * (len(refs) - 1) + ["Country programme"],
+            "Title": [f"Document {i}" for i in range(len(refs))],
+            "Main file (English)": [
+                f"https://www.gcf.org/{i}.pdf" for i in range(len(refs))
+            ],
+            "Translated files": [
+                None,
+                "https://www.gcf.org/fr.pdf",
+                None,
+                None,
+                None,
+                None,
+                None,
+            ],
+            "Translated titles": [None, "Titre", None, None, None, None, None],
+        }
+    )
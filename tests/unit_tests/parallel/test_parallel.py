@@ -0,0 +1,123 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.cli import wrangle_to_json
+from gcf_data_mapper.logs import start_logging, stop_logging
+from gcf_data_mapper.parallel import shard_by_reference
+from gcf_data_mapper.rejections import (
+    start_rejections,
+    stop_rejections,
+    take_rejections,
+)
+
+
+def test_shard_by_reference_keeps_references_together():
+    references = pd.Series(["FP001", "FP002", " FP001 ", "FP003", "FP002", "FP004"])
+    shards = shard_by_reference(references, n_shards=3)
+
+    assert len(shards) == 3
+    assert sorted(np.concatenate(shards).tolist()) == list(range(len(references)))
+    for positions in shards:
+        assert positions.tolist() == sorted(positions.tolist())
+
+    shard_of = {
+        position: shard
+        for shard, positions in enumerate(shards)
+        for position in positions
+    }
+    assert shard_of[0] == shard_of[2]
+    assert shard_of[1] == shard_of[4]
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_mapping_matches_single_process(
+    mock_project_info, mock_doc_info, workers
+):
+    expected = {
+        entity_type: list(entities)
+        for entity_type, entities in wrangle_to_json(
+            mock_project_info, mock_doc_info, debug=False
+        ).items()
+    }
+
+    result = wrangle_to_json(mock_project_info, mock_doc_info, False, workers)
+    assert result == expected
+    assert all(expected[entity_type] for entity_type in ["families", "documents"])
+    assert "GCF.event.FP001_0.n0004" in [e["import_id"] for e in result["events"]]
+
+
+def test_parallel_mapping_collects_the_rejections_of_every_worker(
+    mock_project_info, mock_doc_info
+):
+    start_rejections()
+    try:
+        list(wrangle_to_json(mock_project_info, mock_doc_info, False)["documents"])
+        expected = take_rejections()
+
+        wrangle_to_json(mock_project_info, mock_doc_info, False, workers=2)
+        rejections = take_rejections()
+    finally:
+        stop_rejections()
+
+    assert expected
+    assert rejections == expected
+
+
+def test_parallel_mapping_through_arrow_matches_single_process(
+    mock_project_info, mock_doc_info
+):
+    pytest.importorskip("pyarrow")
+    expected = {
+        entity_type: list(entities)
+        for entity_type, entities in wrangle_to_json(
+            mock_project_info, mock_doc_info, debug=False
+        ).items()
+    }
+
+    result = wrangle_to_json(
+        mock_project_info, mock_doc_info, False, workers=2, arrow_interchange=True
+    )
+    assert json.dumps(result) == json.dumps(expected)
+
+
+@pytest.mark.parametrize("suffix", ["ndjson", "csv"])
+def test_parallel_rejections_file_matches_single_process(
+    mock_project_info, mock_doc_info, tmp_path, suffix
+):
+    def rejections_file(workers: int) -> str:
+        file_path = tmp_path / f"rejections.{workers}.{suffix}"
+        start_rejections(str(file_path))
+        try:
+            mapped_data = wrangle_to_json(
+                mock_project_info, mock_doc_info, False, workers
+            )
+            list(mapped_data["documents"])
+        finally:
+            stop_rejections()
+        return file_path.read_text(encoding="utf-8")
+
+    assert rejections_file(workers=2) == rejections_file(workers=1)
+
+
+def test_parallel_mapping_counts_the_messages_held_back_by_every_worker(
+    mock_project_info, mock_doc_info, capsys
+):
+    def held_back(workers: int) -> list[str]:
+        start_logging(rate_limit=0)
+        try:
+            mapped_data = wrangle_to_json(
+                mock_project_info, mock_doc_info, False, workers
+            )
+            list(mapped_data["documents"])
+        finally:
+            stop_logging()
+        return [
+            line for line in capsys.readouterr().out.splitlines() if "Held back" in line
+        ]
+
+    expected = held_back(workers=1)
+    assert expected
+    assert held_back(workers=2) == expected
@@ -1,4 +1,13 @@
-from gcf_data_mapper.parsers.document import document
+from typing import Iterator
+
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.parsers.document import (
+    document,
+    iter_documents,
+    map_document_row,
+)
 
 
 def test_document_mapping_successful_with_valid_data(mock_gcf_docs, mock_projects_data):
@@ -10,3 +19,114 @@ def test_document_no_merge(mock_gcf_docs, mock_projects_data):
     mock_gcf_docs = mock_gcf_docs.assign(**{"FP number": ["FP125", "FP126"]})
     result = document(mock_projects_data, mock_gcf_docs, debug=False)
     assert all(doc is None for doc in result)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 10])
+@pytest.mark.parametrize(
+    "approved_refs", [["FP123", "FP124", "FP125"], ["FP123", "FP124", "FP123"]]
+)
+def test_iter_documents_matches_left_join_of_project_data(
+    mock_gcf_docs, chunk_size, approved_refs
+):
+    gcf_docs = pd.concat([mock_gcf_docs, mock_gcf_docs], ignore_index=True).assign(
+        **{
+            "FP number": ["FP123", "FP124", "FP999", "FP123"],
+            "Translated files": [pd.NA, "http://example.com", pd.NA, pd.NA],
+            "Translated titles": [pd.NA, "title124_fr", pd.NA, pd.NA],
+        }
+    )
+    projects_data = pd.DataFrame(
+        {
+            "ApprovedRef": approved_refs,
+            "ProjectsID": [1, 2, 3],
+            "Countries": [[{"ISO3": "BGD"}], [{"ISO3": "HTI"}], []],
+        }
+    )
+
+    combo = pd.merge(
+        left=gcf_docs,
+        right=projects_data,
+        left_on="FP number",
+        right_on="ApprovedRef",
+        how="left",
+    ).convert_dtypes()
+    expected = []
+    # Documents without a project are rejected, the rest are all valid.
+    for _, row in combo.dropna(subset=["ProjectsID"]).iterrows():
+        expected.extend(map_document_row(row))
+
+    result = iter_documents(projects_data, gcf_docs, debug=False, chunk_size=chunk_size)
+    assert isinstance(result, Iterator)
+    assert list(result) == expected
+    assert "GCF.document.FP123_1.doc123" in [doc["import_id"] for doc in expected]
+
+
+def test_document_ids_are_not_rendered_as_floats(mock_gcf_docs):
+    # Read without declared types, the IDs of a column with missing values are floats.
+    gcf_docs = pd.concat([mock_gcf_docs] * 3, ignore_index=True).assign(
+        **{
+            "FP number": ["FP123", "FP124", "FP999", "FP123", "FP124", "FP123"],
+            "ID (Unique ID from our CMS for the document)": [
+                1.0,
+                2.0,
+                3.0,
+                None,
+                5.0,
+                6.0,
+            ],
+            "Translated files": None,
+            "Translated titles": None,
+        }
+    )
+    projects_data = pd.DataFrame(
+        {"ApprovedRef": ["FP123", "FP124"], "ProjectsID": [1, 2]}
+    )
+
+    result = document(projects_data, gcf_docs, debug=False)
+
+    assert [doc["import_id"] for doc in result] == [
+        "GCF.document.FP123_1.1",
+        "GCF.document.FP124_2.2",
+        "GCF.document.FP124_2.5",
+        "GCF.document.FP123_1.6",
+    ]
+
+
+def test_documents_are_matched_to_their_project_by_their_fp_number_as_read(
+    mock_gcf_docs, mock_projects_data
+):
+    gcf_docs = mock_gcf_docs.assign(
+        **{
+            "FP number": ["FP123 ", "FP124"],
+            "Translated files": pd.NA,
+            "Translated titles": pd.NA,
+        }
+    )
+
+    result = iter_documents(mock_projects_data, gcf_docs, debug=False)
+    assert [doc["import_id"] for doc in result] == ["GCF.document.FP124_proj124.doc124"]
+
+
+def test_documents_are_filtered_by_their_type_as_read(
+    mock_gcf_docs, mock_projects_data
+):
+    gcf_docs = mock_gcf_docs.assign(
+        **{
+            "Type": [" Country programme", "Country programme"],
+            "Translated files": pd.NA,
+            "Translated titles": pd.NA,
+        }
+    )
+
+    result = iter_documents(mock_projects_data, gcf_docs, debug=False)
+    assert [(doc["import_id"], doc["metadata"]) for doc in result] == [
+        ("GCF.document.FP123_proj123.doc123", {"type": ["Country programme"]})
+    ]
+
+
+def test_each_chunk_is_logged_in_debug_mode(mock_gcf_docs, mock_projects_data, capsys):
+    list(iter_documents(mock_projects_data, mock_gcf_docs, debug=True, chunk_size=1))
+
+    output = capsys.readouterr().out
+    assert "📊 Mapping GCF documents 1 to 1..." in output
+    assert "📊 Mapping GCF documents 2 to 2..." in output
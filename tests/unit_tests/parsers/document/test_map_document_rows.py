@@ -1,7 +1,39 @@
+from typing import Any
+
 import pandas as pd
 import pytest
 
-from gcf_data_mapper.parsers.document import process_row
+from gcf_data_mapper.enums.document import (
+    RequiredDocumentColumns,
+    TranslatedDocumentColumns,
+)
+from gcf_data_mapper.parsers.document import iter_documents
+from gcf_data_mapper.parsers.validation import enum_columns
+
+PROJECT_KEYS = ["ApprovedRef", "ProjectsID"]
+
+
+def map_document_row(row: pd.Series) -> list[dict[str, Any]]:
+    """Map a document row holding the keys of its project.
+
+    The document is matched to its project by its (stripped) ApprovedRef.
+    """
+    projects = pd.DataFrame([row.reindex(PROJECT_KEYS)])
+    approved_ref = projects.at[0, "ApprovedRef"]
+    gcf_docs = (
+        pd.DataFrame([row.drop(PROJECT_KEYS, errors="ignore")])
+        .reindex(
+            columns=enum_columns(RequiredDocumentColumns, TranslatedDocumentColumns)
+        )
+        .assign(
+            **{
+                "FP number": (
+                    approved_ref.strip() if isinstance(approved_ref, str) else None
+                )
+            }
+        )
+    )
+    return list(iter_documents(projects, gcf_docs, debug=False))
 
 
 @pytest.mark.parametrize(
@@ -12,15 +44,15 @@ from gcf_data_mapper.parsers.document import process_row
         "mock_valid_doc_row_with_many_translations",
     ],
 )
-def test_process_row_with_translations_success(valid_doc_row, request):
-    result = process_row(request.getfixturevalue(valid_doc_row), debug=False)
+def test_map_document_row_with_translations_success(valid_doc_row, request):
+    result = map_document_row(request.getfixturevalue(valid_doc_row))
     assert isinstance(result, list)
 
 
-def test_process_row_with_no_translations_success(
+def test_map_document_row_with_no_translations_success(
     mock_valid_doc_row_with_no_translations,
 ):
-    result = process_row(mock_valid_doc_row_with_no_translations, debug=False)
+    result = map_document_row(mock_valid_doc_row_with_no_translations)
     assert isinstance(result, list)
 
 
@@ -64,11 +96,11 @@ def test_process_row_with_no_translations_success(
         ),
     ],
 )
-def test_process_row_returns_none_with_na_in_required_columns(
+def test_map_document_row_returns_none_with_na_in_required_columns(
     row_with_missing_cols, expected_error_msg, capsys
 ):
     row = pd.Series(row_with_missing_cols)
-    assert process_row(row, debug=False) is None
+    assert map_document_row(row) == []
     captured = capsys.readouterr()
     assert expected_error_msg in captured.out
 
@@ -88,7 +120,7 @@ def test_handles_data_with_leading_and_trailing_whitespace(
         }
     ]
 
-    assert expected_mapped_doc == process_row(mock_valid_row_with_whitespace, False)
+    assert expected_mapped_doc == map_document_row(mock_valid_row_with_whitespace)
 
 
 @pytest.mark.parametrize(
@@ -212,7 +244,7 @@ def test_handles_data_with_leading_and_trailing_whitespace(
                     "Translated titles": pd.NA,
                 }
             ),
-            None,
+            [],
             "🛑 Skipping row as [.xlsx] is not a valid file ext. Project ID: doc123",
         ),
     ],
@@ -223,7 +255,7 @@ def test_validates_url_has_a_supported_extension(
     error_message: str,
     capsys,
 ):
-    document_data = process_row(test_ds, debug=False)
+    document_data = map_document_row(test_ds)
 
     assert expected_return == document_data
 
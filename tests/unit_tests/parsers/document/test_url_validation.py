@@ -1,9 +1,13 @@
+import pandas as pd
 import pytest
 
+from gcf_data_mapper.enums.document import TranslatedUrlVerdicts
 from gcf_data_mapper.parsers.document import (
     contains_duplicate_urls,
     contains_empty_urls,
     contains_invalid_paths,
+    translated_url_verdicts,
+    url_verdict,
     validate_urls,
 )
 
@@ -66,3 +70,54 @@ def test_url_validation_passes_with_valid_urls(urls, doc_id):
 )
 def test_url_validation_returns_false_when_fails(urls, doc_id):
     assert validate_urls(urls, doc_id) is False
+
+
+@pytest.mark.parametrize(
+    "urls, expected",
+    [
+        (["http://example.com/a.pdf", "http://example.com/b.pdf"], "VALID"),
+        (["http://example.com/a.pdf", " "], "EMPTY"),
+        (["http://example.com/a.pdf", "http://EXAMPLE.com/a.pdf"], "DUPLICATE"),
+        (["http://example.com/a b.pdf"], "MALFORMED"),
+        (["http://example.com/a.pdf", "", "http://example.com/a.pdf"], "EMPTY"),
+    ],
+)
+def test_url_verdict(urls, expected):
+    assert url_verdict(urls) is TranslatedUrlVerdicts[expected]
+
+
+def test_translated_url_verdicts_match_url_verdict():
+    translated_files = [
+        "http://example.com/a.pdf|http://example.com/b.pdf",
+        "http://example.com/a.pdf|",
+        "http://example.com/a.pdf|http://example.com/A.PDF",
+        "http://example.com/in valid.pdf",
+        # Invalid characters outside of the path don't make a url malformed.
+        "http://exa mple.com/a.pdf|http://example.com/a.pdf?q=a b",
+        "http://example.com/é.pdf|http://example.com/ü.pdf",
+        " http://example.com/a.pdf | http://example.com/b.pdf ",
+        "http://example.com/<a>.pdf",
+        "http://example.com/a.pdf",
+        None,
+    ]
+    gcf_docs = pd.DataFrame(
+        {
+            "Translated files": translated_files,
+            "Translated titles": ["Title"] * (len(translated_files) - 1) + [None],
+        },
+        index=[0, 1, 2, 3, 4, 5, 6, 7, 7, 8],
+    )
+
+    verdicts = translated_url_verdicts(gcf_docs)
+
+    assert verdicts.index.equals(gcf_docs.index)
+    assert verdicts.tolist() == [
+        url_verdict(files.strip().split("|")) for files in translated_files[:-1]
+    ] + [None]
+
+
+def test_translated_url_verdicts_without_translations():
+    gcf_docs = pd.DataFrame(
+        {"Translated files": [None, None], "Translated titles": [None, None]}
+    )
+    assert translated_url_verdicts(gcf_docs).tolist() == [None, None]
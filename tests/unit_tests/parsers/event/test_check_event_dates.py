@@ -2,7 +2,7 @@ import pandas as pd
 import pytest
 
 from gcf_data_mapper.enums.event import Events
-from gcf_data_mapper.parsers.event import check_event_dates
+from gcf_data_mapper.parsers.event import check_event_date_columns
 
 
 @pytest.fixture
@@ -17,6 +17,11 @@ def mock_row():
     )
 
 
+def check_event_dates(row: pd.Series) -> dict[str, bool]:
+    [flags] = check_event_date_columns(pd.DataFrame([row])).to_dict("records")
+    return flags
+
+
 def test_check_event_dates_returns_correct_flags(mock_row):
     result = check_event_dates(mock_row)
     assert result[Events.APPROVED.name] is True
@@ -63,3 +68,32 @@ def test_check_event_dates_returns_false_for_all_na():
     )
     result = check_event_dates(row)
     assert all(value is False for value in result.values())
+
+
+def test_check_event_date_columns_checks_every_project(mock_row):
+    other_row = pd.Series(
+        {
+            Events.APPROVED.column_name: None,
+            Events.UNDER_IMPLEMENTATION.column_name: "2023-02-02",
+            Events.COMPLETED.column_name: None,
+            Events.UNDER_IMPLEMENTATION_SECONDARY.column_name: "2023-02-02",
+        }
+    )
+    projects_data = pd.DataFrame([mock_row, other_row], index=[3, 5])
+
+    result = check_event_date_columns(projects_data)
+    assert result.index.tolist() == [3, 5]
+    assert result.to_dict("records") == [
+        {
+            Events.APPROVED.name: True,
+            Events.UNDER_IMPLEMENTATION.name: False,
+            Events.COMPLETED.name: True,
+            Events.UNDER_IMPLEMENTATION_SECONDARY.name: True,
+        },
+        {
+            Events.APPROVED.name: False,
+            Events.UNDER_IMPLEMENTATION.name: True,
+            Events.COMPLETED.name: False,
+            Events.UNDER_IMPLEMENTATION_SECONDARY.name: False,
+        },
+    ]
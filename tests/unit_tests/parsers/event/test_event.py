@@ -127,3 +127,25 @@ def test_handles_data_with_leading_and_trailing_whitespace():
     ]
 
     assert expected_mapped_events == event(mock_projects_data, False)
+
+
+def test_event_numbers_events_per_family_across_rows():
+    projects_data = pd.DataFrame(
+        {
+            "ApprovalDate": ["2023-01-01", None, "2023-01-03"],
+            "StartDate": [None, "2023-06-01", None],
+            "DateCompletion": ["2023-12-31", None, None],
+            "ApprovedRef": ["FP123", "FP124", "FP123"],
+            "ProjectsID": ["PID456", "PID457", "PID456"],
+            "DateImplementationStart": ["2023-02-01", None, None],
+        }
+    )
+
+    result = event(projects_data, debug=False)
+    assert [(e["import_id"], e["event_type_value"], e["date"]) for e in result] == [
+        ("GCF.event.FP123_PID456.n0000", "Project Approved", "2023-01-01"),
+        ("GCF.event.FP123_PID456.n0001", "Project Completed", "2023-12-31"),
+        ("GCF.event.FP123_PID456.n0002", "Under Implementation", "2023-02-01"),
+        ("GCF.event.FP124_PID457.n0000", "Under Implementation", "2023-06-01"),
+        ("GCF.event.FP123_PID456.n0003", "Project Approved", "2023-01-03"),
+    ]
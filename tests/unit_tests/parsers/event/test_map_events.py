@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.enums.event import Events
+from gcf_data_mapper.parsers.event import check_event_date_columns, map_events
+
+
+@pytest.fixture
+def mock_projects_data():
+    return pd.DataFrame(
+        {
+            Events.APPROVED.column_name: ["2023-01-01"],
+            Events.UNDER_IMPLEMENTATION.column_name: [None],
+            Events.COMPLETED.column_name: ["2023-12-31"],
+            Events.UNDER_IMPLEMENTATION_SECONDARY.column_name: [None],
+            "ApprovedRef": ["FP123"],
+            "ProjectsID": ["PID456"],
+        },
+        index=[7],
+    )
+
+
+def mapped_events(projects_data: pd.DataFrame) -> list:
+    return map_events(projects_data, check_event_date_columns(projects_data))
+
+
+def test_map_events_maps_each_present_event_date(mock_projects_data):
+    assert mapped_events(mock_projects_data) == [
+        (
+            7,
+            {
+                "import_id": f"GCF.event.FP123_PID456.n000{n_value}",
+                "family_import_id": "GCF.family.FP123.PID456",
+                "event_title": event.type,
+                "date": date,
+                "event_type_value": event.type,
+                "metadata": {
+                    "event_type": [event.type],
+                    "datetime_event_name": ["Project Approved"],
+                },
+            },
+        )
+        for n_value, (event, date) in enumerate(
+            [(Events.APPROVED, "2023-01-01"), (Events.COMPLETED, "2023-12-31")]
+        )
+    ]
+
+
+def test_map_events_handles_no_dates(mock_projects_data):
+    projects_data = mock_projects_data.assign(
+        **{
+            Events.APPROVED.column_name: None,
+            Events.COMPLETED.column_name: None,
+        }
+    )
+    assert mapped_events(projects_data) == []
+
+
+def test_map_events_handles_partial_dates(mock_projects_data):
+    projects_data = mock_projects_data.assign(
+        **{
+            Events.UNDER_IMPLEMENTATION.column_name: "2023-06-01",
+            Events.COMPLETED.column_name: None,
+        }
+    )
+    assert [
+        (mapped_event["import_id"], mapped_event["event_type_value"])
+        for _, mapped_event in mapped_events(projects_data)
+    ] == [
+        ("GCF.event.FP123_PID456.n0000", Events.APPROVED.type),
+        ("GCF.event.FP123_PID456.n0001", Events.UNDER_IMPLEMENTATION.type),
+    ]
+
+
+def test_map_events_raises_key_error_for_missing_columns(mock_projects_data):
+    projects_data = mock_projects_data[["ApprovedRef", "ProjectsID"]]
+    with pytest.raises(KeyError):
+        mapped_events(projects_data)
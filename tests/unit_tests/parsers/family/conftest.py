@@ -1,8 +1,6 @@
 import pandas as pd
 import pytest
 
-from gcf_data_mapper.enums.family import FamilyColumnsNames, FamilyNestedColumnNames
-
 
 @pytest.fixture()
 def mock_family_doc_df():
@@ -104,6 +102,8 @@ def mock_family_row_ds():
             "ApprovalDate": "2016-06-30T00:00:00.000Z",
             "StartDate": "2024-06-28T00:00:00.000Z",
             "DateCompletion": None,
+            "Status": "Under Implementation",
+            "DateImplementationStart": None,
         }
     )
 
@@ -150,6 +150,8 @@ def mock_family_row_no_result_areas():
             "ApprovalDate": "2016-06-30T00:00:00.000Z",
             "StartDate": "2024-06-28T00:00:00.000Z",
             "DateCompletion": None,
+            "Status": "Under Implementation",
+            "DateImplementationStart": None,
         }
     )
 
@@ -192,6 +194,8 @@ def mock_family_row_no_entities_no_regions():
             "ApprovalDate": "2016-06-30T00:00:00.000Z",
             "StartDate": "2024-06-28T00:00:00.000Z",
             "DateCompletion": None,
+            "Status": "Under Implementation",
+            "DateImplementationStart": None,
         }
     )
 
@@ -233,6 +237,8 @@ def mock_family_row_with_non_int_non_float_budget_values():
             "ApprovalDate": "2016-06-30T00:00:00.000Z",
             "StartDate": "2024-06-28T00:00:00.000Z",
             "DateCompletion": None,
+            "Status": "Under Implementation",
+            "DateImplementationStart": None,
         }
     )
 
@@ -283,15 +289,7 @@ def mock_family_doc_with_whitespace():
             "ApprovalDate": " 2016-06-30T00:00:00.000Z ",
             "StartDate": " 2024-06-28T00:00:00.000Z  ",
             "DateCompletion": None,
+            "Status": " Under Implementation ",
+            "DateImplementationStart": None,
         }
     )
-
-
-@pytest.fixture()
-def required_family_columns():
-    required_columns = [column.value for column in FamilyColumnsNames]
-    required_nested_family_columns = [
-        column.value for column in FamilyNestedColumnNames
-    ]
-
-    return required_columns, required_nested_family_columns
@@ -0,0 +1,157 @@
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.parsers.family import (
+    calculate_statuses,
+    family,
+    map_nested_family_columns,
+)
+
+
+@pytest.fixture()
+def mock_family_projects_df(
+    mock_family_doc_df: pd.DataFrame,
+    mock_family_doc_with_whitespace: pd.Series,
+    mock_family_row_no_result_areas: pd.Series,
+) -> pd.DataFrame:
+    valid_project = mock_family_doc_df.iloc[0]
+    rows = [
+        valid_project,
+        mock_family_doc_with_whitespace,
+        mock_family_row_no_result_areas,
+        valid_project.copy().set_axis(valid_project.index),
+        valid_project.copy(),
+        valid_project.copy(),
+        valid_project.copy(),
+    ]
+    rows[3]["ProjectsID"] = "  "
+    rows[4]["Sector"] = None
+    rows[5]["Status"] = None
+    rows[6]["Status"] = "Completed"
+    projects = pd.DataFrame(rows).reset_index(drop=True)
+    projects["Status"] = projects["Status"].where(projects.index != 2, "Approved")
+    projects["DateImplementationStart"] = None
+    return projects
+
+
+def test_family_maps_or_rejects_each_project(
+    mock_family_projects_df: pd.DataFrame, capsys
+):
+    families = family(mock_family_projects_df, debug=False)
+
+    assert [
+        (mapped_family["import_id"], mapped_family["metadata"]["status"])
+        for mapped_family in families
+    ] == [
+        ("GCF.family.FP003.12660", ["Under Implementation"]),
+        ("GCF.family.FP003.AAABBB", ["Under Implementation"]),
+        ("GCF.family.FP003.12660", ["Project Completed"]),
+    ]
+    assert capsys.readouterr().out.splitlines() == [
+        "🛑 The following lists contain empty values: Result Areas, Result Types. Projects ID 2",
+        "🛑 Skipping row as family metadata has missing information, ProjectsID : 2",
+        "🛑 Skipping row as it does not contain a project id",
+        "🛑 Skipping row as it contains empty column values: See Project ID 12660",
+        "🛑 Skipping row as it contains empty column values: See Project ID 12660",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("status", "approval_date", "start_date", "completed_date", "expected"),
+    [
+        ("Completed", None, None, None, "Project Completed"),
+        ("Pipeline", None, None, None, "Pipeline"),
+        (None, "2016-06-30T00:00:00.000Z", None, None, "Project Approved"),
+        (
+            None,
+            "2016-06-30T00:00:00.000Z",
+            "2017-06-30T00:00:00.000Z",
+            "2018-06-30T00:00:00.000Z",
+            "Project Completed",
+        ),
+        (
+            None,
+            "2016-06-30T00:00:00.000Z",
+            "2017-06-30T00:00:00.000Z",
+            "2199-06-30T00:00:00.000Z",
+            "Under Implementation",
+        ),
+        (None, None, None, None, None),
+        (None, "2016-06-30T00:00:00.000Z", float("nan"), None, None),
+    ],
+)
+def test_calculate_statuses(
+    status, approval_date, start_date, completed_date, expected
+):
+    projects = pd.DataFrame(
+        {
+            "Status": [status],
+            "ApprovalDate": [approval_date],
+            "StartDate": [start_date],
+            "DateCompletion": [completed_date],
+        },
+        dtype=object,
+    )
+    statuses, messages = calculate_statuses(projects)
+    assert statuses.tolist() == [expected]
+    assert (messages.iloc[0] is None) == (expected is not None)
+
+
+def test_map_nested_family_columns(
+    mock_family_doc_df: pd.DataFrame,
+    mock_family_row_no_entities_no_regions: pd.Series,
+    mock_family_row_with_non_int_non_float_budget_values: pd.Series,
+    capsys,
+):
+    valid_project = mock_family_doc_df.iloc[0]
+    only_gcf_funded = valid_project.copy()
+    only_gcf_funded["Funding"] = [
+        funding for funding in only_gcf_funded["Funding"] if funding["Source"] == "GCF"
+    ]
+    no_related_result_areas = valid_project.copy()
+    no_related_result_areas["ResultAreas"] = [
+        {**result_area, "Value": "0.00%"}
+        for result_area in no_related_result_areas["ResultAreas"]
+    ]
+    projects = pd.DataFrame(
+        [
+            valid_project,
+            mock_family_row_no_entities_no_regions,
+            mock_family_row_with_non_int_non_float_budget_values,
+            only_gcf_funded,
+            no_related_result_areas,
+        ]
+    ).set_axis([5, 5, 6, 7, 8])
+
+    valid_metadata = {
+        "implementing_agency": ["Green Innovations"],
+        "project_value_fund_spend": ["9200000"],
+        "project_value_co_financing": ["620000"],
+        "region": ["Asia"],
+        "result_area": ["Coastal protection and restoration"],
+        "result_type": ["Adaptation"],
+    }
+    expected = [
+        valid_metadata,
+        None,
+        None,
+        {**valid_metadata, "project_value_co_financing": ["0"]},
+        None,
+    ]
+
+    nested = map_nested_family_columns(projects)
+
+    assert nested.index.equals(projects.index)
+    assert nested["nested_metadata"].tolist() == expected
+    assert nested["empty_lists"].tolist() == [
+        [],
+        ["Implementing Agencies", "Regions"],
+        ["Implementing Agencies", "Regions"],
+        [],
+        ["Result Areas"],
+    ]
+    assert nested["geographies"].iat[0] == [
+        country["ISO3"] for country in valid_project["Countries"]
+    ]
+    assert nested["geographies"].iat[1] is None
+    assert capsys.readouterr().out == ""
@@ -1,7 +1,10 @@
 import pandas as pd
 import pytest
 
-from gcf_data_mapper.parsers.family import family, map_family_data, process_row
+from gcf_data_mapper.enums.event import EventColumnNames
+from gcf_data_mapper.enums.family import FamilyColumnsNames
+from gcf_data_mapper.parsers.family import family
+from gcf_data_mapper.parsers.validation import enum_columns
 
 
 @pytest.fixture
@@ -48,8 +51,7 @@ def test_returns_expected_import_id_for_family_data(
     approved_ref = mock_family_row_ds.ApprovedRef
     projects_id = mock_family_row_ds.ProjectsID
 
-    family_data = map_family_data(mock_family_row_ds)
-    assert family_data is not None
+    [family_data] = family(pd.DataFrame([mock_family_row_ds]), debug=False)
     assert family_data["import_id"] == f"GCF.family.{approved_ref}.{projects_id}"
 
 
@@ -98,7 +100,7 @@ def test_raises_error_on_validating_row_for_missing_columns():
                     "Status": pd.NA,
                 }
             ),
-            None,
+            [],
             "🛑 Skipping row as it contains empty column values: See Project ID 100",
         ),
         (
@@ -116,8 +118,9 @@ def test_raises_error_on_validating_row_for_missing_columns():
                     "Status": pd.NA,
                 }
             ),
-            None,
-            "🛑 Skipping row as it does not contain a project id",
+            [],
+            # The ProjectsID is converted to a string before it's checked.
+            "🛑 Skipping row as it contains empty column values: See Project ID <NA>",
         ),
         (
             pd.Series(
@@ -134,7 +137,7 @@ def test_raises_error_on_validating_row_for_missing_columns():
                     "Status": pd.NA,
                 }
             ),
-            None,
+            [],
             "🛑 Skipping row as it does not contain a project id",
         ),
     ],
@@ -144,13 +147,13 @@ def test_skips_processing_row_if_row_contains_empty_values(
     expected_return,
     error_message: str,
     capsys,
-    required_family_columns,
 ):
-    projects_id = test_ds.ProjectsID
+    projects = pd.DataFrame([test_ds]).reindex(
+        columns=sorted(enum_columns(FamilyColumnsNames, EventColumnNames))
+    )
 
-    columns, _ = required_family_columns
-    family_data = process_row(test_ds, projects_id, columns)
-    assert expected_return == family_data
+    family_data = family(projects, debug=False)
+    assert family_data == expected_return
     captured = capsys.readouterr()
     assert error_message == captured.out.strip()
 
@@ -159,15 +162,15 @@ def test_skips_processing_row_if_family_metadata_has_missing_data(
     mock_family_row_no_result_areas: pd.Series, capsys
 ):
     projects_id = mock_family_row_no_result_areas.ProjectsID
-    family_data = map_family_data(mock_family_row_no_result_areas)
-    assert family_data is None
+    family_data = family(pd.DataFrame([mock_family_row_no_result_areas]), debug=False)
+    assert family_data == []
     captured = capsys.readouterr()
-    # We have two outputs, one from map_family_metadata pointing to the missing data and the second
-    # from map_family_data informing that the row is being skipped
-    map_family_data_output = captured.out.strip().split("\n")
+    # We have two outputs, the first pointing to the missing data and the second
+    # informing that the row is being skipped
+    output_lines = captured.out.strip().split("\n")
     assert (
         f"🛑 Skipping row as family metadata has missing information, ProjectsID : {projects_id}"
-        == map_family_data_output[1]
+        == output_lines[1]
     )
 
 
@@ -198,6 +201,6 @@ def test_handles_data_with_leading_and_trailing_whitespace(
         "title": "Enhancing resilience of coastal ecosystems and communities",
     }
 
-    assert expected_mapped_family == process_row(
-        mock_family_doc_with_whitespace, "  AAABBB  ", []
+    assert [expected_mapped_family] == family(
+        pd.DataFrame([mock_family_doc_with_whitespace]), debug=False
     )
@@ -5,13 +5,17 @@ import pytest
 
 from gcf_data_mapper.enums.event import Events
 from gcf_data_mapper.parsers.family import (
-    calculate_status,
-    contains_invalid_date_entries,
-    get_budgets,
-    map_family_metadata,
+    calculate_statuses,
+    family,
+    map_nested_family_columns,
 )
 
 
+def mapped_family_metadata(row: pd.Series) -> Optional[dict]:
+    families = family(pd.DataFrame([row]), debug=False)
+    return families[0]["metadata"] if families else None
+
+
 @pytest.fixture()
 def parsed_family_metadata():
     return {
@@ -34,7 +38,7 @@ def parsed_family_metadata():
 def test_returns_expected_metadata_structure(
     mock_family_row_ds: pd.Series, parsed_family_metadata: dict
 ):
-    family_metadata = map_family_metadata(mock_family_row_ds)
+    family_metadata = mapped_family_metadata(mock_family_row_ds)
     assert family_metadata is not None
     assert family_metadata == parsed_family_metadata
 
@@ -57,11 +61,11 @@ def test_returns_expected_metadata_structure(
 def test_returns_none_if_nested_values_in_family_metadata_row_contains_empty_values(
     mock_family_row: pd.Series, expected_return, output_message: str, request, capsys
 ):
-    family_metadata = map_family_metadata(request.getfixturevalue(mock_family_row))
+    family_metadata = mapped_family_metadata(request.getfixturevalue(mock_family_row))
 
     assert family_metadata == expected_return
     captured = capsys.readouterr()
-    assert output_message == captured.out.strip()
+    assert output_message == captured.out.strip().split("\n")[0]
 
 
 @pytest.fixture()
@@ -85,44 +89,39 @@ def budget_input_data():
     ]
 
 
-def test_get_budgets_returns_list_of_budgets_for_funding_source(
-    budget_input_data: list,
-):
-    gcf_source = "GCF"
-    budgets = get_budgets(budget_input_data, gcf_source)
-    assert budgets == ["2000"]
-
-
-def test_get_budgets_returns_multiple_budgets_where_there_is_more_than_one_entry_to_a_funding_source(
+@pytest.mark.parametrize(
+    ("sources, expected_fund_spend, expected_co_financing"),
+    [
+        (["GCF", "Co-Financing", "Co-Financing"], ["2000"], ["2700", "4100"]),
+        (["GCF", "GCF", "GCF"], ["2000", "2700", "4100"], ["0"]),
+        (["fake_budget_source"] * 3, ["0"], ["0"]),
+    ],
+)
+def test_maps_the_budgets_of_each_funding_source(
+    mock_family_row_ds: pd.Series,
     budget_input_data: list,
+    sources: list[str],
+    expected_fund_spend: list[str],
+    expected_co_financing: list[str],
 ):
-    gcf_source = "Co-Financing"
-    budgets = get_budgets(budget_input_data, gcf_source)
-    assert budgets is not None
-    assert budgets == ["2700", "4100"]
-    assert len(budgets) == 2
-
-
-def test_get_budget_returns_list_of_strings(budget_input_data: list):
-    gcf_source = "GCF"
-    budgets = get_budgets(budget_input_data, gcf_source)
-    assert budgets is not None
-    assert all(isinstance(item, str) for item in budgets)
-
+    mock_family_row_ds["Funding"] = [
+        {**funding, "Source": source}
+        for funding, source in zip(budget_input_data, sources, strict=True)
+    ]
 
-def test_get_budget_returns_list_with_zero_where_there_are_no_matching_sources(
-    budget_input_data: list,
-):
-    source = "fake_budget_source"
-    budgets = get_budgets(budget_input_data, source)
-    assert budgets is not None
-    assert budgets == ["0"]
+    [nested_metadata] = map_nested_family_columns(pd.DataFrame([mock_family_row_ds]))[
+        "nested_metadata"
+    ]
+    assert nested_metadata["project_value_fund_spend"] == expected_fund_spend
+    assert nested_metadata["project_value_co_financing"] == expected_co_financing
 
 
 def test_map_family_metadata_returns_none_if_budget_does_not_contain_valid_int_types(
     mock_family_row_with_non_int_non_float_budget_values: pd.Series,
 ):
-    result = map_family_metadata(mock_family_row_with_non_int_non_float_budget_values)
+    result = mapped_family_metadata(
+        mock_family_row_with_non_int_non_float_budget_values
+    )
     assert result is None
 
 
@@ -203,38 +202,8 @@ def test_map_family_metadata_returns_none_if_budget_does_not_contain_valid_int_t
     ],
 )
 def test_returns_status(mock_family_row: pd.Series, expected_status: Optional[str]):
-    status = calculate_status(mock_family_row)
-    assert status == expected_status
-
-
-@pytest.mark.parametrize(
-    ("list_of_dates, return_value"),
-    [
-        (
-            [
-                pd.to_datetime("2016-06-30T00:00:00.000Z"),
-                pd.to_datetime("2018-06-30T00:00:00.000Z"),
-                pd.to_datetime("2022-06-30T00:00:00.000Z"),
-            ],
-            False,
-        ),
-        (
-            [None, None, pd.to_datetime("2016-06-30T00:00:00.000Z")],
-            False,
-        ),
-        (
-            [
-                pd.to_datetime("2018-06-30T00:00:00.000Z"),
-                pd.to_datetime(""),
-                pd.to_datetime("2022-06-30T00:00:00.000Z"),
-            ],
-            True,
-        ),
-    ],
-)
-def test_dates_contain_invalid_date_entries(list_of_dates: list, return_value):
-    result = contains_invalid_date_entries(list_of_dates)
-    assert result == return_value
+    statuses, _ = calculate_statuses(pd.DataFrame([mock_family_row]))
+    assert statuses.iloc[0] == expected_status
 
 
 @pytest.mark.parametrize(
@@ -272,17 +241,16 @@ def test_dates_contain_invalid_date_entries(list_of_dates: list, return_value):
         ),
     ],
 )
-def test_skips_processing_row_if_calculate_status_returns_none(
-    mock_row: pd.Series, output_message: str, capsys
+def test_returns_why_the_status_cannot_be_calculated(
+    mock_row: pd.Series, output_message: str
 ):
-    return_value = map_family_metadata(mock_row)
-    assert return_value is None
-    captured = capsys.readouterr()
-    assert output_message == captured.out.strip()
+    statuses, messages = calculate_statuses(pd.DataFrame([mock_row]))
+    assert statuses.iloc[0] is None
+    assert messages.iloc[0] == output_message
 
 
 def test_all_metadata_values_are_list_of_strings(mock_family_row_ds: pd.Series):
-    family_metadata = map_family_metadata(mock_family_row_ds)
+    family_metadata = mapped_family_metadata(mock_family_row_ds)
     assert family_metadata is not None
 
     for value in family_metadata.values():
@@ -309,7 +277,7 @@ def test_maps_result_areas_with_value_greater_than_zero(mock_family_row_ds: pd.S
         },
     ]
 
-    family_metadata = map_family_metadata(mock_family_row_ds)
+    family_metadata = mapped_family_metadata(mock_family_row_ds)
     assert family_metadata is not None
     assert (
         family_metadata["result_area"].sort()
@@ -319,3 +287,24 @@ def test_maps_result_areas_with_value_greater_than_zero(mock_family_row_ds: pd.S
         ].sort()
     )
     assert len(family_metadata["result_area"]) == 2
+
+
+def test_only_reads_the_keys_of_the_nested_entries_that_are_mapped(
+    mock_family_row_ds: pd.Series,
+):
+    # Only the budgets of the GCF and co-financing sources, and the areas of the
+    # result areas with a value above 0, are mapped, so the others needn't have them.
+    mock_family_row_ds["Funding"] = [
+        *mock_family_row_ds["Funding"],
+        {"Source": "Other"},
+    ]
+    mock_family_row_ds["ResultAreas"] = [
+        *mock_family_row_ds["ResultAreas"],
+        {"Type": "The Type for the Result Area", "Value": "0.00%"},
+    ]
+
+    family_metadata = mapped_family_metadata(mock_family_row_ds)
+    assert family_metadata is not None
+    assert family_metadata["project_value_fund_spend"] == ["82000"]
+    assert family_metadata["project_value_co_financing"] == ["620000"]
+    assert family_metadata["result_area"] == ["The Area for the Result Area"]
@@ -2,8 +2,10 @@ import pandas as pd
 import pytest
 
 from gcf_data_mapper.parsers.helpers import (
-    arrays_contain_empty_values,
-    row_contains_columns_with_empty_values,
+    NORMALISED_ATTR,
+    ensure_normalised,
+    normalise_frame,
+    strip_nested,
     verify_required_fields_present,
 )
 
@@ -64,94 +66,42 @@ def test_returns_true_when_no_missing_fields(
     assert return_value is True
 
 
-@pytest.mark.parametrize(
-    ("test_ds,required_columns,expected_return"),
-    [
-        (
-            pd.Series({"Fruit": pd.NA, "Plant": pd.NA, "Tree": "Oak"}),
-            ["Fruit", "Plant"],
-            True,
-        ),
-        (
-            pd.Series({"Fruit": "Apple", "Plant": "Mint", "Tree": "Rosemary"}),
-            ["Fruit", "Plant"],
-            False,
-        ),
-    ],
-)
-def test_checks_if_there_are_columns_with_empty_values_in_a_given_row(
-    test_ds: pd.Series, required_columns: list[str], expected_return: bool
-):
-    result = row_contains_columns_with_empty_values(test_ds, required_columns)
-    assert result == expected_return
+def test_normalise_frame_strips_every_string_once():
+    data = pd.DataFrame(
+        {
+            "ApprovedRef": [" FP001 ", "FP002"],
+            "ProjectsID": [1, 2],
+            "Status": pd.Series([" Completed ", None], dtype="string"),
+            "Type": pd.Series([" Report ", "Report"], dtype="category"),
+            "Mixed": pd.Series([None, float("nan")], dtype=object),
+            "Countries": [
+                [{"CountryName": " Bangladesh ", "ISO3": "BGD"}],
+                {"Region": " Asia "},
+            ],
+        }
+    ).set_axis([3, 3])
 
+    normalised = normalise_frame(data)
 
-@pytest.mark.parametrize(
-    "list_values, project_id, expected_return",
-    [
-        (
-            [
-                ("Fruits", ["Apple", "Mango"]),
-                ("Plants", ["Rosemary", "Mint"]),
-                ("Trees", ["Oak", "Sycamore"]),
-            ],
-            "P001",
-            False,  # Function should return False when no empty values
-        ),
-        (
-            [
-                ("Fruits", ["Apple", "Mango"]),
-                ("Plants", ["", ""]),
-                ("Trees", ["Oak", "Sycamore"]),
-            ],
-            "P002",
-            True,  # Function should return True when there are empty values
-        ),
-        (
-            [
-                ("Fruits", ["Apple", "Mango"]),
-                ("Plants", ["", ""]),
-                ("Trees", [""]),
-            ],
-            "P003",
-            True,
-        ),
-    ],
-)
-def test_check_arrays_for_empty_values(
-    list_values: list, project_id: str, expected_return: bool
-):
-    result = arrays_contain_empty_values(list_values, project_id)
-    assert result == expected_return
-    assert type(result) is bool
+    assert normalised.attrs[NORMALISED_ATTR] is True
+    assert NORMALISED_ATTR not in data.attrs
+    assert normalised.index.equals(data.index)
+    assert normalised.dtypes.astype(str).equals(data.dtypes.astype(str))
+    for column in ["ApprovedRef", "ProjectsID", "Status", "Type", "Countries"]:
+        assert normalised[column].tolist() == [
+            strip_nested(value) for value in data[column].tolist()
+        ]
+    # None and NaN are left as they were.
+    assert normalised["Mixed"].iat[0] is None
+    assert pd.isna(normalised["Mixed"].iat[1])
+    assert data["ApprovedRef"].tolist() == [" FP001 ", "FP002"]
 
 
-@pytest.mark.parametrize(
-    "list_values, project_id, expected_output",
-    [
-        (
-            [
-                ("Fruits", ["Apple", "Mango"]),
-                ("Plants", ["Rosemary", "Mint"]),
-                ("Trees", ["Oak", "Sycamore"]),
-            ],
-            "P001",
-            "",  # If the array does not contain any empty values we don't expect an output
-        ),
-        (
-            [
-                ("Fruits", ["Apple", "Mango"]),
-                ("Plants", ["", ""]),
-                ("Trees", ["Oak", "Sycamore"]),
-            ],
-            "P002",
-            "🛑 The following lists contain empty values: Plants. Projects ID P002",
-        ),
-    ],
-)
-def test_check_arrays_for_empty_values_outputs_msg_to_the_cli(
-    list_values: list, project_id: str, expected_output: str, capsys
-):
-    arrays_contain_empty_values(list_values, project_id)
-    captured = capsys.readouterr()
-    assert expected_output == captured.out.strip()
+def test_ensure_normalised_only_normalises_once():
+    data = pd.DataFrame({"ApprovedRef": [" FP001 "]})
+
+    normalised = ensure_normalised(data)
+
+    assert normalised["ApprovedRef"].tolist() == ["FP001"]
+    assert ensure_normalised(normalised) is normalised
+    assert ensure_normalised(normalised.iloc[[0]]).attrs[NORMALISED_ATTR] is True
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from gcf_data_mapper.enums.rejection import RejectionRules
+from gcf_data_mapper.parsers.document import DOCUMENT_RULES
+from gcf_data_mapper.parsers.validation import (
+    ValidationRule,
+    blank_values,
+    failed_columns,
+    missing_values,
+    validate_frame,
+)
+
+RULES = [
+    ValidationRule(RejectionRules.MISSING_PROJECT_ID, ["ProjectsID"], blank_values),
+    ValidationRule(
+        RejectionRules.EMPTY_COLUMN_VALUES, ["ProjectsID", "Theme"], missing_values
+    ),
+]
+
+
+def test_validate_frame_reports_the_first_rule_each_row_breaks():
+    data = pd.DataFrame(
+        {"ProjectsID": ["1", "", None, "4"], "Theme": [None, None, "A", "B"]}
+    )
+
+    validation = validate_frame(data, RULES)
+
+    assert validation["valid"].tolist() == [False, False, False, True]
+    assert validation["broken_rules"].tolist() == [
+        RejectionRules.EMPTY_COLUMN_VALUES,
+        RejectionRules.MISSING_PROJECT_ID,
+        RejectionRules.EMPTY_COLUMN_VALUES,
+        None,
+    ]
+    assert validation["counts"] == {
+        RejectionRules.MISSING_PROJECT_ID: 1,
+        RejectionRules.EMPTY_COLUMN_VALUES: 2,
+    }
+
+
+def test_failed_columns_lists_the_columns_breaking_the_rule():
+    data = pd.DataFrame({"ProjectsID": ["", None, "3"], "Theme": [None, None, "A"]})
+
+    validation = validate_frame(data, RULES)
+
+    assert failed_columns(validation, 0) == ["ProjectsID"]
+    assert failed_columns(validation, 0, RejectionRules.EMPTY_COLUMN_VALUES) == [
+        "Theme"
+    ]
+    assert failed_columns(validation, 1) == ["ProjectsID", "Theme"]
+    assert failed_columns(validation, 2) == []
+
+
+def test_validate_frame_handles_an_empty_frame():
+    validation = validate_frame(pd.DataFrame({"ProjectsID": [], "Theme": []}), RULES)
+
+    assert validation["valid"].tolist() == []
+    assert validation["counts"] == {
+        RejectionRules.MISSING_PROJECT_ID: 0,
+        RejectionRules.EMPTY_COLUMN_VALUES: 0,
+    }
+
+
+def test_document_rules_check_the_columns_and_file_extensions():
+    data = pd.DataFrame(
+        {
+            "ApprovedRef": ["FP001", None, "FP003", "FP004"],
+            "ProjectsID": [1, 2, 3, 4],
+            "Title": ["A", "B", None, "D"],
+            "Type": ["Funding proposal"] * 4,
+            "ID (Unique ID from our CMS for the document)": [1, 2, 3, 4],
+            "Main file (English)": [
+                "https://www.gcf.org/1.PDF",
+                "https://www.gcf.org/2.pdf",
+                "https://www.gcf.org/3.pdf",
+                "https://www.gcf.org/4.txt",
+            ],
+        }
+    ).convert_dtypes()
+
+    validation = validate_frame(data, DOCUMENT_RULES)
+
+    assert np.array_equal(validation["valid"], [True, False, False, False])
+    assert validation["broken_rules"].tolist() == [
+        None,
+        RejectionRules.MISSING_FAMILY_COLUMNS,
+        RejectionRules.MISSING_DOCUMENT_COLUMNS,
+        RejectionRules.UNSUPPORTED_FILE_EXTENSION,
+    ]
+    assert failed_columns(validation, 2) == ["Title"]
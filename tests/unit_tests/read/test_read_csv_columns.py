@@ -0,0 +1,113 @@
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.parsers.document import document
+from gcf_data_mapper.read import (
+    MCF_DOCUMENT_COLUMNS,
+    MCF_DOCUMENT_DTYPES,
+    CSVEngines,
+    read_csv_pd,
+)
+
+
+@pytest.fixture
+def docs_csv(tmp_path):
+    file_path = tmp_path / "docs.csv"
+    pd.DataFrame(
+        {
+            "FP number": ["FP001", "FP002", "FP003"],
+            "ID (Unique ID from our CMS for the document)": [1, 2, 3],
+            "Type": ["Approved funding proposal", "Other", "Other"],
+            "Title": ["title1", "title2", "title3"],
+            "Unused": [1.5, 2.5, 3.5],
+        }
+    ).to_csv(file_path, index=False)
+    return file_path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10])
+def test_read_csv_pd_keeps_and_types_the_requested_columns(docs_csv, chunk_size):
+    df = read_csv_pd(
+        docs_csv,
+        chunk_size=chunk_size,
+        columns=MCF_DOCUMENT_COLUMNS,
+        dtypes=MCF_DOCUMENT_DTYPES,
+    )
+    assert list(df.columns) == [
+        "FP number",
+        "ID (Unique ID from our CMS for the document)",
+        "Type",
+        "Title",
+    ]
+    assert df["ID (Unique ID from our CMS for the document)"].tolist() == [
+        "1",
+        "2",
+        "3",
+    ]
+    assert df["FP number"].dtype == "string"
+    assert isinstance(df["Type"].dtype, pd.CategoricalDtype)
+
+
+def test_read_csv_pd_without_columns_reads_every_column(docs_csv):
+    df = read_csv_pd(docs_csv)
+    assert "Unused" in df.columns
+    assert df["ID (Unique ID from our CMS for the document)"].dtype == "int64"
+
+
+def test_read_csv_pd_pyarrow_engine_matches_c_engine(docs_csv):
+    pytest.importorskip("pyarrow")
+    options = {"columns": MCF_DOCUMENT_COLUMNS, "dtypes": MCF_DOCUMENT_DTYPES}
+    pd.testing.assert_frame_equal(
+        read_csv_pd(docs_csv, engine=CSVEngines.PYARROW.value, **options),
+        read_csv_pd(docs_csv, **options),
+        check_dtype=False,
+    )
+
+
+def test_read_csv_pd_pyarrow_engine_reads_blank_ids_as_strings(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / "docs.csv"
+    file_path.write_text(
+        "FP number,ID (Unique ID from our CMS for the document),Type,Title\n"
+        "FP001,1,Approved funding proposal,title1\n"
+        "FP002,2,Other,title2\n"
+        "FP003,,Other,title3\n"
+    )
+    options = {"columns": MCF_DOCUMENT_COLUMNS, "dtypes": MCF_DOCUMENT_DTYPES}
+    c_engine = read_csv_pd(file_path, **options)
+    pyarrow_engine = read_csv_pd(file_path, engine=CSVEngines.PYARROW.value, **options)
+
+    ids = pyarrow_engine["ID (Unique ID from our CMS for the document)"]
+    assert ids.tolist()[:2] == ["1", "2"]
+    assert ids.isna().tolist() == [False, False, True]
+    pd.testing.assert_frame_equal(pyarrow_engine, c_engine)
+
+
+def test_documents_read_by_pyarrow_engine_have_the_c_engine_import_ids(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / "docs.csv"
+    file_path.write_text(
+        "FP number,ID (Unique ID from our CMS for the document),Type,Title,"
+        "Translated titles,Document page permalink,Main file (English),"
+        "Translated files\n"
+        "FP001,1,Approved funding proposal,title1,,link1,file1.pdf,\n"
+        "FP001,2,Other,title2,,link2,file2.pdf,\n"
+        "FP001,,Other,title3,,link3,file3.pdf,\n"
+    )
+    projects_data = pd.DataFrame({"ApprovedRef": ["FP001"], "ProjectsID": [10]})
+    options = {"columns": MCF_DOCUMENT_COLUMNS, "dtypes": MCF_DOCUMENT_DTYPES}
+
+    import_ids = {
+        engine: [
+            mapped["import_id"]
+            for mapped in document(
+                projects_data, read_csv_pd(file_path, engine=engine, **options), False
+            )
+        ]
+        for engine in [CSVEngines.C.value, CSVEngines.PYARROW.value]
+    }
+    assert import_ids[CSVEngines.PYARROW.value] == import_ids[CSVEngines.C.value]
+    assert import_ids[CSVEngines.PYARROW.value] == [
+        "GCF.document.FP001_10.1",
+        "GCF.document.FP001_10.2",
+    ]
@@ -0,0 +1,51 @@
+import io
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.read import iter_json_array, read_json_columns_pd, read_json_pd
+from tests.unit_tests.read.conftest import FIXTURES_FOLDER
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[]",
+        "  [ ]  ",
+        '[{"a": 1}]',
+        '\n[\n  {"a": [1, {"b": "c,]"}]},\n  12345,\n  "x" , null\n]\n',
+        json.dumps([{"id": i, "name": "é" * i} for i in range(50)], indent=2),
+    ],
+)
+@pytest.mark.parametrize("read_size", [1, 3, 1024])
+def test_iter_json_array_matches_json_loads(text, read_size):
+    items = list(iter_json_array(io.StringIO(text), read_size=read_size))
+    assert items == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ["", "{}", "[1 2]", '[{"a": 1}', "[1,]"])
+def test_iter_json_array_raises_for_invalid_arrays(text):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO(text), read_size=2))
+
+
+def test_read_json_columns_matches_json_normalize(tmp_path):
+    records = [
+        {"ApprovedRef": "FP001", "ProjectsID": 1, "Countries": [{"ISO3": "BGD"}]},
+        {"ApprovedRef": "FP002", "Countries": [], "StartDate": None, "Other": 1},
+    ]
+    file_path = tmp_path / "projects.json"
+    file_path.write_text(json.dumps(records))
+    columns = ["ApprovedRef", "Countries", "ProjectsID", "StartDate", "Missing"]
+
+    expected = pd.json_normalize(records)[columns[:-1]]
+    pd.testing.assert_frame_equal(
+        read_json_columns_pd(str(file_path), columns), expected
+    )
+
+
+def test_read_json_pd_with_columns_returns_empty_df_when_exception():
+    file_path = os.path.join(FIXTURES_FOLDER, "malformed_data.json")
+    assert read_json_pd(file_path, ["location"]).empty is True
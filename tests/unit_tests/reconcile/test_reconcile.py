@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.reconcile import (
+    MISMATCH_ECHO_LIMIT,
+    build_reference_index,
+    echo_reconciliation,
+    merge_projects,
+    reconciliation_report,
+)
+
+
+def test_reconciliation_report():
+    index = build_reference_index(
+        pd.Series(["FP001", " FP002 ", "FP003", "FP003"]),
+        pd.Series(["FP002", "FP001", "FP003", "FP004"], dtype="string"),
+        pd.Series(["FP001", "FP005", "FP004"]),
+    )
+
+    assert reconciliation_report(index) == {
+        "gcf_projects": 4,
+        "mcf_projects": 4,
+        "only_in_gcf": [],
+        "only_in_mcf": ["FP004"],
+        "duplicated_in_gcf": ["FP003"],
+        "duplicated_in_mcf": [],
+        "cardinality": "many-to-one",
+        "documents": 3,
+        "documents_without_project": ["FP004", "FP005"],
+    }
+
+
+def test_echo_reconciliation_limits_the_references_printed():
+    refs = pd.Series([f"FP{i:03}" for i in range(MISMATCH_ECHO_LIMIT + 5)])
+    report = reconciliation_report(build_reference_index(refs, refs[:1]))
+
+    with patch("click.echo") as mock_echo:
+        assert echo_reconciliation(report) is True
+
+    calls = [call.args[0] for call in mock_echo.call_args_list]
+    assert calls[0] == (
+        f"ℹ️  {MISMATCH_ECHO_LIMIT + 4} reference(s) in GCF but MISSING in MCF:"
+    )
+    assert len(calls) == MISMATCH_ECHO_LIMIT + 2
+    assert calls[-1] == "  → … and 4 more"
+
+
+@pytest.mark.parametrize(
+    "gcf_refs, mcf_refs, mcf_extra",
+    [
+        (["FP001", "FP002", "FP003"], ["FP003", "FP001", "FP002"], {}),
+        (["FP001", "FP002", "FP001"], ["FP002", "FP001", "FP001"], {}),
+        (["FP001", "FP002 ", "FP003"], ["FP003", "FP001", "FP002"], {}),
+        (
+            ["FP001", "FP002", "FP003"],
+            ["FP003", "FP001", "FP002"],
+            {"Title": ["a", "b", "c"]},
+        ),
+    ],
+)
+def test_merge_projects_matches_pd_merge(gcf_refs, mcf_refs, mcf_extra):
+    gcf_projects = pd.DataFrame(
+        {"ApprovedRef": gcf_refs, "ProjectsID": [1, 2, 3], "Title": ["a", "b", "c"]}
+    )
+    mcf_projects = pd.DataFrame(
+        {
+            "ApprovedRef": pd.Series(mcf_refs, dtype="string"),
+            "Board meeting": ["B.1", "B.2", "B.3"],
+            **mcf_extra,
+        }
+    )
+    index = build_reference_index(
+        gcf_projects["ApprovedRef"], mcf_projects["ApprovedRef"]
+    )
+
+    pd.testing.assert_frame_equal(
+        merge_projects(gcf_projects, mcf_projects, index),
+        pd.merge(left=gcf_projects, right=mcf_projects),
+    )
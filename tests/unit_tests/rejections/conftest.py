@@ -0,0 +1,25 @@
+import pytest
+
+
+@pytest.fixture()
+def mock_valid_family_row():
+    return {
+        "ProjectsID": 1,
+        "ApprovedRef": "FP001",
+        "ProjectName": "Project 1",
+        "Theme": "Adaptation",
+        "Sector": "Environment",
+        "ProjectURL": "https://www.climateaction.fund/project/FP001",
+        "Summary": "The Summary of the Project",
+        "Countries": [{"CountryName": "Bangladesh", "ISO3": "BGD", "Region": "Asia"}],
+        "Entities": [{"Name": "Green Innovations"}],
+        "Funding": [{"Source": "GCF", "BudgetUSDeq": 9200000}],
+        "ResultAreas": [
+            {"Area": "Coastal protection", "Type": "Adaptation", "Value": "100%"}
+        ],
+        "ApprovalDate": "2016-06-30T00:00:00.000Z",
+        "StartDate": "2017-06-28T00:00:00.000Z",
+        "DateCompletion": None,
+        "DateImplementationStart": "2017-01-01T00:00:00.000Z",
+        "Status": None,
+    }
@@ -0,0 +1,197 @@
+import csv
+import json
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from gcf_data_mapper.enums.rejection import RejectionRules
+from gcf_data_mapper.parsers.family import map_labelled_families
+from gcf_data_mapper.rejections import (
+    REJECTION_FIELDS,
+    collecting_rejections,
+    echo_rejection_counts,
+    holding_rejections,
+    reject,
+    report_rejections,
+    sort_rejections,
+    start_rejections,
+    stop_rejections,
+    take_rejections,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_rejections():
+    stop_rejections()
+    yield
+    stop_rejections()
+
+
+def test_reject_echoes_the_message_when_not_collecting(capsys):
+    reject("documents", RejectionRules.NO_EVENT_DATES, "🛑 Skipping", {"id": 1})
+
+    assert capsys.readouterr().out == "🛑 Skipping\n"
+    assert not collecting_rejections()
+    assert take_rejections() == []
+
+
+def test_reject_keeps_the_rejections_in_memory(capsys):
+    start_rejections()
+    reject(
+        "documents",
+        RejectionRules.UNSUPPORTED_FILE_EXTENSION,
+        "🛑 Skipping",
+        {"document_id": 1},
+        {"source_url": "https://www.gcf.org/1.txt"},
+    )
+
+    assert capsys.readouterr().out == ""
+    assert take_rejections() == [
+        {
+            "entity_type": "documents",
+            "rule": "unsupported_file_extension",
+            "ids": {"document_id": 1},
+            "values": {"source_url": "https://www.gcf.org/1.txt"},
+            "row": None,
+            "message": "🛑 Skipping",
+        }
+    ]
+    assert take_rejections() == []
+    assert stop_rejections() == Counter(
+        {("documents", "unsupported_file_extension"): 1}
+    )
+
+
+def test_reject_writes_ndjson(tmp_path):
+    rejections_file = tmp_path / "rejections.ndjson"
+    start_rejections(str(rejections_file))
+    reject("events", RejectionRules.NO_EVENT_DATES, "", {"approved_ref": "FP001"})
+    reject("events", RejectionRules.NO_EVENT_DATES, "", {"approved_ref": "FP002"})
+    counts = stop_rejections()
+
+    lines = rejections_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["ids"] for line in lines] == [
+        {"approved_ref": "FP001"},
+        {"approved_ref": "FP002"},
+    ]
+    assert counts == Counter({("events", "no_event_dates"): 2})
+
+
+def test_reject_writes_csv(tmp_path):
+    rejections_file = tmp_path / "rejections.csv"
+    start_rejections(str(rejections_file))
+    reject(
+        "families",
+        RejectionRules.EMPTY_NESTED_LISTS,
+        "",
+        {"projects_id": "1"},
+        {"empty_lists": ["Entities"]},
+    )
+    stop_rejections()
+
+    with open(rejections_file, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [
+        {
+            "entity_type": "families",
+            "rule": "empty_nested_lists",
+            "ids": '{"projects_id": "1"}',
+            "values": '{"empty_lists": ["Entities"]}',
+        }
+    ]
+
+
+def test_held_rejections_are_only_reported_once_sorted(tmp_path, capsys):
+    rejections_file = tmp_path / "rejections.ndjson"
+    start_rejections(str(rejections_file))
+    with holding_rejections() as held:
+        reject("documents", RejectionRules.NO_EVENT_DATES, "", {"id": 1}, row=0)
+        reject("events", RejectionRules.NO_EVENT_DATES, "", {"id": 2}, row=5)
+        reject("families", RejectionRules.NO_EVENT_DATES, "", {"id": 3}, row=1)
+        reject("events", RejectionRules.NO_EVENT_DATES, "", {"id": 4}, row=2)
+    assert len(held) == 4
+    assert collecting_rejections()
+
+    report_rejections(sort_rejections(held))
+    counts = stop_rejections()
+
+    lines = rejections_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {
+            "entity_type": entity_type,
+            "rule": "no_event_dates",
+            "ids": {"id": id},
+            "values": {},
+        }
+        for entity_type, id in [
+            ("families", 3),
+            ("events", 4),
+            ("events", 2),
+            ("documents", 1),
+        ]
+    ]
+    assert sum(counts.values()) == 4
+    assert capsys.readouterr().out == ""
+
+
+def test_held_rejections_are_echoed_when_not_collecting(capsys):
+    with holding_rejections() as held:
+        reject("events", RejectionRules.NO_EVENT_DATES, "🛑 Skipping", {}, row=0)
+    assert capsys.readouterr().out == ""
+
+    report_rejections(held)
+    assert capsys.readouterr().out == "🛑 Skipping\n"
+
+
+def test_echo_rejection_counts(capsys):
+    echo_rejection_counts(
+        Counter(
+            {
+                ("families", "empty_column_values"): 2,
+                ("documents", "invalid_translated_urls"): 1,
+            }
+        ),
+        "rejections.ndjson",
+    )
+
+    assert capsys.readouterr().out == (
+        "🛑 Rejected 3 row(s), see rejections.ndjson:\n"
+        "  → documents invalid_translated_urls: 1\n"
+        "  → families empty_column_values: 2\n"
+    )
+
+
+def test_map_labelled_families_records_the_offending_values(
+    mock_valid_family_row, capsys
+):
+    projects = pd.DataFrame([mock_valid_family_row] * 3)
+    projects.loc[1, "Status"] = "Approved"
+    projects.loc[2, "Status"] = "Approved"
+    projects.at[2, "Entities"] = []
+
+    start_rejections()
+    mapped_families = map_labelled_families(projects, debug=False)
+    rejections = take_rejections()
+
+    assert capsys.readouterr().out == ""
+    assert [label for label, _ in mapped_families] == [1]
+    assert [
+        {field: rejection[field] for field in [*REJECTION_FIELDS, "row"]}
+        for rejection in rejections
+    ] == [
+        {
+            "entity_type": "families",
+            "rule": "empty_column_values",
+            "ids": {"approved_ref": "FP001", "projects_id": "1"},
+            "values": {"empty_columns": ["Status"]},
+            "row": 0,
+        },
+        {
+            "entity_type": "families",
+            "rule": "empty_nested_lists",
+            "ids": {"approved_ref": "FP001", "projects_id": "1"},
+            "values": {"empty_lists": ["Implementing Agencies"]},
+            "row": 2,
+        },
+    ]
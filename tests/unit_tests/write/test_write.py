@@ -0,0 +1,214 @@
+import gzip
+import io
+import json
+import os
+
+import pytest
+
+from gcf_data_mapper.enums.write import Compressions, OutputFormats
+from gcf_data_mapper.write import (
+    WRITERS,
+    dump_json,
+    dump_ndjson,
+    dump_parquet,
+    entity_file,
+    output_compression,
+    partial_file,
+    write_compact_json,
+    write_json,
+)
+
+
+@pytest.mark.parametrize(
+    "mapped_data",
+    [
+        {},
+        {"collections": [], "families": [], "documents": [], "events": []},
+        {
+            "collections": [],
+            "families": [
+                {
+                    "import_id": "GCF.family.FP003.12660",
+                    "geographies": ["BGD"],
+                    "metadata": {"region": ["Asia"], "external_id": []},
+                    "summary": "Résumé with a\nnew line",
+                },
+                {"import_id": "GCF.family.FP004.1", "metadata": {}},
+            ],
+            "documents": [None],
+            "events": [{"date": "2023-01-01", "value": 1.5}],
+        },
+    ],
+)
+def test_write_json_matches_json_dump(mapped_data):
+    streamed = io.StringIO()
+    counts = write_json(
+        {entity: iter(items) for entity, items in mapped_data.items()}, streamed
+    )
+
+    assert streamed.getvalue() == json.dumps(mapped_data, ensure_ascii=False, indent=2)
+    assert counts == {entity: len(items) for entity, items in mapped_data.items()}
+
+
+@pytest.fixture
+def mapped_entities():
+    return {
+        "collections": [],
+        "families": [
+            {
+                "import_id": "GCF.family.FP003.12660",
+                "geographies": ["BGD"],
+                "metadata": {"region": ["Asia"], "external_id": []},
+                "summary": "Résumé with a\nnew line",
+            },
+            {
+                "import_id": "GCF.family.FP004.1",
+                "geographies": [],
+                "metadata": {"region": ["Africa", "Asia"], "external_id": ["FP004"]},
+                "summary": "",
+            },
+        ],
+        "events": [{"date": "2023-01-01", "value": 1.5}],
+    }
+
+
+def test_write_compact_json_matches_json_dumps(mapped_entities):
+    streamed = io.StringIO()
+    counts = write_compact_json(
+        {entity: iter(items) for entity, items in mapped_entities.items()}, streamed
+    )
+
+    assert streamed.getvalue() == json.dumps(
+        mapped_entities, ensure_ascii=False, separators=(",", ":")
+    )
+    assert counts == {entity: len(items) for entity, items in mapped_entities.items()}
+
+
+def test_entity_file_replaces_the_extension():
+    assert entity_file(os.path.join("out", "output.json"), "families", ".ndjson") == (
+        os.path.join("out", "output.families.ndjson")
+    )
+
+
+@pytest.mark.parametrize("output_format", [e.value for e in OutputFormats])
+def test_writers_cover_every_output_format(output_format):
+    assert output_format in WRITERS
+
+
+def test_dump_ndjson_writes_one_line_per_entity(tmp_path, mapped_entities):
+    output_file = str(tmp_path / "output.json")
+    counts = dump_ndjson(
+        {entity: iter(items) for entity, items in mapped_entities.items()}, output_file
+    )
+
+    assert counts == {entity: len(items) for entity, items in mapped_entities.items()}
+    for entity, items in mapped_entities.items():
+        with open(entity_file(output_file, entity, ".ndjson"), encoding="utf-8") as f:
+            assert [json.loads(line) for line in f] == items
+
+
+def test_dump_parquet_keeps_the_nested_metadata(tmp_path, mapped_entities):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output_file = str(tmp_path / "output.json")
+    counts = dump_parquet(
+        {entity: iter(items) for entity, items in mapped_entities.items()}, output_file
+    )
+
+    assert counts == {entity: len(items) for entity, items in mapped_entities.items()}
+    for entity, items in mapped_entities.items():
+        table = pq.read_table(entity_file(output_file, entity, ".parquet"))
+        assert table.to_pylist() == items
+
+
+@pytest.mark.parametrize(
+    "output_file, expected",
+    [
+        ("output.json", ("output.json", None)),
+        ("output.json.gz", ("output.json", Compressions.GZIP)),
+        ("output.JSON.GZ", ("output.JSON", Compressions.GZIP)),
+        ("output.json.zst", ("output.json", Compressions.ZSTD)),
+    ],
+)
+def test_output_compression(output_file, expected):
+    assert output_compression(output_file) == expected
+
+
+def test_entity_file_keeps_the_compression_suffix():
+    assert entity_file("output.json.gz", "families", ".ndjson") == (
+        "output.families.ndjson.gz"
+    )
+
+
+def test_dump_json_gzip_decompresses_to_the_plain_output(tmp_path, mapped_entities):
+    plain_file, gzip_file = tmp_path / "output.json", tmp_path / "output.json.gz"
+    dump_json(mapped_entities, str(plain_file))
+    counts = dump_json(
+        {entity: iter(items) for entity, items in mapped_entities.items()},
+        str(gzip_file),
+    )
+
+    assert counts == {entity: len(items) for entity, items in mapped_entities.items()}
+    assert gzip.decompress(gzip_file.read_bytes()) == plain_file.read_bytes()
+
+
+def test_dump_json_gzip_is_reproducible(tmp_path, mapped_entities):
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+    first = tmp_path / "first" / "output.json.gz"
+    second = tmp_path / "second" / "output.json.gz"
+    dump_json(mapped_entities, str(first), compression_level=1)
+    dump_json(mapped_entities, str(second), compression_level=1)
+
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_dump_json_zstd_decompresses_to_the_plain_output(tmp_path, mapped_entities):
+    zstandard = pytest.importorskip("zstandard")
+    plain_file, zstd_file = tmp_path / "output.json", tmp_path / "output.json.zst"
+    dump_json(mapped_entities, str(plain_file))
+    dump_json(mapped_entities, str(zstd_file), compression_level=19)
+
+    with zstandard.open(zstd_file, "rb") as f:
+        assert f.read() == plain_file.read_bytes()
+
+
+def test_dump_ndjson_gzip_compresses_each_file(tmp_path, mapped_entities):
+    output_file = str(tmp_path / "output.json.gz")
+    dump_ndjson(mapped_entities, output_file)
+
+    for entity, items in mapped_entities.items():
+        with gzip.open(
+            entity_file(output_file, entity, ".ndjson"), "rt", encoding="utf-8"
+        ) as f:
+            assert [json.loads(line) for line in f] == items
+
+
+def failing_items(items):
+    yield from items
+    raise ValueError("Mapping failed")
+
+
+@pytest.mark.parametrize("writer", [dump_json, dump_ndjson])
+def test_failed_dump_leaves_the_previous_output(tmp_path, mapped_entities, writer):
+    output_file = str(tmp_path / "output.json")
+    writer(
+        {entity: iter(items) for entity, items in mapped_entities.items()}, output_file
+    )
+    previous = {path.name: path.read_bytes() for path in tmp_path.iterdir()}
+
+    with pytest.raises(ValueError, match="Mapping failed"):
+        writer(
+            {
+                entity: failing_items(items) if entity == "events" else iter(items)
+                for entity, items in mapped_entities.items()
+            },
+            output_file,
+        )
+
+    assert {path.name: path.read_bytes() for path in tmp_path.iterdir()} == previous
+
+
+def test_partial_file_keeps_the_compression_suffix():
+    assert partial_file(os.path.join("data", "output.json.gz")) == os.path.join(
+        "data", ".partial.output.json.gz"
+    )